@@ -2,6 +2,8 @@ import pygame
 import sys
 import math
 from arc.core.config import config
+from arc.core.profiler import FrameProfiler
+from arc.core.runloop import RunLoop
 
 pygame.init()
 
@@ -166,18 +168,21 @@ def main():
     current = ''
     result = ''
     pressed_button = None
-    clock = pygame.time.Clock()
+    loop = RunLoop(fps=30)
+    profiler = FrameProfiler('calculator')
 
     while True:
-        screen.fill(COLORS["background"])
-        draw_display(current, result)
-        draw_buttons(pressed_button)
-
-        for event in pygame.event.get():
+        # Nothing animates here, so sleep until input arrives
+        events = loop.wait()
+        profiler.begin_frame()
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
+            elif profiler.handle_event(event):
+                continue
+
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 hit = button_from_pos(*event.pos)
                 if hit:
@@ -200,9 +205,20 @@ def main():
                     pressed_button = btn_pos
             elif event.type == pygame.KEYUP:
                 pressed_button = None
+        profiler.mark('event')
+        if not (events or loop.dirty):
+            continue
+
+        screen.fill(COLORS["background"])
+        draw_display(current, result)
+        draw_buttons(pressed_button)
+        profiler.draw_overlay(screen)
+        profiler.mark('draw')
 
         pygame.display.flip()
-        clock.tick(30)
+        profiler.mark('flip')
+        profiler.end_frame()
+        loop.frame_done()
 
 if __name__ == "__main__":
     main()
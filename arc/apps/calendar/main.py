@@ -8,6 +8,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 from arc.core import config
 from arc.core.ui_elements import *
+from arc.core.runloop import RunLoop
 
 # --- Config helpers ---
 def c(name, default=(240,240,240)):
@@ -32,7 +33,7 @@ class CalendarApp:
         self.WIDTH, self.HEIGHT = s("width", 480), s("height", 320)
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.FULLSCREEN)
         pygame.display.set_caption('Calendar App')
-        self.clock = pygame.time.Clock()
+        self.loop = RunLoop(fps=30)
         self.FPS = fps()
         # Fonts
         self.title_font = fnt(24)
@@ -106,26 +107,26 @@ class CalendarApp:
         else:
             self.month += 1
 
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.loop.stop()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_LEFT:
+                self.prev_month()
+            elif event.key == pygame.K_RIGHT:
+                self.next_month()
+            elif event.key == pygame.K_ESCAPE:
+                self.loop.stop()
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if self.LEFT_ARROW_RECT.collidepoint(event.pos):
+                self.prev_month()
+            elif self.RIGHT_ARROW_RECT.collidepoint(event.pos):
+                self.next_month()
+
     def run(self):
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_LEFT:
-                        self.prev_month()
-                    elif event.key == pygame.K_RIGHT:
-                        self.next_month()
-                    elif event.key == pygame.K_ESCAPE:
-                        running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.LEFT_ARROW_RECT.collidepoint(event.pos):
-                        self.prev_month()
-                    elif self.RIGHT_ARROW_RECT.collidepoint(event.pos):
-                        self.next_month()
-            self.draw()
-            self.clock.tick(30)
+        # Redraw once a minute so the today marker moves at midnight
+        self.loop.call_every(60, self.loop.invalidate)
+        self.loop.run(self.handle_event, self.draw)
         pygame.quit()
         sys.exit()
 
@@ -734,7 +734,10 @@ async def launch_arc_app(app_name: str):
         if not app_path.exists():
             raise HTTPException(status_code=404, detail=f"App '{app_name}' not found")
         
-        # Launch the app
+        # Launch the app, forking from the zygote when one is running
+        from arc.core import zygote
+        if zygote.spawn(f"arc.apps.{app_name}.main", cwd=str(BASE_DIR)) is not None:
+            return {"success": True, "message": f"Launched {app_name}"}
         venv_python = BASE_DIR / "venv" / "bin" / "python"
         subprocess.Popen(
             [str(venv_python), "-m", f"arc.apps.{app_name}.main"],
@@ -5,6 +5,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 from arc.core.config import config
 from arc.core.ui_elements import Button, WarningMessage, TabManager
+from arc.core.runloop import RunLoop
 
 class IRMenu:
     ITEMS_PER_TAB = 3
@@ -109,15 +110,20 @@ def main():
     fps = getattr(config, 'fps', 30)
     screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
     pygame.display.set_caption("IR Tools Menu")
-    clock = pygame.time.Clock()
     menu = IRMenu()
-    while True:
-        for event in pygame.event.get():
-            menu.handle_event(event)
+    loop = RunLoop(fps=30)
+
+    def update():
         menu.update()
+        if menu.warning.visible:
+            # Wake again to hide the warning once it times out
+            loop.animate(0.1)
+
+    def draw():
         menu.draw(screen)
         pygame.display.flip()
-        clock.tick(30)
+
+    loop.run(menu.handle_event, draw, update)
 
 if __name__ == '__main__':
     main()
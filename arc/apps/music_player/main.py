@@ -6,6 +6,8 @@ import platform
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 from arc.core.config import config
+from arc.core.profiler import FrameProfiler
+from arc.core.log import get_logger
 from arc.apps.music_player.menu import MainMenu
 from arc.apps.music_player.song_selector import SongSelector, scan_music_dir
 from arc.apps.music_player.album_selector import AlbumSelector
@@ -18,7 +20,7 @@ def main():
         # Set SDL audio driver to ALSA for better Raspberry Pi compatibility
         if 'SDL_AUDIODRIVER' not in os.environ:
             os.environ['SDL_AUDIODRIVER'] = 'alsa'
-        print(f"Audio driver: {os.environ.get('SDL_AUDIODRIVER', 'default')}")
+        get_logger('music_player').debug("Audio driver: %s", os.environ['SDL_AUDIODRIVER'])
     
     # ---- Init Pygame and Config ----
     pygame.init()
@@ -60,13 +62,17 @@ def main():
 
     player = None
     album_songs_selector = None
+    profiler = FrameProfiler('music_player')
 
     # ---- Main Loop ----
     while True:
+        profiler.begin_frame()
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+            if profiler.handle_event(ev):
+                continue
             if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
                 if state == "MENU":
                     pygame.quit()
@@ -115,6 +121,8 @@ def main():
                     state = 'MENU'
                 player.update()
 
+        profiler.mark('event')
+
         # Update Logic
         if state == 'SONGS':
             songs.update()
@@ -125,6 +133,8 @@ def main():
         elif state == 'PLAYER' and player:
             player.update()
 
+        profiler.mark('update')
+
         # Draw
         screen.fill(colors[0])
         if state == 'MENU':
@@ -139,8 +149,12 @@ def main():
             artist_sel.draw()
         elif state == 'PLAYER' and player:
             player.draw()
+        profiler.draw_overlay(screen)
+        profiler.mark('draw')
 
         pygame.display.flip()
+        profiler.mark('flip')
+        profiler.end_frame()
         clock.tick(20)
 
 if __name__ == '__main__':
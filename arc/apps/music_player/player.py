@@ -1,6 +1,8 @@
 import pygame
 import io
 from arc.core.config import config
+from arc.core.icon_atlas import load_icon
+from arc.core.log import get_logger
 import time
 import sys
 import os
@@ -8,6 +10,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from mutagen.id3 import ID3
 from mutagen import File
 
+log = get_logger('music_player')
+
 class PlayerScreen:
     ICON_SIZE = 36
     SCROLL_SPEED = 50
@@ -26,15 +30,13 @@ class PlayerScreen:
             try:
                 # Try with specific frequency/buffer settings for better compatibility
                 pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
-                print(f"Pygame mixer initialized: {pygame.mixer.get_init()}")
+                log.debug("Pygame mixer initialized: %s", pygame.mixer.get_init())
             except Exception as e:
-                print(f"Failed to initialize pygame mixer: {e}")
-                print("Trying with default settings...")
+                log.warning("Failed to initialize pygame mixer (%s), trying default settings", e)
                 try:
                     pygame.mixer.init()
                 except Exception as e2:
-                    print(f"Mixer initialization failed completely: {e2}")
-                    print("Audio playback will not work!")
+                    log.error("Mixer initialization failed, audio playback will not work: %s", e2)
 
         # Load control icons
         BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -60,14 +62,11 @@ class PlayerScreen:
         self.load_track(current_idx)
 
     def load_icon(self, path):
-        try:
-            return pygame.transform.smoothscale(
-                pygame.image.load(path), (self.ICON_SIZE, self.ICON_SIZE)
-            ).convert_alpha()
-        except Exception:
-            surf = pygame.Surface((self.ICON_SIZE, self.ICON_SIZE), pygame.SRCALPHA)
-            surf.fill((255, 0, 0, 160))
-            return surf
+        icon = load_icon(path, (self.ICON_SIZE, self.ICON_SIZE))
+        if icon is None:
+            icon = pygame.Surface((self.ICON_SIZE, self.ICON_SIZE), pygame.SRCALPHA)
+            icon.fill((255, 0, 0, 160))
+        return icon
 
     def update(self):
         self.update_scroll()
@@ -77,11 +76,9 @@ class PlayerScreen:
         track_info = self.tracks[idx]
         path = track_info['file']
         
-        print(f"\n=== Loading track {idx} ===")
-        print(f"File: {path}")
-        print(f"Title: {track_info.get('title', 'Unknown')}")
-        print(f"Length: {track_info.get('length', 0)} seconds")
-        
+        log.debug("Loading track %d: %s (%r, %s s)", idx, path,
+                  track_info.get('title', 'Unknown'), track_info.get('length', 0))
+
         try:
             # Stop any currently playing music
             if pygame.mixer.music.get_busy():
@@ -91,12 +88,8 @@ class PlayerScreen:
             pygame.mixer.music.load(path)
             pygame.mixer.music.play()
             self.playing = True
-            print(f"✓ Successfully loaded and playing: {track_info.get('title', path)}")
-        except Exception as e:
-            print(f"✗ Error loading track {path}: {e}")
-            print(f"  Exception type: {type(e).__name__}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Error loading track %s", path)
             self.playing = False
 
         self.title_offset = 0.0
@@ -122,7 +115,7 @@ class PlayerScreen:
                             self.art = img
                             break
                         except Exception as e:
-                            print(f"Failed to load album art from APIC: {e}")
+                            log.debug("Failed to load album art from APIC: %s", e)
                 
                 # Get artist
                 if hasattr(audio_file.tags, 'get'):
@@ -137,14 +130,13 @@ class PlayerScreen:
                     for tag in id3.getall("APIC"):
                         img = pygame.image.load(io.BytesIO(tag.data))
                         self.art = img
-                        print(f"Album art loaded successfully from {path}")
                         break
                     if not self.artist and 'TPE1' in id3:
                         self.artist = id3['TPE1'].text[0]
                 except Exception as e:
-                    print(f"No album art found or failed to load: {e}")
+                    log.debug("No album art in %s: %s", path, e)
         except Exception as e:
-            print(f"Error extracting metadata: {e}")
+            log.warning("Error extracting metadata from %s: %s", path, e)
 
         # Pre-render album art with rounded corners, only if art exists
         BORDER_RADIUS = 8
@@ -157,7 +149,7 @@ class PlayerScreen:
                 img_scaled.blit(mask, (0,0), special_flags=pygame.BLEND_RGBA_MIN)
                 self.album_art_ready = img_scaled
             except Exception as e:
-                print(f"Failed to render rounded album art: {e}")
+                log.warning("Failed to render rounded album art: %s", e)
                 self.album_art_ready = None
 
     def prev_track(self):
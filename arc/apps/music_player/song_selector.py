@@ -5,15 +5,19 @@ import pygame
 from mutagen.mp3 import MP3
 from mutagen.easyid3 import EasyID3
 from arc.core.ui_elements import ScrollableList
+from arc.core.text_cache import render_text
+from arc.core.log import get_logger
+
+log = get_logger('music_player')
 
 def scan_music_dir(music_dir):
     """Scans a directory for MP3s, returning a list of dicts with all tags."""
     tracks = []
-    print(f"\n=== Scanning music directory: {music_dir} ===")
-    
+    log.debug("Scanning music directory: %s", music_dir)
+
     # Check if directory exists
     if not os.path.exists(music_dir):
-        print(f"✗ Music directory does not exist: {music_dir}")
+        log.warning("Music directory does not exist: %s", music_dir)
         return tracks
     
     for fn in sorted(os.listdir(music_dir)):
@@ -25,9 +29,9 @@ def scan_music_dir(music_dir):
                 title = audio.get('title', [os.path.splitext(fn)[0]])[0]
                 album = audio.get('album', ['Unknown'])[0]
                 artist = audio.get('artist', ['Unknown'])[0]
-                print(f"✓ {fn}: {title} - {duration:.1f}s")
+                log.debug("%s: %s - %.1fs", fn, title, duration)
             except Exception as e:
-                print(f"✗ Failed to read tags from {fn}: {e}")
+                log.warning("Failed to read tags from %s: %s", fn, e)
                 duration = 0
                 title = os.path.splitext(fn)[0]
                 album = 'Unknown'
@@ -40,7 +44,7 @@ def scan_music_dir(music_dir):
                 'artist': artist
             })
     
-    print(f"Found {len(tracks)} tracks total\n")
+    log.debug("Found %d tracks", len(tracks))
     return tracks
 
 class SongSelector:
@@ -109,10 +113,9 @@ class SongSelector:
         old_clip = surf.get_clip()
         surf.set_clip(self.rect)
 
-        for i, track in enumerate(self.tracks):
+        for i in self.list.visible_range():
+            track = self.tracks[i]
             y = y0 + i * self.line_height - self.list.offset_y
-            if y + self.line_height < y0 or y > y0 + h:
-                continue
             # Selected highlight (background)
             if self.selected_index == i:
                 pygame.draw.rect(surf, self.sel_color, (x, y, w, self.line_height), 2, border_radius=4)
@@ -124,13 +127,13 @@ class SongSelector:
             dur = track['length']
             m, s = divmod(int(dur), 60)
             dur_s = f"{m:02d}:{s:02d}"
-            dur_surf = self.font.render(dur_s, True, self.text_color)
+            dur_surf = render_text(self.font, dur_s, self.text_color)
             dw, dh = dur_surf.get_size()
             surf.blit(dur_surf, (x + w - dw - 5, y + (self.line_height - dh) // 2))
 
             # Title text with horizontal scroll, clipped before duration area
             title = track['title']
-            title_surf = self.font.render(title, True, self.text_color)
+            title_surf = render_text(self.font, title, self.text_color)
             max_title_w = w - dw - 15
             surf.set_clip(pygame.Rect(x + 5, y, max_title_w, self.line_height))
             if title_surf.get_width() > max_title_w:
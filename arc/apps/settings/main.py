@@ -5,6 +5,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 import math
 from arc.core.config import config
 from arc.core.ui_elements import Button, WarningMessage, TabManager
+from arc.core.runloop import RunLoop
 
 def safe_get(obj, key, default=None):
     """Safely get attribute or dict key from config, falling back as needed."""
@@ -119,16 +120,20 @@ def main():
     fps = safe_get(config, "FPS", 30)
     screen = pygame.display.set_mode((screen_width, screen_height), pygame.FULLSCREEN)
     pygame.display.set_caption("Settings")
-    clock = pygame.time.Clock()
-
     menu = Settings()
-    while True:
-        for event in pygame.event.get():
-            menu.handle_event(event)
+    loop = RunLoop(fps=fps)
+
+    def update():
         menu.update()
+        if menu.warning.visible:
+            # Wake again to hide the warning once it times out
+            loop.animate(0.1)
+
+    def draw():
         menu.draw(screen)
         pygame.display.flip()
-        clock.tick(fps)
+
+    loop.run(menu.handle_event, draw, update)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
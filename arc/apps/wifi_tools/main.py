@@ -9,6 +9,7 @@ import time
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 from arc.core.config import config
 from arc.core.ui_elements import Button, WarningMessage, TabManager
+from arc.core.wifi_scan import wifi_scan_cache
 
 
 class ScanMenu:
@@ -20,6 +21,11 @@ class ScanMenu:
         self.MAX_VISIBLE = 5  # Adjust for your screen/resolution
         self.info = "Press R to scan for WiFi networks."
         self.last_error = ""
+        # Start from the last scan the launcher (or a previous run) stored
+        cached = wifi_scan_cache.networks()
+        if cached:
+            self.networks = cached
+            self.info = f"{len(cached)} networks, {int(wifi_scan_cache.age())}s ago. Press R to rescan."
 
     def scan_networks(self):
         self.scanning = True
@@ -31,6 +37,7 @@ class ScanMenu:
                 ['sudo', 'iwlist', 'wlan0', 'scan'],
                 stderr=subprocess.STDOUT, text=True)
             self.networks = self.parse_scan(output)
+            wifi_scan_cache.update(self.networks, source='iwlist')
             if self.networks:
                 self.info = f"Found {len(self.networks)} networks."
             else:
@@ -54,12 +61,16 @@ class ScanMenu:
             bssid_match = re.search(r'Address: ([\da-fA-F:]+)', cell)
             if ssid_match and bssid_match:
                 ssid = ssid_match.group(1)
-                signal = int(signal_match.group(1)) if signal_match else None
+                dbm = int(signal_match.group(1)) if signal_match else None
                 bssid = bssid_match.group(1)
+                encrypted = re.search(r'Encryption key:on', cell)
                 results.append({
                     'ssid': ssid,
-                    'signal': signal,
+                    # 0-100 like nmcli, so the shared scan cache has one scale
+                    'signal': None if dbm is None else min(100, max(0, 2 * (dbm + 100))),
+                    'dbm': dbm,
                     'bssid': bssid,
+                    'security': 'WPA' if encrypted else '--',
                 })
         return results
 
@@ -106,7 +117,12 @@ class ScanMenu:
         visible_networks = self.networks[self.scroll_offset:self.scroll_offset + self.MAX_VISIBLE]
         for i, net in enumerate(visible_networks):
             idx = i + self.scroll_offset
-            s = f"{net['ssid']}  |  {net['bssid']}  |  Signal: {net['signal']} dBm" if net['signal'] is not None else f"{net['ssid']}  |  {net['bssid']}"
+            if net.get('dbm') is not None:
+                s = f"{net['ssid']}  |  {net['bssid']}  |  Signal: {net['dbm']} dBm"
+            elif net.get('signal') is not None:
+                s = f"{net['ssid']}  |  {net['bssid']}  |  Signal: {net['signal']}%"
+            else:
+                s = f"{net['ssid']}  |  {net['bssid']}"
             color = config.accent_color if idx == self.selected_idx else config.colors.text
             surf = net_font.render(s, True, color)
             rect = surf.get_rect(center=(config.screen.width//2, y + i*32))
@@ -3,15 +3,34 @@ Core utilities and components for ARC.
 Includes configuration management, UI elements, and input handling.
 """
 
-from .config import config, load_config, ConfigDict
+from .log import get_logger, configure as configure_logging
+from .config import config, load_config, ConfigNode, ConfigWatcher, ConfigError
 from .ui_elements import (
     Button, WarningMessage, Tab, TabManager, MessageBox,
     SearchBox, AppIcon, Slider, ScrollableList
 )
+from .text_cache import TextCache, text_cache, render_text
+from .fonts import FontRegistry, font_registry, get_font
+from .dirty import DirtyRegions
+from .profiler import FrameProfiler
+from .runloop import RunLoop
+from .icon_atlas import IconAtlas, icon_atlas, load_icon
+from .wifi_scan import WifiScanCache, wifi_scan_cache
+from .readiness import LaunchReadiness, notify_ready, install as _install_readiness
+
+# Apps started by the launcher report their first presented frame
+_install_readiness()
 
 __all__ = [
-    'config', 'load_config', 'ConfigDict',
+    'get_logger', 'configure_logging',
+    'config', 'load_config', 'ConfigNode', 'ConfigWatcher', 'ConfigError',
     'Button', 'WarningMessage', 'Tab', 'TabManager', 'MessageBox',
-    'SearchBox', 'AppIcon', 'Slider', 'ScrollableList'
+    'SearchBox', 'AppIcon', 'Slider', 'ScrollableList',
+    'TextCache', 'text_cache', 'render_text',
+    'FontRegistry', 'font_registry', 'get_font',
+    'DirtyRegions', 'FrameProfiler', 'RunLoop',
+    'IconAtlas', 'icon_atlas', 'load_icon',
+    'WifiScanCache', 'wifi_scan_cache',
+    'LaunchReadiness', 'notify_ready'
 ]
 
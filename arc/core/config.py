@@ -1,20 +1,78 @@
 import os
-import yaml
+import re
+import sys
+import marshal
+import zlib
+import logging
 
-class ConfigDict(dict):
+# Plain logging: this module is also loaded standalone (benchmarks/bench_startup);
+# arc.core.log attaches the background writer to the 'arc' logger
+log = logging.getLogger('arc.config')
+
+# Parsed-config snapshots live here, keyed on config path + mtime + size
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'arc'
+)
+CACHE_VERSION = 1
+_ENV_VAR_RE = re.compile(r'\$(\w+)|\$\{(\w+)\}')
+
+class ConfigNode(dict):
     """
-    Allows dot notation access for nested dicts, e.g. config.colors.background
+    Read-only, pre-built config node. Nested dicts are converted to ConfigNodes
+    and lists to tuples once by freeze(), so dot access is a plain lookup with no
+    per-access allocation, e.g. config.colors.background -> (20, 20, 20)
+
+    Keys are mirrored into the instance __dict__ so attribute access is served
+    by the normal lookup path; only missing keys fall through to __getattr__.
     """
+    __slots__ = ('__dict__',)
+
     def __getattr__(self, name):
-        value = self.get(name)
-        if isinstance(value, dict):
-            return ConfigDict(value)
-        elif isinstance(value, list):
-            # Optionally convert list of dicts to list of ConfigDicts
-            return [ConfigDict(item) if isinstance(item, dict) else item for item in value]
-        return value
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return self.get(name)
+
     def __setattr__(self, name, value):
-        self[name] = value
+        raise TypeError(f"config is read-only (tried to set '{name}')")
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("config is read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (freeze, (thaw(self),))
+
+
+def freeze(obj):
+    """
+    Recursively convert plain YAML data into ConfigNodes and tuples
+    """
+    if isinstance(obj, dict):
+        node = ConfigNode()
+        attrs = node.__dict__
+        for k, v in obj.items():
+            v = freeze(v)
+            dict.__setitem__(node, k, v)
+            # Keys shadowing dict methods (e.g. "items") stay item-only
+            if isinstance(k, str) and not hasattr(dict, k):
+                attrs[k] = v
+        return node
+    elif isinstance(obj, (list, tuple)):
+        return tuple(freeze(i) for i in obj)
+    return obj
+
+
+def thaw(obj):
+    """
+    Inverse of freeze(): return plain dicts and lists
+    """
+    if isinstance(obj, dict):
+        return {k: thaw(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [thaw(i) for i in obj]
+    return obj
 
 def expand_paths(obj, base_dir=None):
     """
@@ -44,10 +102,292 @@ def expand_paths(obj, base_dir=None):
     else:
         return obj
 
-def load_config(config_path=None):
+class ConfigError(ValueError):
+    """
+    Raised by load_config() when the config doesn't match SCHEMA. `errors`
+    holds one "section.key: problem" line per invalid value.
+    """
+    def __init__(self, config_path, errors):
+        self.config_path = config_path
+        self.errors = errors
+        report = "\n".join(f"  - {e}" for e in errors)
+        super().__init__(f"Invalid config {config_path}:\n{report}")
+
+
+def _int(minimum=0):
+    def coerce(value):
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            raise ValueError(f"expected an integer, got {value!r}")
+        try:
+            result = int(value)
+        except ValueError:
+            raise ValueError(f"expected an integer, got {value!r}")
+        if result < minimum:
+            raise ValueError(f"must be >= {minimum}, got {result}")
+        return result
+    return coerce
+
+
+def _bool(value):
+    if not isinstance(value, bool):
+        raise ValueError(f"expected true/false, got {value!r}")
+    return value
+
+
+def _str(value):
+    if not isinstance(value, str):
+        raise ValueError(f"expected a string, got {value!r}")
+    return value
+
+
+def _choice(*options):
+    def coerce(value):
+        if value not in options:
+            raise ValueError(f"expected one of {', '.join(options)}, got {value!r}")
+        return value
+    return coerce
+
+
+def _str_list(value):
+    if not isinstance(value, (list, tuple)) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"expected a list of strings, got {value!r}")
+    return list(value)
+
+
+def _color(value):
+    if (not isinstance(value, (list, tuple)) or len(value) not in (3, 4)
+            or not all(isinstance(c, int) and not isinstance(c, bool) and 0 <= c <= 255
+                       for c in value)):
+        raise ValueError(f"expected [r, g, b] or [r, g, b, a] with 0-255 values, got {value!r}")
+    return tuple(value)
+
+
+_INT = _int()
+_POSITIVE = _int(1)
+
+# section -> {key: (coerce, default)}; top-level scalars map straight to a spec.
+# Missing or null values get the default, present ones are coerced and checked.
+# Keys not listed here are passed through untouched.
+SCHEMA = {
+    'screen': {
+        'width': (_POSITIVE, 480),
+        'height': (_POSITIVE, 320),
+        'fps': (_POSITIVE, 30),
+    },
+    'tab': {
+        'width': (_POSITIVE, 100),
+        'height': (_POSITIVE, 40),
+        'margin': (_INT, 5),
+    },
+    'accent_color': (_color, (204, 99, 36)),
+    'colors': {
+        'background': (_color, (20, 20, 20)),
+        'background_light': (_color, (250, 250, 250)),
+        'tab_bg': (_color, (50, 50, 50)),
+        'tab_active': (_color, (100, 100, 100)),
+        'button': (_color, (220, 220, 220)),
+        'button_hover': (_color, (100, 160, 210)),
+        'text_light': (_color, (5, 5, 5)),
+        'text': (_color, (220, 220, 220)),
+        'warning_bg': (_color, (200, 50, 50)),
+        'warning_text': (_color, (255, 255, 255)),
+        'indicator': (_color, (180, 180, 180)),
+        'indicator_active': (_color, (255, 255, 255)),
+        'input_bg': (_color, (255, 255, 255)),
+        'input_border': (_color, (100, 100, 100)),
+        'input_text': (_color, (0, 0, 0)),
+        'input_placeholder': (_color, (150, 150, 150)),
+        'cell_bg': (_color, (220, 220, 220)),
+        'cell_active': (_color, (240, 240, 240)),
+        'accent': (_color, (204, 99, 36)),
+        'slider_bg': (_color, (80, 80, 80)),
+        'slider_fill': (_color, (50, 150, 250)),
+        'slider_knob': (_color, (200, 200, 200)),
+        'slider_active_knob': (_color, (255, 255, 255)),
+        'popup_bg': (_color, (36, 42, 48)),
+        'popup_fg': (_color, (240, 240, 240)),
+    },
+    'grid': {
+        'cols': (_POSITIVE, 4),
+        'rows': (_POSITIVE, 2),
+        'margin': (_INT, 10),
+        'padding': (_INT, 30),
+        'x_offset': (_int(-10000), 0),
+        'y_offset': (_int(-10000), 0),
+    },
+    'cell': {
+        'width': (_POSITIVE, 90),
+        'height': (_POSITIVE, 90),
+    },
+    'topbar': {
+        'height': (_POSITIVE, 30),
+        'bg': (_color, (20, 20, 20)),
+        'fg': (_color, (200, 200, 200)),
+        'notification_dot': (_color, (245, 88, 88)),
+        'icons': (_str_list, []),
+        'wifi_icons': (_str_list, []),
+        'show_clock': (_bool, True),
+        'clock_format': (_str, "%H:%M"),
+        'show_notifications': (_bool, True),
+        'show_battery': (_bool, True),
+        'show_wifi': (_bool, True),
+        'show_bt': (_bool, True),
+        'show_mobile': (_bool, True),
+        'padding_left': (_INT, 5),
+        'padding_right': (_INT, 5),
+        'icon_spacing': (_INT, 5),
+        'notification_spacing': (_INT, 5),
+    },
+    'radius': {
+        'button': (_INT, 8),
+        'app_button': (_INT, 20),
+        'tab': (_INT, 6),
+        'warning': (_INT, 6),
+        'modal': (_INT, 6),
+        'input': (_INT, 6),
+        'app_icon': (_INT, 15),
+        'slider': (_INT, 4),
+        'slider_knob': (_INT, 6),
+    },
+    'indicator': {
+        'radius': (_POSITIVE, 4),
+        'spacing': (_INT, 10),
+    },
+    'font': {
+        'name': (_str, "Arial"),
+        'size': (_POSITIVE, 20),
+    },
+    'warning_duration': (_INT, 2000),
+    'render_cache': {
+        'text_bytes': (_INT, 2 * 1024 * 1024),
+        'icon_bytes': (_INT, 8 * 1024 * 1024),
+    },
+    'app_manager': {
+        'single_instance': (_bool, True),
+        'memory_budget_mb': (_POSITIVE, 192),
+        'over_budget': (_choice('suspend', 'terminate'), 'suspend'),
+        'sample_interval': (_POSITIVE, 5),
+    },
+}
+
+
+def _coerce(spec, value, where, errors):
+    coerce, default = spec
+    if value is None:
+        return coerce(default)
+    try:
+        return coerce(value)
+    except ValueError as e:
+        errors.append(f"{where}: {e}")
+        return value
+
+
+def apply_schema(data, config_path=None):
+    """
+    Return a copy of `data` with SCHEMA defaults filled in and values coerced
+    (colors to tuples, numbers to int). Raises ConfigError listing every
+    invalid value.
+    """
+    data = dict(data)
+    errors = []
+    for name, spec in SCHEMA.items():
+        if isinstance(spec, tuple):
+            data[name] = _coerce(spec, data.get(name), name, errors)
+            continue
+        section = data.get(name)
+        if section is None:
+            section = {}
+        elif not isinstance(section, dict):
+            errors.append(f"{name}: expected a mapping, got {section!r}")
+            continue
+        section = dict(section)
+        for key, field in spec.items():
+            section[key] = _coerce(field, section.get(key), f"{name}.{key}", errors)
+        data[name] = section
+    if errors:
+        raise ConfigError(config_path, errors)
+    return data
+
+
+def _cache_file(config_path):
+    # The entry key also records the path, so a crc collision is just a miss
+    digest = zlib.crc32(config_path.encode('utf-8'))
+    return os.path.join(CACHE_DIR, f"config-{digest:08x}.{sys.implementation.cache_tag}.marshal")
+
+
+def _referenced_env(obj, names):
+    """
+    Collect the names of $VARS used in string values (HOME is always relevant for ~)
+    """
+    if isinstance(obj, dict):
+        for v in obj.values():
+            _referenced_env(v, names)
+    elif isinstance(obj, list):
+        for v in obj:
+            _referenced_env(v, names)
+    elif isinstance(obj, str) and '$' in obj:
+        for m in _ENV_VAR_RE.finditer(obj):
+            names.add(m.group(1) or m.group(2))
+    return names
+
+
+def _cache_key(config_path):
+    st = os.stat(config_path)
+    return [CACHE_VERSION, config_path, st.st_mtime_ns, st.st_size]
+
+
+def _read_cache(config_path):
+    """
+    Return the expanded config data from the snapshot, or None if it is
+    missing or stale (config file changed or a referenced env var differs)
+    """
+    try:
+        with open(_cache_file(config_path), 'rb') as f:
+            entry = marshal.load(f)
+        if entry['key'] != _cache_key(config_path):
+            return None
+        for name, value in entry['env'].items():
+            if os.environ.get(name) != value:
+                return None
+        return entry['data']
+    except Exception:
+        return None
+
+
+def _write_cache(config_path, key, env_names, data):
+    try:
+        entry = {
+            'key': key,
+            'env': {name: os.environ.get(name) for name in env_names},
+            'data': data,
+        }
+        # Raises ValueError for values marshal can't store (e.g. YAML dates)
+        payload = marshal.dumps(entry)
+        import tempfile
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix='.config-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp, _cache_file(config_path))
+        except Exception:
+            os.unlink(tmp)
+            raise
+    except Exception:
+        pass
+
+
+def load_config(config_path=None, use_cache=True):
     """
-    Load YAML config and return as ConfigDict, recursively expanding paths.
+    Load YAML config and return it as a frozen ConfigNode tree, recursively
+    expanding paths.
     All relative paths in the config are resolved relative to the project root.
+
+    The parsed result is snapshotted under CACHE_DIR and reused while the file's
+    mtime/size and referenced environment variables are unchanged, so most app
+    starts skip YAML parsing entirely. Set ARC_NO_CONFIG_CACHE=1 to disable.
+
+    Values are checked against SCHEMA; an invalid config raises ConfigError.
     """
     # Try user config, else fall back to local arc.yaml
     if config_path is None:
@@ -78,12 +418,16 @@ def load_config(config_path=None):
     # Ensure base_dir is absolute
     base_dir = os.path.abspath(base_dir)
     
-    # Debug output (can be removed later)
-    import sys
-    if '--debug' in sys.argv or os.environ.get('ARC_DEBUG'):
-        print(f"[Config Debug] Config file: {config_path}")
-        print(f"[Config Debug] Base directory: {base_dir}")
+    log.debug("Config file: %s, base directory: %s", config_path, base_dir)
     
+    use_cache = use_cache and not os.environ.get('ARC_NO_CONFIG_CACHE')
+    if use_cache:
+        data = _read_cache(config_path)
+        if data is not None:
+            return freeze(apply_schema(data, config_path))
+        key = _cache_key(config_path)
+
+    import yaml
     with open(config_path, "r") as f:
         data = yaml.safe_load(f)
     
@@ -91,8 +435,97 @@ def load_config(config_path=None):
     data['_base_dir'] = base_dir
     data['_config_path'] = config_path
     
+    if use_cache:
+        env_names = _referenced_env(data, {'HOME'})
     data = expand_paths(data, base_dir)
-    return ConfigDict(data)
+    if use_cache:
+        _write_cache(config_path, key, env_names, data)
+    return freeze(apply_schema(data, config_path))
+
+def diff_sections(old, new):
+    """
+    Return the set of top-level keys whose values differ between two configs
+    """
+    return {k for k in set(old) | set(new) if old.get(k) != new.get(k)}
+
+
+def _replace_sections(root, new, sections):
+    # Swap sections on the live root so modules holding `config` see them
+    for k in sections:
+        if k in new:
+            dict.__setitem__(root, k, new[k])
+            if isinstance(k, str) and not hasattr(dict, k):
+                root.__dict__[k] = new[k]
+        else:
+            dict.__delitem__(root, k)
+            root.__dict__.pop(k, None)
+
+
+class ConfigWatcher:
+    """
+    Polls the config file's mtime/size and reloads it when it changes.
+    Changed top-level sections are swapped into the live config in place and
+    subscribers are told which sections changed.
+
+    Call poll() every `interval` seconds from the UI loop (e.g. with
+    RunLoop.call_every); each call is one stat(). Callbacks run on the
+    calling thread.
+    """
+    def __init__(self, cfg=None, interval=1.0):
+        self.config = cfg if cfg is not None else config
+        self.path = self.config._config_path
+        self.interval = interval
+        self.last_error = None
+        self._stamp = self._stat()
+        self._subscribers = []
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def subscribe(self, callback, sections=None):
+        """
+        callback(config, changed_sections) is called after a reload that
+        touches any of `sections` (any section if None)
+        """
+        self._subscribers.append((callback, set(sections) if sections else None))
+        return callback
+
+    def unsubscribe(self, callback):
+        self._subscribers = [s for s in self._subscribers if s[0] is not callback]
+
+    def poll(self):
+        """
+        Reload if the file changed since the last check. Returns the set of
+        changed sections (empty if nothing changed or the new file is invalid).
+        """
+        stamp = self._stat()
+        if stamp is None or stamp == self._stamp:
+            return set()
+        self._stamp = stamp
+        return self.reload()
+
+    def reload(self):
+        try:
+            new = load_config(self.path)
+        except Exception as e:
+            # Keep running on the old config, e.g. while the file is half-written
+            self.last_error = e
+            log.warning("Reload of %s failed: %s", self.path, e)
+            return set()
+        self.last_error = None
+        changed = diff_sections(self.config, new)
+        if not changed:
+            return changed
+        _replace_sections(self.config, new, changed)
+        for callback, sections in list(self._subscribers):
+            if sections is None or sections & changed:
+                callback(self.config, changed)
+        return changed
+
 
 config = load_config()
 
@@ -0,0 +1,56 @@
+import pygame
+
+
+class DirtyRegions:
+    """
+    Collects the screen areas invalidated during a frame and presents only
+    those with pygame.display.update(rects); a full invalidation falls back
+    to pygame.display.flip().
+
+        for rect in icon.dirty_rects(screen):  # part of the screen
+            dirty.invalidate(rect)
+        dirty.invalidate()                     # whole screen
+        for rect in dirty.rects(): ...redraw inside rect...
+        dirty.present()
+    """
+    def __init__(self, size):
+        self.bounds = pygame.Rect((0, 0), size)
+        self.full = True
+        self._rects = []
+
+    def __bool__(self):
+        return self.full or bool(self._rects)
+
+    def invalidate(self, rect=None):
+        if rect is None:
+            self.full = True
+        elif not self.full:
+            rect = pygame.Rect(rect).clip(self.bounds)
+            if rect.width and rect.height:
+                self._rects.append(rect)
+
+    def rects(self):
+        """Invalidated areas, with overlapping rects merged."""
+        if self.full:
+            return [self.bounds.copy()]
+        merged = []
+        for rect in self._rects:
+            rect = rect.copy()
+            # Keep absorbing until no merged rect overlaps this one
+            i = rect.collidelist(merged)
+            while i != -1:
+                rect.union_ip(merged.pop(i))
+                i = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def present(self):
+        if self.full:
+            pygame.display.flip()
+        elif self._rects:
+            pygame.display.update(self.rects())
+        self.clear()
+
+    def clear(self):
+        self.full = False
+        self._rects = []
@@ -0,0 +1,60 @@
+import os
+import pygame
+from .config import config
+
+
+class FontRegistry:
+    """
+    Resolves (name, size, bold, italic) to a shared pygame Font, so the
+    fontconfig lookup behind SysFont runs once per distinct font.
+
+    `name` may be a path to a font file (as config.font.name is) or a system
+    font name; None means config.font.name.
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._fonts = {}
+
+    def get(self, name=None, size=None, bold=False, italic=False):
+        if name is None:
+            name = config.font.name
+        if size is None:
+            size = config.font.size
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+        self.misses += 1
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if name and os.path.isfile(name):
+            font = pygame.font.Font(name, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+        else:
+            font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        self._fonts[key] = font
+        return font
+
+    def preload(self):
+        """Load the fonts the core widgets use from config."""
+        self.get()
+        self.get(size=config.font.size + 12)
+
+    def clear(self):
+        self._fonts.clear()
+
+    def stats(self):
+        return {'fonts': len(self._fonts), 'hits': self.hits, 'misses': self.misses}
+
+
+font_registry = FontRegistry()
+
+
+def get_font(name=None, size=None, bold=False, italic=False):
+    """
+    Shared Font for name/size, see FontRegistry
+    """
+    return font_registry.get(name, size, bold, italic)
@@ -0,0 +1,233 @@
+import os
+import json
+import atexit
+import pygame
+
+try:
+    import fcntl
+except ImportError:  # no flock: concurrent saves may still race
+    fcntl = None
+from .config import CACHE_DIR
+
+ATLAS_VERSION = 1
+ATLAS_WIDTH = 512
+ATLAS_PATH = os.path.join(CACHE_DIR, 'icons.atlas')
+
+# frombytes/tobytes are the pygame >= 2.1.3 names
+_frombytes = getattr(pygame.image, 'frombytes', None) or pygame.image.fromstring
+_tobytes = getattr(pygame.image, 'tobytes', None) or pygame.image.tostring
+
+
+class IconAtlas:
+    """
+    Pre-scaled icons packed into one image on disk, so a cold start blits
+    sub-surfaces of a single raw RGBA buffer instead of decoding and
+    smoothscaling every PNG.
+
+    Entries are keyed on (source path, size) and record the source mtime
+    and size; get() re-bakes only icons whose source changed and save()
+    writes the atlas back (atomically, at exit or when called). The launcher
+    and every app share the file, so save() first merges in icons another
+    process wrote since this one loaded it. The file is a JSON index line
+    followed by the raw pixels.
+
+    ARC_NO_ICON_ATLAS=1 bypasses the on-disk atlas.
+    """
+    def __init__(self, path=ATLAS_PATH):
+        self.path = path
+        self.enabled = not os.environ.get('ARC_NO_ICON_ATLAS')
+        self.hits = 0
+        self.misses = 0
+        self._surface = None
+        self._entries = {}       # "path|w|h" -> {'stamp': [...], 'rect': [x, y, w, h]}
+        self._shelf = [0, 0, 0]  # next free x, shelf top, shelf height
+        self._wasted = 0         # area of entries that were replaced
+        self._loaded = False
+        self._dirty = False
+        self._exit_registered = False
+        self._disk_stamp = None  # (mtime_ns, size) of the file as last read or written
+
+    # --- disk ---
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _read(self):
+        """(index, RGBA surface) from disk, or None if missing or unusable."""
+        try:
+            with open(self.path, 'rb') as f:
+                index = json.loads(f.readline())
+                pixels = f.read()
+            if index.get('version') != ATLAS_VERSION:
+                return None
+            size = tuple(index['size'])
+            if len(pixels) != size[0] * size[1] * 4:
+                return None
+            return index, _frombytes(pixels, size, 'RGBA')
+        except (OSError, ValueError, KeyError, TypeError, pygame.error):
+            return None
+
+    def _load(self):
+        self._loaded = True
+        if not self.enabled:
+            return
+        self._disk_stamp = self._stat()
+        on_disk = self._read()
+        if on_disk is None:
+            return
+        index, surface = on_disk
+        try:
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            self._surface = surface
+            self._entries = index['entries']
+            self._shelf = index['shelf']
+            self._wasted = index['wasted']
+        except (KeyError, pygame.error):
+            self.clear()
+
+    def _merge(self):
+        """Adopt icons another process saved since we last read the file."""
+        if self._stat() == self._disk_stamp:
+            return
+        on_disk = self._read()
+        if on_disk is None:
+            return
+        index, surface = on_disk
+        for key, record in index.get('entries', {}).items():
+            if key not in self._entries:
+                self._entries[key] = {'stamp': record['stamp'],
+                                      'rect': self._place(surface.subsurface(record['rect']))}
+
+    def save(self):
+        if not (self.enabled and self._dirty and self._surface is not None):
+            return
+        lock = None
+        try:
+            import tempfile
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            if fcntl is not None:
+                lock = open(self.path + '.lock', 'w')
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            self._merge()
+            self._compact()
+            # Only the packed rows are stored; the atlas grows again on load if needed
+            used = self._surface.subsurface((0, 0, ATLAS_WIDTH, self._shelf[1] + self._shelf[2]))
+            index = {
+                'version': ATLAS_VERSION,
+                'size': list(used.get_size()),
+                'shelf': self._shelf,
+                'wasted': self._wasted,
+                'entries': self._entries,
+            }
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix='.icons-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(json.dumps(index).encode() + b'\n')
+                    f.write(_tobytes(used, 'RGBA'))
+                os.replace(tmp, self.path)
+            except Exception:
+                os.unlink(tmp)
+                raise
+            self._disk_stamp = self._stat()
+            self._dirty = False
+        except Exception:
+            pass
+        finally:
+            if lock is not None:
+                lock.close()  # releases the flock
+
+    # --- packing ---
+    def _compact(self):
+        """Repack live entries once replaced icons take more room than live ones."""
+        used = sum(r['rect'][2] * r['rect'][3] for r in self._entries.values())
+        if self._wasted <= used:
+            return
+        old, entries = self._surface, self._entries
+        self._surface, self._entries, self._shelf, self._wasted = None, {}, [0, 0, 0], 0
+        for key, record in sorted(entries.items(), key=lambda e: -e[1]['rect'][3]):
+            src = old.subsurface(record['rect'])
+            self._entries[key] = {'stamp': record['stamp'], 'rect': self._place(src)}
+
+    def _place(self, image):
+        w, h = image.get_size()
+        x, top, shelf_h = self._shelf
+        if x + w > ATLAS_WIDTH:
+            x, top, shelf_h = 0, top + shelf_h, 0
+        shelf_h = max(shelf_h, h)
+        needed = top + shelf_h
+        if self._surface is None or self._surface.get_height() < needed:
+            grown = pygame.Surface((ATLAS_WIDTH, max(needed, 64, 2 * needed if self._surface else 0)),
+                                   pygame.SRCALPHA, 32)
+            if self._surface is not None:
+                # Adding onto cleared pixels copies them exactly (no alpha blending)
+                grown.blit(self._surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            self._surface = grown
+        self._surface.fill((0, 0, 0, 0), (x, top, w, h))
+        self._surface.blit(image, (x, top), special_flags=pygame.BLEND_RGBA_ADD)
+        self._shelf = [x + w, top, shelf_h]
+        return [x, top, w, h]
+
+    # --- lookup ---
+    def get(self, path, size):
+        """
+        `path` scaled to `size` as a sub-surface of the atlas, or None if the
+        image can't be loaded. The result is shared; don't draw on it.
+        """
+        if not self._loaded:
+            self._load()
+        size = (int(size[0]), int(size[1]))
+        try:
+            st = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+        stamp = [st.st_mtime_ns, st.st_size]
+        key = f"{path}|{size[0]}|{size[1]}"
+        record = self._entries.get(key)
+        if record is not None and record['stamp'] == stamp and self._surface is not None:
+            self.hits += 1
+            return self._surface.subsurface(record['rect'])
+
+        self.misses += 1
+        try:
+            img = pygame.image.load(path)
+        except (pygame.error, OSError):
+            return None
+        rgba = pygame.Surface(img.get_size(), pygame.SRCALPHA, 32)
+        rgba.blit(img, (0, 0))
+        scaled = pygame.transform.smoothscale(rgba, size)
+        if not self.enabled or size[0] > ATLAS_WIDTH:
+            return scaled.convert_alpha() if pygame.display.get_surface() else scaled
+        if record is not None:
+            self._wasted += record['rect'][2] * record['rect'][3]
+        self._entries[key] = {'stamp': stamp, 'rect': self._place(scaled)}
+        self._dirty = True
+        if not self._exit_registered:
+            atexit.register(self.save)
+            self._exit_registered = True
+        return self._surface.subsurface(self._entries[key]['rect'])
+
+    def clear(self):
+        self._surface = None
+        self._entries = {}
+        self._shelf = [0, 0, 0]
+        self._wasted = 0
+        self._dirty = False
+
+    def stats(self):
+        size = self._surface.get_size() if self._surface else (0, 0)
+        return {'icons': len(self._entries), 'size': size, 'hits': self.hits, 'misses': self.misses}
+
+
+icon_atlas = IconAtlas()
+
+
+def load_icon(path, size):
+    """
+    Icon at `path` scaled to `size` from the shared atlas, or None, see IconAtlas
+    """
+    return icon_atlas.get(path, size)
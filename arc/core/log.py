@@ -0,0 +1,162 @@
+"""
+Leveled logging for arc that never writes on the caller's thread.
+
+    from arc.core.log import get_logger
+    log = get_logger('launcher')         # -> logger "arc.launcher"
+    log.debug("loaded %s", path)         # dropped unless ARC_LOG_LEVEL=DEBUG
+
+Records go onto a queue; one background thread formats them and writes them
+in batches (one write + flush per batch), rotating the file by size. Until
+configure() points it at a file, warnings and errors go to stderr.
+
+ARC_LOG_LEVEL sets the level (default WARNING, or DEBUG when ARC_DEBUG is set)
+and ARC_LOG_FILE the file.
+"""
+
+import os
+import sys
+import queue
+import atexit
+import logging
+import threading
+
+DEFAULT_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+BATCH = 256
+
+_root = logging.getLogger('arc')
+_handler = None
+
+
+class BackgroundWriter(logging.Handler):
+    """
+    Queues records and writes them from a daemon thread. With `path`,
+    rotates to path.1 .. path.<backups> once the file passes `max_bytes`;
+    without, writes to stderr.
+    """
+    def __init__(self, path=None, max_bytes=1024 * 1024, backups=3, level=logging.NOTSET):
+        super().__init__(level)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.dropped = 0
+        self._stream = None
+        self._size = 0
+        self._start()
+
+    def _start(self):
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name='arc-log', daemon=True)
+        self._thread.start()
+
+    def emit(self, record):
+        # Resolve the message now: args may change after the call returns
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+                record.exc_info = None
+            self._queue.put(record)
+        except Exception:
+            self.dropped += 1
+
+    def _open(self):
+        if self.path is None:
+            return sys.stderr
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        stream = open(self.path, 'a', encoding='utf-8')
+        self._size = stream.tell()
+        return stream
+
+    def _rotate(self):
+        self._stream.close()
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.unlink(self.path)
+        self._stream = self._open()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < BATCH:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            stop = batch[-1] is None
+            lines = [self.format(r) + '\n' for r in batch if r is not None]
+            try:
+                if self._stream is None:
+                    self._stream = self._open()
+                text = ''.join(lines)
+                self._stream.write(text)
+                self._stream.flush()
+                if self.path is not None:
+                    self._size += len(text.encode('utf-8'))
+                    if self._size > self.max_bytes:
+                        self._rotate()
+            except Exception:
+                self.dropped += len(lines)
+            if stop:
+                return
+
+    def close(self):
+        """Write out everything queued so far and stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=2)
+        if self._stream is not None and self._stream is not sys.stderr:
+            self._stream.close()
+        super().close()
+
+
+def configure(path=None, level=None, max_bytes=1024 * 1024, backups=3):
+    """
+    (Re)configure the "arc" logger: level (name or number, default from the
+    environment) and log file (default ARC_LOG_FILE, else stderr).
+    """
+    global _handler
+    if level is None:
+        level = os.environ.get('ARC_LOG_LEVEL') or ('DEBUG' if os.environ.get('ARC_DEBUG') else 'WARNING')
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.WARNING
+    path = path or os.environ.get('ARC_LOG_FILE') or None
+    if _handler is not None:
+        _root.removeHandler(_handler)
+        _handler.close()
+    _handler = BackgroundWriter(path, max_bytes, backups)
+    _handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+    _root.addHandler(_handler)
+    _root.setLevel(level)
+    _root.propagate = False
+    return _handler
+
+
+def get_logger(name):
+    if _handler is None:
+        configure()
+    return _root.getChild(name)
+
+
+def shutdown():
+    if _handler is not None:
+        _handler.close()
+
+
+def _after_fork():
+    # A forked child (e.g. from the zygote) inherits the handler but not its thread
+    if _handler is not None:
+        _handler._stream = None
+        _handler._start()
+
+
+atexit.register(shutdown)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,157 @@
+import os
+import json
+import time
+import atexit
+import pygame
+from .log import get_logger
+
+log = get_logger('profiler')
+
+PHASES = ('event', 'update', 'draw', 'flip')
+PHASE_COLORS = {
+    'event': (80, 160, 250),
+    'update': (120, 200, 90),
+    'draw': (240, 170, 40),
+    'flip': (220, 80, 80),
+}
+
+
+class FrameProfiler:
+    """
+    Opt-in per-frame phase timer. Samples go into a fixed-size ring buffer;
+    when disabled every call returns immediately.
+
+        profiler.begin_frame()
+        ...handle events...   profiler.mark('event')
+        ...update state...    profiler.mark('update')
+        ...draw...            profiler.mark('draw')
+        pygame.display.flip() profiler.mark('flip')
+        profiler.end_frame()
+
+    ARC_PROFILE=1 enables recording and the overlay; F12 toggles the overlay.
+    Samples are dumped as JSON at exit to ARC_PROFILE_FILE, or to
+    ~/.cache/arc/profile-<name>-<pid>.json.
+    """
+    HOTKEY = pygame.K_F12
+    OVERLAY_SIZE = (150, 48)
+    BUDGET_MS = 1000 / 30
+
+    def __init__(self, name='arc', capacity=300, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get('ARC_PROFILE', '') not in ('', '0')
+        self.name = name
+        self.enabled = enabled
+        self.overlay_visible = enabled
+        self.capacity = capacity
+        # Each sample: (frame start, ms per phase in PHASES order..., total ms)
+        self._samples = [None] * capacity
+        self._next = 0
+        self._count = 0
+        self._phases = dict.fromkeys(PHASES, 0.0)
+        self._start = 0.0
+        self._last = 0.0
+        self._dump_registered = False
+        if enabled:
+            self._register_dump()
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._start = self._last = time.perf_counter()
+        for phase in PHASES:
+            self._phases[phase] = 0.0
+
+    def mark(self, phase):
+        """Charge the time since the previous mark to `phase`."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._phases[phase] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        total = (self._last - self._start) * 1000
+        self._samples[self._next] = (self._start,) + tuple(self._phases[p] for p in PHASES) + (total,)
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def samples(self):
+        """Recorded samples, oldest first."""
+        start = (self._next - self._count) % self.capacity
+        return [self._samples[(start + i) % self.capacity] for i in range(self._count)]
+
+    def handle_event(self, event):
+        """Toggle the overlay on the hotkey; returns True if the event was used."""
+        if event.type == pygame.KEYDOWN and event.key == self.HOTKEY:
+            self.enabled = True
+            self.overlay_visible = not self.overlay_visible
+            self._register_dump()
+            return True
+        return False
+
+    def _register_dump(self):
+        if not self._dump_registered:
+            atexit.register(self.dump)
+            self._dump_registered = True
+
+    def overlay_rect(self, surface):
+        w, h = self.OVERLAY_SIZE
+        sw, sh = surface.get_size()
+        return pygame.Rect(sw - w - 4, sh - h - 4, w, h)
+
+    def draw_overlay(self, surface):
+        """Stacked per-phase bar per frame, with a line at the 30 fps budget."""
+        if not (self.enabled and self.overlay_visible):
+            return None
+        rect = self.overlay_rect(surface)
+        graph = pygame.Surface(rect.size, pygame.SRCALPHA)
+        graph.fill((0, 0, 0, 170))
+        scale = rect.height / (self.BUDGET_MS * 2)
+        samples = self.samples()[-rect.width:]
+        x = rect.width - len(samples)
+        for sample in samples:
+            y = rect.height
+            for i, phase in enumerate(PHASES):
+                h = int(sample[i + 1] * scale + 0.5)
+                if h:
+                    pygame.draw.line(graph, PHASE_COLORS[phase], (x, y - 1), (x, max(0, y - h)))
+                    y -= h
+            x += 1
+        budget_y = rect.height - int(self.BUDGET_MS * scale)
+        pygame.draw.line(graph, (255, 255, 255, 200), (0, budget_y), (rect.width, budget_y))
+        surface.blit(graph, rect)
+        return rect
+
+    def summary(self):
+        samples = self.samples()
+        if not samples:
+            return {}
+        result = {}
+        for i, key in enumerate(PHASES + ('total',)):
+            values = sorted(s[i + 1] for s in samples)
+            result[key] = {
+                'mean_ms': sum(values) / len(values),
+                'p50_ms': values[len(values) // 2],
+                'max_ms': values[-1],
+            }
+        return result
+
+    def dump(self, path=None):
+        if path is None:
+            path = os.environ.get('ARC_PROFILE_FILE') or os.path.join(
+                os.path.expanduser('~/.cache/arc'), f"profile-{self.name}-{os.getpid()}.json")
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump({
+                    'name': self.name,
+                    'phases': list(PHASES),
+                    'fields': ['start'] + list(PHASES) + ['total'],
+                    'summary': self.summary(),
+                    'samples': self.samples(),
+                }, f)
+        except Exception as e:
+            log.warning("Could not write %s: %s", path, e)
+        return path
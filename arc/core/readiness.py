@@ -0,0 +1,113 @@
+"""
+Launch readiness handshake.
+
+The launcher gives a child app the write end of a pipe in ARC_READY_FD. When
+arc.core is imported in that app, install() wraps pygame.display.flip/update
+so the first presented frame writes one byte to the pipe and closes it; the
+launcher's LaunchReadiness sees the byte (ready) or EOF (the app exited or
+dropped the pipe without drawing).
+"""
+
+import os
+import select
+import time
+import pygame
+
+READY_ENV = 'ARC_READY_FD'
+_installed = False
+_ready_fd = None
+
+
+def _take_fd():
+    """Claim the pipe from the environment so programs this app starts don't inherit it."""
+    global _ready_fd
+    fd = os.environ.pop(READY_ENV, None)
+    if fd is not None:
+        try:
+            _ready_fd = int(fd)
+            os.set_inheritable(_ready_fd, False)
+        except (OSError, ValueError):
+            _ready_fd = None
+    return _ready_fd
+
+
+def notify_ready():
+    """Tell the launcher this app has presented its first frame (once)."""
+    global _ready_fd
+    fd = _ready_fd if _ready_fd is not None else _take_fd()
+    _ready_fd = None
+    if fd is None:
+        return
+    try:
+        os.write(fd, b'R')
+        os.close(fd)
+    except OSError:
+        pass
+
+
+def install():
+    """Signal readiness on the first pygame.display.flip()/update() of this process."""
+    global _installed
+    if _installed or _take_fd() is None:
+        return
+    _installed = True
+    display = pygame.display
+    originals = {'flip': display.flip, 'update': display.update}
+
+    def first_frame(name):
+        def present(*args, **kwargs):
+            result = originals[name](*args, **kwargs)
+            display.flip, display.update = originals['flip'], originals['update']
+            notify_ready()
+            return result
+        return present
+
+    display.flip = first_frame('flip')
+    display.update = first_frame('update')
+
+
+class LaunchReadiness:
+    """
+    Launcher side of the handshake:
+
+        ready = LaunchReadiness()
+        ...start the child with ready.child_env() / ready.fd...
+        ready.started()
+        while not ready.poll(): ...keep the loading screen up...
+        ready.latency   # seconds to first frame, or None
+    """
+    def __init__(self):
+        self._read, self.fd = os.pipe()
+        os.set_inheritable(self.fd, True)
+        self.start = time.monotonic()
+        self.done = False
+        self.latency = None
+
+    def child_env(self, env=None):
+        env = dict(os.environ if env is None else env)
+        env[READY_ENV] = str(self.fd)
+        return env
+
+    def started(self):
+        """Drop the launcher's copy of the write end once the child holds it."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def poll(self, timeout=0):
+        """True once the child signalled or went away."""
+        if self.done:
+            return True
+        readable, _, _ = select.select([self._read], [], [], timeout)
+        if not readable:
+            return False
+        if os.read(self._read, 1):
+            self.latency = time.monotonic() - self.start
+        self.close()
+        return True
+
+    def close(self):
+        self.started()
+        if not self.done:
+            os.close(self._read)
+            self.done = True
@@ -0,0 +1,136 @@
+import heapq
+import itertools
+import time
+import pygame
+
+
+class RunLoop:
+    """
+    Event-driven main loop. Instead of ticking at a fixed rate, wait() blocks
+    in pygame.event.wait until an event arrives, a timer or animation
+    deadline is due, or another thread calls wake(). Frames are drawn only
+    after invalidate(), and never faster than `fps`.
+
+        loop = RunLoop(fps=30)
+        loop.call_every(60, loop.invalidate)     # e.g. a clock
+        loop.run(handle_event, draw)             # or drive wait() yourself
+    """
+    def __init__(self, fps=30):
+        self.frame_interval = 1.0 / fps
+        self.running = True
+        self.dirty = True
+        self._timers = []
+        self._seq = itertools.count()
+        self._cancelled = set()
+        self._animate_at = None
+        self._last_frame = 0.0
+        self._wake_type = pygame.event.custom_type()
+
+    # --- scheduling ---
+    def invalidate(self):
+        """Request a redraw on the next frame."""
+        self.dirty = True
+
+    def animate(self, delay=None):
+        """Wake and redraw after `delay` seconds (default: one frame)."""
+        at = time.monotonic() + (self.frame_interval if delay is None else delay)
+        if self._animate_at is None or at < self._animate_at:
+            self._animate_at = at
+
+    def call_later(self, delay, callback):
+        """Run callback() on the loop thread after `delay` seconds; returns a handle."""
+        return self._schedule(time.monotonic() + delay, None, callback)
+
+    def call_every(self, interval, callback):
+        """Run callback() every `interval` seconds; returns a handle."""
+        return self._schedule(time.monotonic() + interval, interval, callback)
+
+    def cancel(self, handle):
+        self._cancelled.add(handle)
+
+    def _schedule(self, at, interval, callback):
+        handle = next(self._seq)
+        heapq.heappush(self._timers, (at, handle, interval, callback))
+        return handle
+
+    def wake(self):
+        """Thread-safe: make a blocked wait() return so the loop re-checks state."""
+        try:
+            pygame.event.post(pygame.event.Event(self._wake_type))
+        except pygame.error:
+            pass
+
+    # --- waiting ---
+    def _next_deadline(self):
+        deadlines = []
+        if self._timers:
+            deadlines.append(self._timers[0][0])
+        if self._animate_at is not None:
+            deadlines.append(self._animate_at)
+        if self.dirty:
+            deadlines.append(self._last_frame + self.frame_interval)
+        return min(deadlines) if deadlines else None
+
+    def _run_timers(self, now):
+        while self._timers and self._timers[0][0] <= now:
+            at, handle, interval, callback = heapq.heappop(self._timers)
+            if handle in self._cancelled:
+                self._cancelled.discard(handle)
+                continue
+            if interval is not None:
+                heapq.heappush(self._timers, (max(at + interval, now), handle, interval, callback))
+            callback()
+
+    def wait(self):
+        """Block until there is something to do; returns the pending events."""
+        deadline = self._next_deadline()
+        now = time.monotonic()
+        if deadline is None:
+            first = pygame.event.wait()
+        elif deadline > now:
+            first = pygame.event.wait(max(1, int((deadline - now) * 1000)))
+        else:
+            first = None
+        events = [] if first is None or first.type == pygame.NOEVENT else [first]
+        events.extend(pygame.event.get())
+
+        now = time.monotonic()
+        # Don't start frames faster than the target rate during event bursts
+        if events or self.dirty:
+            remaining = self._last_frame + self.frame_interval - now
+            if remaining > 0:
+                pygame.time.wait(int(remaining * 1000))
+                events.extend(pygame.event.get())
+                now = time.monotonic()
+
+        self._run_timers(now)
+        if self._animate_at is not None and self._animate_at <= now:
+            self._animate_at = None
+            self.dirty = True
+        return [ev for ev in events if ev.type != self._wake_type]
+
+    def frame_done(self):
+        """Call after presenting a frame."""
+        self.dirty = False
+        self._last_frame = time.monotonic()
+
+    def stop(self):
+        self.running = False
+        self.wake()
+
+    def run(self, handle_event, draw, update=None):
+        """
+        Loop until stop(): handle_event(ev) per event, then update() if given,
+        then draw() when invalidated. Any event invalidates the frame.
+        """
+        while self.running:
+            events = self.wait()
+            for ev in events:
+                handle_event(ev)
+            if events:
+                self.dirty = True
+            if update:
+                update()
+            if self.dirty and self.running:
+                draw()
+                self.frame_done()
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from .config import config
+
+
+def _as_key_color(color):
+    return None if color is None else tuple(color)
+
+
+class TextCache:
+    """
+    Process-wide LRU cache of rendered text surfaces, keyed on
+    (font, text, color, antialias, background) and bounded by a byte budget.
+
+    Returned surfaces are shared between callers and must not be drawn on.
+    """
+    def __init__(self, max_bytes=2 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def render(self, font, text, color, antialias=True, background=None):
+        key = (font, text, _as_key_color(color), antialias, _as_key_color(background))
+        surf = self._entries.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surf
+        self.misses += 1
+        if background is None:
+            surf = font.render(text, antialias, color)
+        else:
+            surf = font.render(text, antialias, color, background)
+        size = surf.get_pitch() * surf.get_height()
+        if size <= self.max_bytes:
+            self._entries[key] = surf
+            self.bytes += size
+            self._evict()
+        return surf
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and self._entries:
+            _, old = self._entries.popitem(last=False)
+            self.bytes -= old.get_pitch() * old.get_height()
+
+    def set_budget(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+text_cache = TextCache(config.render_cache.text_bytes)
+
+
+def render_text(font, text, color, antialias=True, background=None):
+    """
+    Cached drop-in for font.render(text, antialias, color, background)
+    """
+    return text_cache.render(font, text, color, antialias, background)
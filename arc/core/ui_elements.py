@@ -1,17 +1,31 @@
 import pygame
 import subprocess
 from .config import config
+from .text_cache import render_text
+from .fonts import get_font
+from .icon_atlas import load_icon
+from .log import get_logger
 import time
 import os
 import glob
 
+log = get_logger('ui')
+
 class Button:
+    # Retained mode: idle and hovered looks are composed once into cached
+    # surfaces, so a frame is one blit. Set False to paint every frame.
+    RETAINED = True
+    # Extra space around rect that the widget paints into (e.g. an outline)
+    MARGIN = 0
+
     def __init__(self, text, rect, callback):
         self.text = text
         self.rect = pygame.Rect(rect)
         self.callback = callback
-        self.font = pygame.font.SysFont(config.font.name, config.font.size)
+        self.font = get_font()
         self.hovered = False
+        self._surfaces = None
+        self._surfaces_key = None
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -20,18 +34,58 @@ class Button:
             if self.rect.collidepoint(event.pos):
                 self.callback()
 
-    def draw(self, surface):
-        color = config.colors.button_hover if self.hovered else config.colors.button
-        pygame.draw.rect(surface, color, self.rect, border_radius=config.radius.button)
-        txt_surf = self.font.render(self.text, True, config.colors.text_light)
-        txt_rect = txt_surf.get_rect(center=self.rect.center)
+    def set_hovered(self, hovered):
+        """Set hover state; returns True if it changed (and needs a repaint)."""
+        changed = hovered != self.hovered
+        self.hovered = hovered
+        return changed
+
+    def dirty_rects(self, surface):
+        """Screen areas this widget paints, for partial redraws."""
+        return [self.rect]
+
+    def _style_key(self):
+        """Everything the cached surfaces depend on; a change recomposes them."""
+        return (self.rect.size, self.text, config.colors.button, config.colors.button_hover,
+                config.colors.text_light, config.radius.button)
+
+    def _paint(self, surface, rect, hovered):
+        color = config.colors.button_hover if hovered else config.colors.button
+        pygame.draw.rect(surface, color, rect, border_radius=config.radius.button)
+        txt_surf = render_text(self.font, self.text, config.colors.text_light)
+        txt_rect = txt_surf.get_rect(center=rect.center)
         surface.blit(txt_surf, txt_rect)
 
+    def invalidate(self):
+        """Drop the cached idle/hovered surfaces (e.g. after a theme reload)."""
+        self._surfaces = None
+
+    def _state_surface(self, hovered):
+        key = self._style_key()
+        if self._surfaces is None or key != self._surfaces_key:
+            m = self.MARGIN
+            size = (self.rect.width + 2 * m, self.rect.height + 2 * m)
+            local = pygame.Rect(m, m, self.rect.width, self.rect.height)
+            self._surfaces = []
+            for state in (False, True):
+                surf = pygame.Surface(size, pygame.SRCALPHA)
+                self._paint(surf, local, state)
+                self._surfaces.append(surf)
+            self._surfaces_key = key
+        return self._surfaces[hovered]
+
+    def draw(self, surface):
+        if not self.RETAINED:
+            self._paint(surface, self.rect, self.hovered)
+            return
+        surf = self._state_surface(bool(self.hovered))
+        surface.blit(surf, (self.rect.x - self.MARGIN, self.rect.y - self.MARGIN))
+
 
 class WarningMessage:
     def __init__(self, text):
         self.text = text
-        self.font = pygame.font.SysFont(config.font.name, config.font.size)
+        self.font = get_font()
         self.start_time = 0
         self.visible = False
 
@@ -46,7 +100,7 @@ class WarningMessage:
     def draw(self, surface):
         if not self.visible:
             return
-        txt_surf = self.font.render(self.text, True, config.colors.warning_text)
+        txt_surf = render_text(self.font, self.text, config.colors.warning_text)
         padding = 10
         bg_rect = txt_surf.get_rect()
         bg_rect.inflate_ip(padding * 2, padding * 2)
@@ -63,34 +117,26 @@ class Tab:
         y = config.tab.margin + index * (config.tab.height + config.tab.margin)
         self.base_y = y
         self.rect = pygame.Rect(x, y, config.tab.width, config.tab.height)
-        self.font = pygame.font.SysFont(config.font.name, config.font.size)
+        self.font = get_font()
 
     def draw(self, surface, y_offset, active=False):
         rect = self.rect.copy()
         rect.y = y_offset
         color = config.colors.tab_active if active else config.colors.tab_bg
         pygame.draw.rect(surface, color, rect, border_radius=config.radius.tab)
-        txt_surf = self.font.render(self.name, True, config.colors.text)
+        txt_surf = render_text(self.font, self.name, config.colors.text)
         txt_rect = txt_surf.get_rect(center=rect.center)
         surface.blit(txt_surf, txt_rect)
 
 
 class TabManager:
     def __init__(self, tab_names):
-        # Defensive: fallback if config values are missing or None
-        tab_height = getattr(getattr(config, "tab", {}), "height", 40) or 40
-        tab_margin = getattr(getattr(config, "tab", {}), "margin", 5) or 5
-        screen_height = getattr(getattr(config, "screen", {}), "height", 320) or 320
-
         self.tabs = [Tab(name, i) for i, name in enumerate(tab_names)]
         self.active = 0
         self.first_visible = 0
-        self.visible_count = max(1, screen_height // (tab_height + tab_margin))
+        self.visible_count = max(1, config.screen.height // (config.tab.height + config.tab.margin))
 
     def handle_event(self, event):
-        tab_height = getattr(getattr(config, "tab", {}), "height", 40) or 40
-        tab_margin = getattr(getattr(config, "tab", {}), "margin", 5) or 5
-
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             for i, tab in enumerate(self.tabs[self.first_visible:self.first_visible + self.visible_count]):
                 if tab.rect.move(0, -(self.tabs[self.first_visible].base_y - tab.base_y)).collidepoint(event.pos):
@@ -109,25 +155,18 @@ class TabManager:
             self.first_visible = self.active - self.visible_count + 1
 
     def draw(self, surface):
-        # Defensive: fallback to defaults
-        screen_height = getattr(getattr(config, "screen", {}), "height", 320) or 320
-        screen_width  = getattr(getattr(config, "screen", {}), "width", 480) or 480
-        tab_margin    = getattr(getattr(config, "tab", {}), "margin", 5) or 5
-        indicator     = getattr(config, "indicator", {})
-        r = getattr(indicator, "radius", 4) or 4
-        s = getattr(indicator, "spacing", 10) or 10
+        r = config.indicator.radius
+        s = config.indicator.spacing
 
         self.update_visible()
         n = len(self.tabs)
 
         total_h = n * 2 * r + (n - 1) * s
-        start_y = screen_height / 2 - total_h / 2
-        x = screen_width - tab_margin - r - 5
+        start_y = config.screen.height / 2 - total_h / 2
+        x = config.screen.width - config.tab.margin - r - 5
 
-        # Robust color fetching
-        colors = getattr(config, "colors", {})
-        color_indicator      = getattr(colors, "indicator", (180, 180, 180))
-        color_indicator_actv = getattr(colors, "indicator_active", (255, 255, 255))
+        color_indicator      = config.colors.indicator
+        color_indicator_actv = config.colors.indicator_active
 
         for i in range(n):
             y = start_y + i * (2 * r + s)
@@ -139,26 +178,17 @@ class TabManager:
 
 class MessageBox:
     def __init__(self, text, yes_callback, no_callback):
-        # Defensive config values
-        font_obj   = getattr(config, "font", None)
-        screen     = getattr(config, "screen", None)
-        tab        = getattr(config, "tab", None)
-        colors     = getattr(config, "colors", {})
-        radius     = getattr(config, "radius", {})
-
-        font_name  = getattr(font_obj, "name", None) or "Arial"
-        font_size  = getattr(font_obj, "size", None) or 20
-        screen_w   = getattr(screen, "width", 480)
-        screen_h   = getattr(screen, "height", 320)
-        tab_margin = getattr(tab, "margin", 5)
-        tab_bg     = getattr(colors, "tab_bg", (50, 50, 50))
-        text_col   = getattr(colors, "text", (220, 220, 220))
-        modal_rad  = getattr(radius, "modal", 6)
+        screen_w   = config.screen.width
+        screen_h   = config.screen.height
+        tab_margin = config.tab.margin
+        tab_bg     = config.colors.tab_bg
+        text_col   = config.colors.text
+        modal_rad  = config.radius.modal
 
         self.text = text
         self.yes_callback = yes_callback
         self.no_callback = no_callback
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font()
         self.visible = False
         # calculate box dimensions
         self.width = screen_w * 0.6
@@ -202,7 +232,7 @@ class MessageBox:
                            self.width, self.height)
         pygame.draw.rect(surface, tab_bg, rect, border_radius=modal_rad)
         # text
-        txt_surf = self.font.render(self.text, True, text_col)
+        txt_surf = render_text(self.font, self.text, text_col)
         txt_rect = txt_surf.get_rect(center=(screen_w // 2, rect.y + 30))
         surface.blit(txt_surf, txt_rect)
         # buttons
@@ -211,24 +241,18 @@ class MessageBox:
 
 class SearchBox:
     def __init__(self, rect, placeholder="", callback=None):
-        # Defensive config values
-        font_obj   = getattr(config, "font", None)
-        colors     = getattr(config, "colors", {})
-        radius     = getattr(config, "radius", {})
-
-        font_name  = getattr(font_obj, "name", None) or "Arial"
-        font_size  = getattr(font_obj, "size", None) or 20
-        input_bg   = getattr(colors, "input_bg", (255, 255, 255))
-        input_border = getattr(colors, "input_border", (100, 100, 100))
-        tab_bg     = getattr(colors, "tab_bg", (50, 50, 50))
-        input_text = getattr(colors, "input_text", (0, 0, 0))
-        input_placeholder = getattr(colors, "input_placeholder", (150, 150, 150))
-        input_rad  = getattr(radius, "input", 6)
+        colors     = config.colors
+        input_bg   = colors.input_bg
+        input_border = colors.input_border
+        tab_bg     = colors.tab_bg
+        input_text = colors.input_text
+        input_placeholder = colors.input_placeholder
+        input_rad  = config.radius.input
 
         self.rect = pygame.Rect(rect)
         self.placeholder = placeholder
         self.callback = callback
-        self.font = pygame.font.SysFont(font_name, font_size)
+        self.font = get_font()
         self.text = ""
         self.active = False
         self.cursor_visible = True
@@ -278,18 +302,20 @@ class SearchBox:
         # text
         txt = self.text if self.text else self.placeholder
         txt_color = input_text if self.text else input_placeholder
-        txt_surf = self.font.render(txt, True, txt_color)
+        txt_surf = render_text(self.font, txt, txt_color)
         surface.blit(txt_surf, (self.rect.x+8, self.rect.y + (self.rect.height-txt_surf.get_height())//2))
         # cursor
         if self.active and self.cursor_visible:
-            sub = self.font.render(self.text[:self.cursor_pos], True, input_text)
-            cx = self.rect.x + 8 + sub.get_width()
+            cx = self.rect.x + 8 + self.font.size(self.text[:self.cursor_pos])[0]
             cy_top = self.rect.y + (self.rect.height - self.font.get_height())//2
             cy_bot = cy_top + self.font.get_height()
             pygame.draw.line(surface, input_text, (cx, cy_top), (cx, cy_bot), 2)
 
 
 class AppIcon(Button):
+    OUTLINE_W = 3
+    MARGIN = OUTLINE_W
+
     @staticmethod
     def get_shell_commands(icon_fallback):
         seen = set()
@@ -306,18 +332,12 @@ class AppIcon(Button):
 
     def __init__(self, name, icon_path, rect, callback):
         super().__init__(name, rect, callback)
-        # Get config values safely
-        colors = getattr(config, "colors", {})
-        radius = getattr(config, "radius", {})
-        accent_color = getattr(config, "accent_color", (255, 255, 255))
-        font_obj = getattr(config, "font", None)
-        font_size = getattr(font_obj, "size", None) or 20
-
-        self.bg_active = getattr(colors, "cell_active", (240, 240, 240))
-        self.bg_idle = getattr(colors, "cell_bg", (220, 220, 220))
-        self.border_radius = getattr(radius, "app_icon", 15)
-        self.border_color = getattr(colors, "accent", accent_color)
-        self.text_color = getattr(colors, "text", (220, 220, 220))
+        self.bg_active = config.colors.cell_active
+        self.bg_idle = config.colors.cell_bg
+        self.border_radius = config.radius.app_icon
+        self.border_color = config.colors.accent
+        self.hover_border_color = config.accent_color
+        self.text_color = config.colors.text
 
         self.icon_path = icon_path
         
@@ -332,7 +352,7 @@ class AppIcon(Button):
                     abs_icon_path = os.path.abspath(icon_path)
                 else:
                     # Try relative to project root (stored in config)
-                    base_dir = getattr(config, '_base_dir', os.getcwd())
+                    base_dir = config._base_dir or os.getcwd()
                     alt_path = os.path.join(base_dir, icon_path)
                     if os.path.exists(alt_path):
                         abs_icon_path = alt_path
@@ -346,19 +366,16 @@ class AppIcon(Button):
         else:
             abs_icon_path = None
         
-        print(f"AppIcon: Loading '{name}'")
-        print(f"  Path: {icon_path}")
-        print(f"  Absolute: {abs_icon_path}")
-        print(f"  Exists: {os.path.isfile(icon_path) if icon_path else False}")
-        
+        log.debug("AppIcon %r: icon %s", name, icon_path)
+
         if not icon_path or not os.path.isfile(icon_path):
-            print(f"  WARNING: Icon file not found!")
+            log.warning("AppIcon %r: icon file not found: %s", name, icon_path)
             # Create a placeholder icon with the first letter of the app name
             img = pygame.Surface((self.rect.width - 25, self.rect.height - 25), pygame.SRCALPHA)
             img.fill((100, 100, 100))  # Gray background
             # Draw first letter
             try:
-                letter_font = pygame.font.SysFont('Arial', 40, bold=True)
+                letter_font = get_font('Arial', 40, bold=True)
                 letter = name[0].upper() if name else '?'
                 text_surf = letter_font.render(letter, True, (255, 255, 255))
                 text_rect = text_surf.get_rect(center=(img.get_width()//2, img.get_height()//2))
@@ -366,32 +383,32 @@ class AppIcon(Button):
             except:
                 pass
         else:
-            try:
-                img = pygame.image.load(icon_path).convert_alpha()
-                print(f"  ✓ Successfully loaded icon")
-            except Exception as e:
-                print(f"  ✗ Failed to load icon: {e}")
+            # Pre-scaled copy from the icon atlas; only decoded when the PNG changed
+            img = load_icon(icon_path, (self.rect.width - 25, self.rect.height - 25))
+            if img is None:
+                log.warning("AppIcon %r: failed to load icon %s", name, icon_path)
                 img = pygame.Surface((self.rect.width - 25, self.rect.height - 25), pygame.SRCALPHA)
                 img.fill((200, 50, 50))  # Red for error
-        
-        self.icon = pygame.transform.smoothscale(
-            img,
-            (self.rect.width - 25, self.rect.height - 25)
-        )
-        self._font_size = font_size
 
-    def draw(self, surface):
+        self.icon = img
+        self._font_size = config.font.size
+
+    def _style_key(self):
+        return (self.rect.size, self.bg_idle, self.bg_active, self.hover_border_color,
+                self.border_radius, self.icon)
+
+    def _paint(self, surface, rect, hovered):
         # draw background cell
-        bg_color = self.bg_active if self.hovered else self.bg_idle
-        pygame.draw.rect(surface, bg_color, self.rect,
+        bg_color = self.bg_active if hovered else self.bg_idle
+        pygame.draw.rect(surface, bg_color, rect,
                          border_radius=self.border_radius)
         border_color = self.border_color
 
         # if hovered, draw a colored border
-        if self.hovered:
-            border_color = getattr(config, "accent_color", self.border_color)
-            outline_w = 3
-            outer = self.rect.inflate(outline_w * 2, outline_w * 2)
+        if hovered:
+            border_color = self.hover_border_color
+            outline_w = self.OUTLINE_W
+            outer = rect.inflate(outline_w * 2, outline_w * 2)
             outer_radius = self.border_radius + outline_w
             pygame.draw.rect(
                 surface,
@@ -403,21 +420,31 @@ class AppIcon(Button):
 
         # blit icon (centered)
         ir = self.icon.get_rect()
-        ir.centerx = self.rect.centerx
-        ir.y = self.rect.y + 12
+        ir.centerx = rect.centerx
+        ir.y = rect.y + 12
         surface.blit(self.icon, ir)
 
+    def draw(self, surface):
+        super().draw(surface)
         # draw text only for hovered icon at bottom center of screen
         if self.hovered:
-            font_name = getattr(getattr(config, "font", None), "name", "Arial")
-            hover_font = pygame.font.SysFont(font_name, self._font_size + 12)
-            text_surf = hover_font.render(self.text, True, self.text_color)
-            text_rect = text_surf.get_rect()
-            sw, sh = surface.get_size()
-            text_rect.centerx = sw // 2
-            text_rect.centery = sh - (text_surf.get_height() // 2) - 15
+            text_surf, text_rect = self._label(surface)
             surface.blit(text_surf, text_rect)
 
+    def _label(self, surface):
+        hover_font = get_font(size=self._font_size + 12)
+        text_surf = render_text(hover_font, self.text, self.text_color)
+        text_rect = text_surf.get_rect()
+        sw, sh = surface.get_size()
+        text_rect.centerx = sw // 2
+        text_rect.centery = sh - (text_surf.get_height() // 2) - 15
+        return text_surf, text_rect
+
+    def dirty_rects(self, surface):
+        """Cell including the hover outline, plus the hover label area."""
+        outline = self.rect.inflate(self.OUTLINE_W * 2, self.OUTLINE_W * 2)
+        return [outline, self._label(surface)[1]]
+
 
 
 class Slider:
@@ -432,15 +459,12 @@ class Slider:
         self._update_knob_x()
         self.dragging  = False
 
-        # Robust YAML config
-        colors = getattr(config, "colors", None)
-        radius = getattr(config, "radius", None)
-        self.slider_bg   = getattr(colors, "slider_bg", (80, 80, 80))
-        self.slider_fill = getattr(colors, "slider_fill", (50, 150, 250))
-        self.knob_col    = getattr(colors, "slider_knob", (200, 200, 200))
-        self.knob_active = getattr(colors, "slider_active_knob", (255, 255, 255))
-        self.bar_radius  = getattr(radius, "slider", 4)
-        self.knob_radius = getattr(radius, "slider_knob", 6)
+        self.slider_bg   = config.colors.slider_bg
+        self.slider_fill = config.colors.slider_fill
+        self.knob_col    = config.colors.slider_knob
+        self.knob_active = config.colors.slider_active_knob
+        self.bar_radius  = config.radius.slider
+        self.knob_radius = config.radius.slider_knob
 
     def _update_knob_x(self):
         pct = (self.value - self.min_val) / (self.max_val - self.min_val)
@@ -500,11 +524,15 @@ class ScrollableList:
         icons       – optional list of pygame.Surface objects or None
         icon_size   – (w, h) to scale each icon
         icon_padding– space between icon and right edge
+
+        Only the rows inside rect are drawn; scaled icons are cached per
+        source surface and dropped when items/icons are reassigned.
         """
-        self.items          = items
         self.rect           = pygame.Rect(rect)
         self.font           = font
         self.line_h         = line_height
+        self._scaled_icons  = {}
+        self.items          = items
         self.text_color     = text_color
         self.bg_color       = bg_color
         self.sel_color      = sel_color
@@ -522,8 +550,39 @@ class ScrollableList:
         # which index is selected by keyboard
         self.selected_index = 0
 
+    @property
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        self._items = items
         # max scroll so last item lines up at bottom
-        self.max_offset = max(0, len(self.items) * self.line_h - self.rect.height)
+        self.max_offset = max(0, len(items) * self.line_h - self.rect.height)
+        self.offset_y = min(getattr(self, 'offset_y', 0), self.max_offset)
+
+    @property
+    def icons(self):
+        return self._icons
+
+    @icons.setter
+    def icons(self, icons):
+        self._icons = icons
+        keep = {id(ic) for ic in icons if ic is not None}
+        self._scaled_icons = {k: v for k, v in self._scaled_icons.items() if k in keep}
+
+    def _scaled_icon(self, icon):
+        entry = self._scaled_icons.get(id(icon))
+        if entry is None or entry[0] is not icon:
+            entry = (icon, pygame.transform.smoothscale(icon, self.icon_size))
+            self._scaled_icons[id(icon)] = entry
+        return entry[1]
+
+    def visible_range(self):
+        """Indices of the rows intersecting the list area, as a range."""
+        first = max(0, self.offset_y // self.line_h)
+        last = min(len(self.items), (self.offset_y + self.rect.height) // self.line_h + 1)
+        return range(first, last)
 
     def set_enabled(self, enabled: bool):
         """Enable or disable interaction."""
@@ -596,21 +655,22 @@ class ScrollableList:
 
         x, y0 = self.rect.x, self.rect.y
         text_right = self.rect.x + self.rect.width
-        for i, text in enumerate(self.items):
+        for i in self.visible_range():
+            text = self.items[i]
             y = y0 + i * self.line_h - self.offset_y
             # hover highlight fill
             if self.enabled and self.hover_index == i:
                 pygame.draw.rect(surface, self.sel_color,
                                  (x, y, self.rect.width, self.line_h), border_radius=4)
             # render text
-            txt_surf = self.font.render(text, True, self.text_color)
+            txt_surf = render_text(self.font, text, self.text_color)
             surface.blit(
                 txt_surf,
                 (x + 5, y + (self.line_h - txt_surf.get_height()) // 2)
             )
             # draw icon if present
             if i < len(self.icons) and self.icons[i]:
-                icon_surf = pygame.transform.smoothscale(self.icons[i], self.icon_size)
+                icon_surf = self._scaled_icon(self.icons[i])
                 ix = text_right - self.icon_size[0] - self.icon_padding
                 iy = y + (self.line_h - self.icon_size[1]) // 2
                 surface.blit(icon_surf, (ix, iy))
@@ -0,0 +1,151 @@
+"""
+Wi-Fi scan results shared between the launcher's Wi-Fi menu and apps such as
+wifi_tools, stored in ~/.cache/arc/wifi_scan.json:
+
+    {"scanned_at": <unix time>, "source": "nmcli",
+     "networks": [{"ssid", "bssid", "signal" (0-100), "security", "seen"}, ...]}
+
+A scan younger than `ttl` seconds is fresh and is not repeated; an older one
+is still shown (with its age) until a new scan replaces it.
+"""
+
+import os
+import json
+import time
+import threading
+import subprocess
+from .config import CACHE_DIR
+from .log import get_logger
+
+log = get_logger('wifi')
+
+CACHE_PATH = os.path.join(CACHE_DIR, 'wifi_scan.json')
+TTL = 30.0
+NMCLI_FIELDS = 'SSID,BSSID,SIGNAL,SECURITY'
+
+
+def split_terse(line):
+    """Split an `nmcli -t` line on unescaped ':' and undo the \\: / \\\\ escapes."""
+    fields, current, escaped = [], [], False
+    for ch in line:
+        if escaped:
+            current.append(ch)
+            escaped = False
+        elif ch == '\\':
+            escaped = True
+        elif ch == ':':
+            fields.append(''.join(current))
+            current = []
+        else:
+            current.append(ch)
+    fields.append(''.join(current))
+    return fields
+
+
+def parse_nmcli(output):
+    networks = []
+    for line in output.splitlines():
+        fields = split_terse(line)
+        if len(fields) < 4:
+            continue
+        ssid, bssid, signal, security = fields[:4]
+        try:
+            signal = int(signal)
+        except ValueError:
+            signal = None
+        networks.append({'ssid': ssid, 'bssid': bssid or None, 'signal': signal,
+                         'security': security})
+    return networks
+
+
+def _nmcli_list(rescan):
+    output = subprocess.check_output(
+        ['nmcli', '-t', '-f', NMCLI_FIELDS, 'device', 'wifi', 'list',
+         '--rescan', 'yes' if rescan else 'no'],
+        stderr=subprocess.DEVNULL
+    ).decode('utf-8', errors='ignore')
+    return parse_nmcli(output)
+
+
+class WifiScanCache:
+    def __init__(self, path=CACHE_PATH, ttl=TTL):
+        self.path = path
+        self.ttl = ttl
+        self.scanned_at = None
+        self.source = None
+        self._networks = []
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Pick up a scan another process wrote since the last look."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp:
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            with self._lock:
+                self._networks = list(data['networks'])
+                self.scanned_at = data['scanned_at']
+                self.source = data.get('source')
+                self._stamp = stamp
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.debug("Ignoring unreadable scan cache %s: %s", self.path, e)
+
+    def networks(self):
+        self.load()
+        with self._lock:
+            return list(self._networks)
+
+    def age(self):
+        """Seconds since the last scan (None if there never was one)."""
+        self.load()
+        return None if self.scanned_at is None else max(0.0, time.time() - self.scanned_at)
+
+    def fresh(self):
+        age = self.age()
+        return age is not None and age < self.ttl
+
+    def update(self, networks, source='nmcli'):
+        """Store a complete scan result (for this process and on disk)."""
+        now = time.time()
+        networks = [dict(net, seen=now) for net in networks]
+        with self._lock:
+            self._networks = networks
+            self.scanned_at = now
+            self.source = source
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump({'scanned_at': now, 'source': source, 'networks': networks}, f)
+            os.replace(tmp, self.path)
+            st = os.stat(self.path)
+            self._stamp = (st.st_mtime_ns, st.st_size)
+        except OSError as e:
+            log.warning("Could not write %s: %s", self.path, e)
+
+    def scan(self, on_result=None):
+        """
+        Scan with nmcli. NetworkManager's current list is passed to
+        on_result(networks) first, then the result of a real rescan, which
+        is also stored. Returns the rescan result.
+        """
+        if on_result:
+            try:
+                on_result(_nmcli_list(rescan=False))
+            except (OSError, subprocess.CalledProcessError):
+                pass
+        networks = _nmcli_list(rescan=True)
+        self.update(networks)
+        if on_result:
+            on_result(networks)
+        return networks
+
+
+wifi_scan_cache = WifiScanCache()
@@ -0,0 +1,278 @@
+"""
+App zygote: a resident interpreter with pygame and arc.core already imported
+that forks to run `python -m <module>` style launches.
+
+    python -m arc.core.zygote          # serve (the launcher starts it)
+
+    pid = zygote.spawn('arc.apps.calendar.main', cwd=project_root)
+    if pid is None:
+        ...fall back to subprocess...
+
+Each launch is a separate forked process in its own session, so apps stay
+isolated; they just skip interpreter start-up and the common imports. The
+config is re-checked before every fork. start() replaces a zygote left over
+from an earlier launcher run, so an updated arc.core is picked up on the next
+launcher start. ARC_NO_ZYGOTE=1 disables spawning from clients.
+"""
+
+import os
+import sys
+import json
+import array
+import shlex
+import signal
+import socket
+import struct
+import time
+import subprocess
+from arc.core.log import get_logger
+
+log = get_logger('zygote')
+
+SOCKET_PATH = os.environ.get('ARC_ZYGOTE_SOCKET') or os.path.join(
+    os.environ.get('XDG_RUNTIME_DIR') or os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'arc'),
+    'arc-zygote.sock')
+PRELOAD = ('pygame', 'arc.core', 'yaml')
+# Imported when available; they are shared copy-on-write with every app
+OPTIONAL_PRELOAD = ('numpy', 'mutagen', 'requests')
+MAX_MESSAGE = 64 * 1024
+MAX_FDS = 8
+# A client that connects but stalls must not block every other launch
+RECV_TIMEOUT = 2.0
+
+
+def parse_module_command(cmd):
+    """
+    (module, args) for a `<python> -m arc.<module> [args]` command line run
+    by this interpreter (the one the zygote uses), or None otherwise.
+    """
+    try:
+        argv = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+    except ValueError:
+        return None
+    if len(argv) < 3 or argv[1] != '-m' or not argv[2].startswith('arc.'):
+        return None
+    python = argv[0]
+    if python not in ('python', 'python3') and \
+            os.path.abspath(os.path.expanduser(python)) != os.path.abspath(sys.executable):
+        return None
+    return argv[2], argv[3:]
+
+
+# --- client ---
+
+def _send(sock, payload, fds):
+    data = json.dumps(payload).encode() + b'\n'
+    if fds:
+        sock.sendmsg([data], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', fds))])
+    else:
+        sock.sendall(data)
+
+
+def spawn(module, args=(), cwd=None, env=None, stdio=None, extra_fds=None, timeout=2.0,
+          path=SOCKET_PATH):
+    """
+    Fork `module` (run as __main__) from the zygote and return the pid, or
+    None if no zygote is reachable. `stdio` is (stdin, stdout, stderr) fds
+    for the child, /dev/null by default; `extra_fds` maps env var names to
+    more fds to pass on, e.g. {'ARC_READY_FD': w}, and the child finds its
+    copy of each fd in that variable.
+    """
+    if os.environ.get('ARC_NO_ZYGOTE'):
+        return None
+    devnull = None
+    extra_fds = dict(extra_fds or {})
+    try:
+        if stdio is None:
+            devnull = os.open(os.devnull, os.O_RDWR)
+            stdio = (devnull, devnull, devnull)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            _send(sock, {
+                'module': module,
+                'args': list(args),
+                'cwd': cwd or os.getcwd(),
+                'env': dict(os.environ if env is None else env),
+                'fd_env': list(extra_fds),
+            }, list(stdio) + list(extra_fds.values()))
+            reply = sock.makefile('rb').readline()
+        return json.loads(reply)['pid']
+    except (OSError, ValueError, KeyError):
+        return None
+    finally:
+        if devnull is not None:
+            os.close(devnull)
+
+
+def is_running(path=SOCKET_PATH):
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            sock.connect(path)
+        return True
+    except OSError:
+        return False
+
+
+def _server_pid(path):
+    """Pid of the process serving `path` if it runs as this user, else None."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            sock.connect(path)
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    except (OSError, AttributeError):
+        return None  # nothing listening, or no SO_PEERCRED on this platform
+    pid, uid, _ = struct.unpack('3i', creds)
+    return pid if uid == os.getuid() else None
+
+
+def stop(path=SOCKET_PATH, timeout=1.0):
+    """Terminate the zygote serving `path`. Apps it forked keep running."""
+    pid = _server_pid(path)
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        return False
+    deadline = time.monotonic() + timeout
+    while is_running(path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return True
+
+
+def start(path=SOCKET_PATH, cwd=None):
+    """
+    Start a zygote in the background. One already serving `path` is
+    stopped first: it may have preloaded an older arc.core.
+    """
+    if os.environ.get('ARC_NO_ZYGOTE'):
+        return None
+    stop(path)
+    env = dict(os.environ, ARC_ZYGOTE_SOCKET=path)
+    return subprocess.Popen(
+        [sys.executable, '-m', 'arc.core.zygote'],
+        cwd=cwd, env=env,
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+# --- server ---
+
+def _recv(conn):
+    fds = array.array('i')
+    data, ancdata, _, _ = conn.recvmsg(MAX_MESSAGE, socket.CMSG_SPACE(MAX_FDS * fds.itemsize))
+    for level, kind, payload in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(payload[:len(payload) - len(payload) % fds.itemsize])
+    try:
+        while not data.endswith(b'\n') and len(data) < MAX_MESSAGE:
+            chunk = conn.recv(MAX_MESSAGE)
+            if not chunk:
+                break
+            data += chunk
+        if not data:
+            return None, list(fds)  # a liveness probe from is_running()
+        return json.loads(data), list(fds)
+    except BaseException:
+        # The caller never sees these fds, so they are ours to close
+        for fd in fds:
+            os.close(fd)
+        raise
+
+
+def _preload():
+    import importlib
+    for name in PRELOAD:
+        importlib.import_module(name)
+    for name in OPTIONAL_PRELOAD:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+    from arc.core.config import ConfigWatcher
+    return ConfigWatcher()
+
+
+def serve(path=SOCKET_PATH):
+    """
+    Accept launch requests until killed. Returns only in a forked child,
+    with the request to run.
+    """
+    watcher = _preload()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Created 0600: no window in which another user can connect
+    umask = os.umask(0o077)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(umask)
+    server.listen(8)
+    # Children are reaped automatically; nobody waits on them here
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    while True:
+        conn, _ = server.accept()
+        fds = []
+        pid = None
+        try:
+            conn.settimeout(RECV_TIMEOUT)
+            request, fds = _recv(conn)
+            if request is not None:
+                watcher.poll()
+                pid = os.fork()
+            if pid:
+                conn.sendall(json.dumps({'pid': pid}).encode() + b'\n')
+        except Exception as e:
+            log.error("Launch failed: %s", e)
+        if pid == 0:
+            server.close()
+            conn.close()
+            return request, fds
+        for fd in fds:
+            os.close(fd)
+        conn.close()
+
+
+def _become(request, fds):
+    """Turn this forked process into the requested app's process."""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    os.setsid()
+    for target, fd in zip((0, 1, 2), fds[:3]):
+        os.dup2(fd, target)
+    extra = fds[3:]
+    for fd in set(fds[:3]) - set(extra):
+        if fd > 2:
+            os.close(fd)
+    for fd in extra:
+        os.set_inheritable(fd, True)
+    os.environ.clear()
+    os.environ.update(request['env'])
+    for name, fd in zip(request.get('fd_env', ()), extra):
+        os.environ[name] = str(fd)
+    os.chdir(request['cwd'])
+    sys.argv = [request['module']] + request['args']
+
+
+def main():
+    request, fds = serve()
+    # Only a forked child gets here; run the app as `python -m` would
+    _become(request, fds)
+    # arc.core was imported before the env was set; hook the first frame now
+    from arc.core import readiness
+    readiness.install()
+    import runpy
+    runpy.run_module(request['module'], run_name='__main__', alter_sys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,16 +3,23 @@ ARC Desktop Environment
 The graphical desktop interface for ARC, including launcher, topbar, and system menus.
 """
 
-from .arc_status import get_wifi_strength, get_bt_status
+from .arc_status import get_wifi_strength, get_bt_status, get_battery_level
+from .bluetooth import BluetoothStatus, bluetooth_status
+from .app_index import AppIndex, app_index
+from .page_cache import PageCache
+from .volume import VolumeService, FakeMixer
+from .app_manager import AppManager, app_manager
 from .loading_screen import show_loading_screen
-from .status_poller import StatusPoller
+from .status_hub import StatusHub, STATUS_CHANGED
 from .topbar import TopBar
 from .wifi_menu import WifiMenu
 from .bluetooth_menu import BluetoothMenu
 from .volume_widget import AudioLevelSlider
 
 __all__ = [
-    'get_wifi_strength', 'get_bt_status', 'show_loading_screen',
-    'StatusPoller', 'TopBar', 'WifiMenu', 'BluetoothMenu', 'AudioLevelSlider'
+    'get_wifi_strength', 'get_bt_status', 'get_battery_level', 'show_loading_screen',
+    'StatusHub', 'STATUS_CHANGED', 'TopBar', 'WifiMenu', 'BluetoothMenu', 'AudioLevelSlider',
+    'AppIndex', 'app_index', 'PageCache', 'VolumeService', 'FakeMixer',
+    'AppManager', 'app_manager', 'BluetoothStatus', 'bluetooth_status'
 ]
 
@@ -0,0 +1,111 @@
+import os
+import json
+import zlib
+from arc.core.config import config as default_config, thaw
+
+INDEX_VERSION = 1
+INDEX_PATH = os.path.expanduser(os.path.join('~', '.cache', 'launcher_apps.json'))
+
+
+def config_fingerprint(cfg):
+    """Checksum of the config values the app list is built from."""
+    blob = json.dumps([thaw(cfg.builtin_apps or []), cfg.apps_dir], sort_keys=True)
+    return zlib.crc32(blob.encode())
+
+
+class AppIndex:
+    """
+    On-disk index of installed app manifests for the launcher.
+
+    Each apps_dir/<app>/manifest.json is recorded with its mtime and size;
+    load() stats every manifest but only re-parses the new or changed ones,
+    and drops the whole index when builtin_apps or apps_dir change. The
+    index file is rewritten atomically, and only when something changed.
+    """
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.parsed = 0
+        self._index = None
+
+    def _read(self):
+        try:
+            with open(self.path, 'r') as f:
+                index = json.load(f)
+            if isinstance(index, dict) and index.get('version') == INDEX_VERSION:
+                return index
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write(self, index):
+        try:
+            import tempfile
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix='.launcher_apps-')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(index, f)
+                os.replace(tmp, self.path)
+            except Exception:
+                os.unlink(tmp)
+                raise
+        except Exception:
+            pass
+
+    @staticmethod
+    def _parse(app_dir, manifest):
+        try:
+            with open(manifest, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        data['icon'] = os.path.join(app_dir, data.get('icon', 'icon.png'))
+        return data
+
+    def load(self, cfg=None, use_cache=True):
+        """Builtin apps followed by installed apps (sorted by directory name)."""
+        cfg = cfg or default_config
+        fingerprint = config_fingerprint(cfg)
+        index = (self._index or self._read()) if use_cache else None
+        changed = not index or index.get('fingerprint') != fingerprint
+        if changed:
+            index = {'version': INDEX_VERSION, 'fingerprint': fingerprint, 'manifests': {}}
+        old = index['manifests']
+        manifests = {}
+        self.parsed = 0
+
+        apps_dir = cfg.apps_dir
+        entries = []
+        if apps_dir and os.path.isdir(apps_dir):
+            with os.scandir(apps_dir) as it:
+                entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        for entry in entries:
+            manifest = os.path.join(entry.path, 'manifest.json')
+            try:
+                st = os.stat(manifest)
+            except OSError:
+                continue
+            stamp = [st.st_mtime_ns, st.st_size]
+            record = old.get(manifest)
+            if record is None or record['stamp'] != stamp:
+                self.parsed += 1
+                changed = True
+                record = {'stamp': stamp, 'app': self._parse(entry.path, manifest)}
+            manifests[manifest] = record
+        if manifests.keys() != old.keys():
+            changed = True
+
+        index['manifests'] = manifests
+        self._index = index
+        if changed:
+            self._write(index)
+
+        apps = thaw(cfg.builtin_apps or [])
+        apps.extend(dict(r['app']) for r in manifests.values() if r['app'] is not None)
+        return apps
+
+
+app_index = AppIndex()
@@ -0,0 +1,227 @@
+import os
+import time
+import signal
+import shutil
+import threading
+import subprocess
+from arc.core import config
+
+try:
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+
+def session_rss(sessions):
+    """
+    Resident bytes per session id, summed over every process in the session
+    (an app plus anything it started). Empty where /proc is unavailable.
+    """
+    totals = dict.fromkeys(sessions, 0)
+    if not totals:
+        return totals
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return totals
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Fields after the ")" closing the command name: state ppid pgrp session ... rss is #22
+        fields = stat[stat.rfind(b')') + 2:].split()
+        sid = int(fields[3])
+        if sid in totals:
+            totals[sid] += int(fields[21]) * _PAGE_SIZE
+    return totals
+
+
+def _activate_window(pid):
+    """Raise the app's X11 window (best effort, off the UI thread)."""
+    def run():
+        try:
+            if shutil.which('xdotool'):
+                subprocess.run(['xdotool', 'search', '--pid', str(pid), 'windowactivate'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2)
+            elif shutil.which('wmctrl'):
+                listing = subprocess.check_output(['wmctrl', '-lp'], timeout=2).decode()
+                for line in listing.splitlines():
+                    parts = line.split()
+                    if len(parts) > 2 and parts[2] == str(pid):
+                        subprocess.run(['wmctrl', '-ia', parts[0]], timeout=2)
+                        break
+        except Exception:
+            pass
+    threading.Thread(target=run, daemon=True).start()
+
+
+class AppProcess:
+    """An app started from the launcher. `pid` leads its own session."""
+    def __init__(self, key, name, pid, popen=None):
+        self.key = key
+        self.name = name
+        self.pid = pid
+        self.popen = popen
+        self.started = self.last_used = time.monotonic()
+        self.rss = 0
+        self.suspended = False
+
+    def alive(self):
+        if self.popen is not None:
+            return self.popen.poll() is None
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        try:
+            with open(f'/proc/{self.pid}/stat', 'rb') as f:
+                stat = f.read()
+            return stat[stat.rfind(b')') + 2:][:1] != b'Z'
+        except OSError:
+            return True
+
+    def signal(self, sig):
+        try:
+            os.killpg(self.pid, sig)
+        except ProcessLookupError:
+            pass
+        except PermissionError:
+            os.kill(self.pid, sig)
+
+
+class AppManager:
+    """
+    Tracks the apps the launcher started, keyed on their exec command.
+
+    focus(key) brings a running instance back (resuming it if suspended)
+    instead of starting a duplicate. sample() reads each app's resident
+    memory; when the apps that are not in front use more than
+    app_manager.memory_budget_mb, the least recently used ones are
+    suspended (SIGSTOP) or terminated, per app_manager.over_budget.
+    Suspended apps keep their memory, so once the background apps together
+    hold twice the budget the oldest suspended ones are terminated as well.
+
+    sample() scans /proc, so the launcher runs it on the StatusHub thread;
+    the other methods are called from the UI thread and share a lock with it.
+    """
+    def __init__(self):
+        self.apps = {}
+        self.foreground = None
+        self._lock = threading.RLock()
+
+    def track(self, key, name, pid, popen=None):
+        app = AppProcess(key, name, pid, popen)
+        with self._lock:
+            self.apps[key] = app
+            self.foreground = app
+        return app
+
+    def find(self, key):
+        with self._lock:
+            app = self.apps.get(key)
+            if app is not None and not app.alive():
+                self._forget(app)
+                return None
+            return app
+
+    def _forget(self, app):
+        self.apps.pop(app.key, None)
+        if self.foreground is app:
+            self.foreground = None
+
+    def focus(self, key):
+        """Bring a running instance of `key` to the front; False if none is running."""
+        with self._lock:
+            app = self.find(key)
+            if app is None:
+                return False
+            if app.suspended:
+                self.resume(app)
+            app.last_used = time.monotonic()
+            self.foreground = app
+        _activate_window(app.pid)
+        return True
+
+    def launcher_focused(self):
+        """The launcher is in front again; every app now counts as background."""
+        with self._lock:
+            if self.foreground is not None:
+                self.foreground.last_used = time.monotonic()
+            self.foreground = None
+
+    def suspend(self, app):
+        app.signal(signal.SIGSTOP)
+        app.suspended = True
+
+    def resume(self, app):
+        app.signal(signal.SIGCONT)
+        app.suspended = False
+
+    def terminate(self, app):
+        app.signal(signal.SIGTERM)
+        if app.suspended:
+            # A stopped process only acts on SIGTERM once continued
+            app.signal(signal.SIGCONT)
+        self._forget(app)
+
+    def sample(self):
+        """Refresh per-app RSS, enforce the memory budget and return stats()."""
+        with self._lock:
+            apps = list(self.apps.values())
+        # The /proc reads happen outside the lock so focus() never waits on them
+        dead = [app for app in apps if not app.alive()]
+        rss = session_rss(app.pid for app in apps)
+        with self._lock:
+            for app in dead:
+                if self.apps.get(app.key) is app:
+                    self._forget(app)
+            for app in self.apps.values():
+                if app.pid in rss:
+                    app.rss = rss[app.pid]
+            self.enforce()
+        return self.stats()
+
+    def enforce(self):
+        settings = config.app_manager
+        budget = settings.memory_budget_mb * 1024 * 1024
+        # The app in front (or, with the launcher in front, the one used last)
+        # is never a candidate and doesn't count against the budget
+        front = self.foreground or max(self.apps.values(), key=lambda a: a.last_used, default=None)
+        background = sorted((a for a in self.apps.values() if a is not front),
+                            key=lambda a: a.last_used)
+        running = sum(a.rss for a in background if not a.suspended)
+        for app in background:
+            if running <= budget:
+                break
+            if app.suspended:
+                continue
+            running -= app.rss
+            if settings.over_budget == 'terminate':
+                self.terminate(app)
+            else:
+                self.suspend(app)
+
+        held = sum(a.rss for a in background)
+        for app in background:
+            if held <= 2 * budget:
+                break
+            if app.suspended:
+                held -= app.rss
+                self.terminate(app)
+
+    def stats(self):
+        with self._lock:
+            return [
+                {'name': a.name, 'pid': a.pid, 'rss': a.rss, 'suspended': a.suspended,
+                 'foreground': a is self.foreground}
+                for a in self.apps.values()
+            ]
+
+
+app_manager = AppManager()
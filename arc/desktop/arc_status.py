@@ -1,9 +1,104 @@
+import os
 import subprocess
 import platform
+from .bluetooth import bluetooth_status
 
 IS_MACOS = platform.system() == 'Darwin'
 IS_LINUX = platform.system() == 'Linux'
 
+PROC_WIRELESS = '/proc/net/wireless'
+SYS_CLASS_NET = '/sys/class/net'
+POWER_SUPPLY = '/sys/class/power_supply'
+# Link quality that maps to 100%; cfg80211 drivers report quality out of 70
+MAX_LINK_QUALITY = 70
+
+
+def _signal_percent(link, level):
+    if link > 0:
+        return min(100, int(link * 100 / MAX_LINK_QUALITY))
+    if level == 0:
+        return 0
+    if level > 0:
+        # Old wireless-extension drivers report dBm as an unsigned byte
+        level -= 256
+    # -90 dBm (weak) .. -30 dBm (strong), as on macOS
+    return min(100, max(0, int((level + 90) * 100 // 60)))
+
+
+def parse_proc_wireless(text):
+    """
+    Best signal (0-100) among the interfaces listed in /proc/net/wireless
+    text, or None if it lists none.
+    """
+    best = None
+    for line in text.splitlines()[2:]:
+        iface, sep, rest = line.partition(':')
+        fields = rest.split()
+        if not sep or len(fields) < 3:
+            continue
+        try:
+            link = float(fields[1].rstrip('.'))
+            level = float(fields[2].rstrip('.'))
+        except ValueError:
+            continue
+        strength = _signal_percent(link, level)
+        if best is None or strength > best:
+            best = strength
+    return best
+
+
+def proc_wifi_strength(path=PROC_WIRELESS):
+    """Signal from the kernel's wireless statistics; None if unavailable."""
+    try:
+        with open(path) as f:
+            return parse_proc_wireless(f.read())
+    except OSError:
+        return None
+
+
+def sysfs_wifi_strength(root=SYS_CLASS_NET):
+    """
+    0 when sysfs shows no wireless interface that is up (nothing to ask
+    nmcli about); None when one is up and only nmcli can tell its signal.
+    """
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return None
+    for name in names:
+        if not os.path.isdir(os.path.join(root, name, 'wireless')):
+            continue
+        try:
+            with open(os.path.join(root, name, 'operstate')) as f:
+                if f.read().strip() in ('up', 'unknown'):
+                    return None
+        except OSError:
+            return None
+    return 0
+
+
+def nmcli_wifi_strength():
+    try:
+        out = subprocess.check_output([
+            'nmcli', '-t', '-f', 'ACTIVE,SIGNAL',
+            'device', 'wifi', 'list'
+        ], stderr=subprocess.DEVNULL, text=True)
+        for line in out.splitlines():
+            parts = line.split(':')
+            if parts[0] == 'yes' and len(parts) >= 2:
+                try:
+                    return int(parts[1])
+                except ValueError:
+                    continue
+    except Exception:
+        pass
+    return 0
+
+
+# Tried in order until one answers; only the last one forks
+WIFI_PROVIDERS = (proc_wifi_strength, sysfs_wifi_strength, nmcli_wifi_strength)
+
+
 def get_wifi_strength():
     if IS_MACOS:
         # macOS airport utility for WiFi signal strength
@@ -23,20 +118,10 @@ def get_wifi_strength():
             pass
         return 0
     elif IS_LINUX:
-        try:
-            out = subprocess.check_output([
-                'nmcli', '-t', '-f', 'ACTIVE,SIGNAL',
-                'device', 'wifi', 'list'
-            ], stderr=subprocess.DEVNULL, text=True)
-            for line in out.splitlines():
-                parts = line.split(':')
-                if parts[0] == 'yes' and len(parts) >= 2:
-                    try:
-                        return int(parts[1])
-                    except ValueError:
-                        continue
-        except Exception:
-            pass
+        for provider in WIFI_PROVIDERS:
+            strength = provider()
+            if strength is not None:
+                return strength
         return 0
     return 0
 
@@ -61,27 +146,24 @@ def get_bt_status():
         except Exception:
             return 0
     elif IS_LINUX:
-        try:
-            out = subprocess.check_output(['bluetoothctl', 'show'], stderr=subprocess.DEVNULL, text=True)
-            powered = False
-            for line in out.splitlines():
-                if line.strip().startswith("Powered:"):
-                    powered = "yes" in line
-                    break
-            if not powered:
-                return 0  # OFF
+        # Answered from the long-lived bluetoothctl session, no processes per call
+        return bluetooth_status.status()
+    return 0
 
-            out = subprocess.check_output(['bluetoothctl', 'devices'], stderr=subprocess.DEVNULL, text=True)
-            for line in out.splitlines():
-                parts = line.split()
-                if len(parts) >= 2:
-                    addr = parts[1]
-                    info = subprocess.check_output(['bluetoothctl', 'info', addr], stderr=subprocess.DEVNULL, text=True)
-                    for il in info.splitlines():
-                        if il.strip().startswith("Connected:") and "yes" in il:
-                            return 2  # CONNECTED
-
-            return 1  # ON, but not connected
-        except Exception:
-            return 0  # If any error, treat as OFF
-    return 0
\ No newline at end of file
+
+def get_battery_level(root=POWER_SUPPLY):
+    """Charge (0-100) of the first battery in sysfs; None without one."""
+    try:
+        names = sorted(os.listdir(root))
+    except OSError:
+        return None
+    for name in names:
+        try:
+            with open(os.path.join(root, name, 'type')) as f:
+                if f.read().strip() != 'Battery':
+                    continue
+            with open(os.path.join(root, name, 'capacity')) as f:
+                return max(0, min(100, int(f.read().strip())))
+        except (OSError, ValueError):
+            continue
+    return None
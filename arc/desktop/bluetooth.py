@@ -0,0 +1,194 @@
+import os
+import re
+import time
+import shlex
+import threading
+import subprocess
+from arc.core import get_logger
+
+log = get_logger('bluetooth')
+
+OFF, ON, CONNECTED = 0, 1, 2
+RESTART_DELAY = 30.0  # seconds between attempts to restart a dead session
+
+_ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]|[\x01\x02\r]')
+_PROMPT_RE = re.compile(r'^(\[[^\]]*\][#>]\s*)+')
+_ADDR_RE = re.compile(r'^[0-9A-Fa-f]{2}(:[0-9A-Fa-f]{2}){5}$')
+
+
+def default_command():
+    """bluetoothctl, or the command in ARC_BLUETOOTHCTL (e.g. a scripted fake)."""
+    return shlex.split(os.environ.get('ARC_BLUETOOTHCTL', 'bluetoothctl'))
+
+
+class BluetoothStatus:
+    """
+    Bluetooth state from one long-lived `bluetoothctl` session.
+
+    On start the session is asked for `show`, `devices` and `info <addr>`
+    for each device; after that the `[CHG] Controller ... Powered:` and
+    `[CHG] Device ... Connected:` notifications bluetoothctl prints keep the
+    state current. status() answers from memory. on_change(status) is called
+    from the reader thread whenever the status changes.
+    """
+    def __init__(self, command=None):
+        self.command = command or default_command()
+        self.proc = None
+        self.on_change = None
+        self.controllers = {}     # address -> powered
+        self.connected = set()    # device addresses
+        self._queried = set()
+        self._pending = set()     # `info` requests not answered yet
+        self._shown = False
+        self._subject = None
+        self._status = OFF
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._last_start = None
+
+    def start(self, timeout=2.0):
+        """Start the session and wait up to `timeout` for the initial state."""
+        with self._lock:
+            if self.proc is not None and self.proc.poll() is None:
+                return True
+            now = time.monotonic()
+            if self._last_start is not None and now - self._last_start < RESTART_DELAY:
+                return False
+            self._last_start = now
+            self.controllers.clear()
+            self.connected.clear()
+            self._queried.clear()
+            self._pending.clear()
+            self._shown = False
+            self._subject = None
+            self._ready.clear()
+            try:
+                self.proc = subprocess.Popen(
+                    self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL, text=True, bufsize=1
+                )
+            except OSError as e:
+                log.warning("Could not start %s: %s", self.command[0], e)
+                self.proc = None
+                return False
+            threading.Thread(target=self._read, args=(self.proc,), daemon=True).start()
+            # bluetoothctl answers in order: the device list, then the controller,
+            # then the `info` requests the list triggered
+            self._send('devices')
+            self._send('show')
+        self._ready.wait(timeout)
+        return True
+
+    def status(self):
+        """0 = off, 1 = on, 2 = on with at least one device connected."""
+        if self.proc is None or self.proc.poll() is not None:
+            self.start()
+        return self._status
+
+    def close(self):
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.write('quit\n')
+            proc.stdin.close()
+            proc.wait(timeout=1)
+        except Exception:
+            proc.kill()
+
+    def _send(self, command):
+        try:
+            self.proc.stdin.write(command + '\n')
+            self.proc.stdin.flush()
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def _read(self, proc):
+        for line in proc.stdout:
+            self.feed(line)
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+        self._ready.set()
+        self._update()
+
+    def feed(self, line):
+        """Parse one line of bluetoothctl output."""
+        line = _PROMPT_RE.sub('', _ANSI_RE.sub('', line)).strip()
+        if not line:
+            return
+        if line.startswith('No default controller'):
+            self._shown = True
+            self._ready.set()
+            return
+        parts = line.split()
+        if parts[0] in ('[CHG]', '[NEW]', '[DEL]'):
+            if len(parts) < 3 or not _ADDR_RE.match(parts[2]):
+                return
+            kind, addr = parts[1], parts[2]
+            if parts[0] == '[DEL]':
+                if kind == 'Device':
+                    self.connected.discard(addr)
+                    self._queried.discard(addr)
+                    self._pending.discard(addr)
+                else:
+                    self.controllers.pop(addr, None)
+            elif parts[0] == '[NEW]':
+                if kind == 'Controller':
+                    self._send('show')
+                else:
+                    self._query(addr)
+            else:
+                self._property(kind, addr, parts[3:])
+        elif parts[0] in ('Controller', 'Device') and len(parts) > 1 and _ADDR_RE.match(parts[1]):
+            # Header of `show` / `info`, or a `devices` listing line
+            self._subject = (parts[0], parts[1])
+            if parts[0] == 'Device':
+                if line.endswith('not available'):
+                    self._pending.discard(parts[1])
+                else:
+                    self._query(parts[1])
+            else:
+                self.controllers.setdefault(parts[1], False)
+        elif self._subject is not None and parts[0].endswith(':'):
+            self._property(*self._subject, parts)
+        else:
+            return
+        if self._shown and not self._pending:
+            self._ready.set()
+        self._update()
+
+    def _query(self, addr):
+        if addr not in self._queried:
+            self._queried.add(addr)
+            self._pending.add(addr)
+            self._send(f'info {addr}')
+
+    def _property(self, kind, addr, words):
+        if len(words) < 2:
+            return
+        key, value = words[0], words[1] == 'yes'
+        if kind == 'Controller' and key == 'Powered:':
+            self.controllers[addr] = value
+            self._shown = True
+        elif kind == 'Device' and key == 'Connected:':
+            self._pending.discard(addr)
+            if value:
+                self.connected.add(addr)
+            else:
+                self.connected.discard(addr)
+
+    def _update(self):
+        alive = self.proc is not None and self.proc.poll() is None
+        if not alive or not any(self.controllers.values()):
+            status = OFF
+        else:
+            status = CONNECTED if self.connected else ON
+        if status != self._status:
+            self._status = status
+            if self.on_change:
+                self.on_change(status)
+
+
+bluetooth_status = BluetoothStatus()
@@ -4,7 +4,9 @@ import subprocess
 import time
 import sys
 import os
-from arc.core import config, ScrollableList, MessageBox
+from arc.core import config, ScrollableList, MessageBox, get_font, get_logger
+
+log = get_logger('bluetooth')
 
 def safe_color(val, fallback):
     # Accept list/tuple of 3 ints as color
@@ -30,7 +32,7 @@ class BluetoothMenu:
 
         self.active = True
         self.rect = pygame.Rect(0, getattr(config.topbar, "height", 30), self.WIDTH, self.HEIGHT - getattr(config.topbar, "height", 30))
-        self.font = pygame.font.SysFont(self.FONT_NAME, self.FONT_SIZE)
+        self.font = get_font(self.FONT_NAME, self.FONT_SIZE)
         self.devices = ['<scanning...>']
         self.scanning = False
         self.selected_addr = None
@@ -89,7 +91,7 @@ class BluetoothMenu:
                     found.append(f"{name} ({addr})")
             return found or ['<no devices found>']
         except Exception as e:
-            print("Bluetooth scan failed:", e)
+            log.warning("Bluetooth scan failed: %s", e)
             return ['<scan failed>']
 
     def on_select_device(self, selection):
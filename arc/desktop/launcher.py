@@ -5,73 +5,38 @@ Main application launcher for the ARC Desktop Environment
 
 import pygame
 import os
-import json
 import subprocess
 import time
 import platform
-import threading
 
 # Change to project root
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
 os.chdir(project_root)
 
 # Import ARC modules
-from arc.core import config, AppIcon, TabManager, Slider
+from arc.core import (
+    config, ConfigWatcher, AppIcon, TabManager, Slider, font_registry, DirtyRegions,
+    FrameProfiler, RunLoop, icon_atlas, text_cache, LaunchReadiness, get_logger,
+    configure_logging
+)
+from arc.core import zygote
+from arc.core.readiness import READY_ENV
 from arc.desktop import (
     show_loading_screen, AudioLevelSlider, TopBar, WifiMenu,
-    BluetoothMenu, StatusPoller, get_wifi_strength, get_bt_status
+    BluetoothMenu, StatusHub, get_wifi_strength, get_bt_status, get_battery_level,
+    app_index, PageCache, VolumeService, app_manager, bluetooth_status
 )
 
 # Detect platform
 IS_MACOS = platform.system() == 'Darwin'
 IS_LINUX = platform.system() == 'Linux'
 
-# Volume widget - Platform aware
-def get_alsa_volume():
-    if IS_MACOS:
-        try:
-            # Use osascript for macOS volume control
-            output = subprocess.check_output(
-                ["osascript", "-e", "output volume of (get volume settings)"],
-                stderr=subprocess.DEVNULL
-            ).decode().strip()
-            return int(float(output))
-        except Exception:
-            pass
-        return 50
-    elif IS_LINUX:
-        try:
-            output = subprocess.check_output(
-                ["amixer", "get", "Master"], stderr=subprocess.DEVNULL
-            ).decode()
-            import re
-            m = re.search(r'\[(\d+)%\]', output)
-            if m:
-                return int(m.group(1))
-        except Exception:
-            pass
-        return 50
-    return 50
-
-def set_alsa_volume(val):
-    val = max(0, min(100, int(val)))
-    if IS_MACOS:
-        try:
-            subprocess.call(
-                ["osascript", "-e", f"set volume output volume {val}"],
-                stderr=subprocess.DEVNULL
-            )
-        except Exception:
-            pass
-    elif IS_LINUX:
-        try:
-            subprocess.call(["amixer", "set", "Master", f"{val}%"], stderr=subprocess.DEVNULL)
-        except Exception:
-            pass
+# Cached output volume; the mixer is written at most once per frame
+volume = VolumeService()
 
 volume_overlay = {
     "visible": False,
-    "level": get_alsa_volume(),
+    "level": volume.level,
     "last_shown": 0,
 }
 VOLUME_OVERLAY_DURATION = 0.5  # seconds
@@ -118,103 +83,122 @@ else:
         (config.screen.width, config.screen.height),
         pygame.FULLSCREEN
     )
-clock = pygame.time.Clock()
 pygame.display.set_caption('ARC Launcher')
+font_registry.preload()
+loop = RunLoop(fps=30)
+# Pre-imported interpreter that app launches fork from (launches fall back to
+# a fresh process until it is listening)
+zygote.start(cwd=project_root)
 
 def on_volume_change(val):
-    set_alsa_volume(val)
-    volume_overlay["level"] = val
+    volume_overlay["level"] = volume.set(val)
     volume_overlay["visible"] = True
     volume_overlay["last_shown"] = time.time()
+    loop.animate(VOLUME_OVERLAY_DURATION)
 
 volume_slider = Slider(
     rect=(50, config.screen.height - 60, 300, 8),
-    min_val=0, max_val=100, init_val=get_alsa_volume(), callback=on_volume_change
+    min_val=0, max_val=100, init_val=volume.level, callback=on_volume_change
 )
 
-CACHE_PATH = os.path.expanduser(os.path.join('~', '.cache', 'launcher_apps.json'))
-
-def load_apps():
-    if os.path.isfile(CACHE_PATH):
-        try:
-            with open(CACHE_PATH, 'r') as f:
-                return json.load(f)
-        except Exception:
-            pass
-    apps = list(config.builtin_apps)
-    apps_dir = config.apps_dir
-    if os.path.isdir(apps_dir):
-        for entry in os.scandir(apps_dir):
-            if not entry.is_dir():
-                continue
-            manifest = os.path.join(entry.path, 'manifest.json')
-            if not os.path.isfile(manifest):
-                continue
-            try:
-                with open(manifest, 'r') as f:
-                    data = json.load(f)
-            except json.JSONDecodeError:
-                continue
-            icon = os.path.join(entry.path, data.get('icon', 'icon.png'))
-            data['icon'] = icon
-            apps.append(data)
+def load_apps(use_cache=True):
+    return app_index.load(config, use_cache=use_cache)
+
+# Launches are logged through the background writer; nothing here touches the disk
+LAUNCH_LOG = os.path.join(project_root, 'launcher.log')
+configure_logging(path=os.environ.get('ARC_LOG_FILE') or LAUNCH_LOG,
+                  level=os.environ.get('ARC_LOG_LEVEL') or 'INFO')
+log = get_logger('launcher')
+READY_TIMEOUT = 10.0  # seconds the loading screen waits for an app's first frame
+
+def launch_app(cmd, name=''):
+    """
+    Launch an app, ensuring we run from the project root directory.
+    Returns a LaunchReadiness for ARC apps (they report their first frame),
+    True when a running instance was focused instead, None otherwise.
+    """
+    if config.app_manager.single_instance and app_manager.focus(cmd):
+        return True
+    ready = None
     try:
-        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
-        with open(CACHE_PATH, 'w') as f:
-            json.dump(apps, f)
-    except Exception:
-        pass
-    return apps
-
-def launch_app(cmd):
-    """Launch an app, ensuring we run from the project root directory"""
-    try:
-        # Log the launch attempt
-        log_path = os.path.join(project_root, 'launcher.log')
-        with open(log_path, 'a') as log:
-            log.write(f'\n=== Launching at {time.strftime("%Y-%m-%d %H:%M:%S")} ===\n')
-            log.write(f'Command: {cmd}\n')
-            log.write(f'Working directory: {project_root}\n')
-        
+        log.info("Launching %s (cwd %s)", cmd, project_root)
+
+        # ARC apps are forked from the zygote when it is up
+        target = zygote.parse_module_command(cmd)
+        if target:
+            ready = LaunchReadiness()
+            pid = zygote.spawn(target[0], target[1], cwd=project_root,
+                               extra_fds={READY_ENV: ready.fd})
+            if pid is not None:
+                ready.started()
+                app_manager.track(cmd, name, pid)
+                return ready
+
         # Launch the app with proper environment
-        subprocess.Popen(
+        proc = subprocess.Popen(
             cmd,
             shell=True,
             cwd=project_root,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.STDOUT,
-            start_new_session=True
+            start_new_session=True,
+            env=ready.child_env() if ready else None,
+            pass_fds=(ready.fd,) if ready else ()
         )
+        app_manager.track(cmd, name, proc.pid, proc)
+        if ready:
+            ready.started()
+        return ready
     except Exception as e:
-        print(f'Launch failed: {cmd}')
-        print(f'Error: {e}')
-        try:
-            with open(log_path, 'a') as log:
-                log.write(f'ERROR: {e}\n')
-        except:
-            pass
+        if ready:
+            ready.close()
+        log.error("Launch failed: %s: %s", cmd, e)
+
+def log_launch_latency(name, ready):
+    """Record how long an app took to present its first frame."""
+    if ready.latency is not None:
+        log.info("First frame: %s after %.0f ms", name, ready.latency * 1000)
+    elif ready.done:
+        log.warning("First frame: %s exited without drawing", name)
+    else:
+        log.warning("First frame: %s not seen within %.0f s", name, READY_TIMEOUT)
+    ready.close()
+
+def open_app(cmd, name=''):
+    """Launch (or focus) an app from the grid, holding the loading screen until it draws."""
+    global need_redraw
+    ready = launch_app(cmd, name)
+    if ready is True:
+        return  # already running: brought to the front, nothing to wait for
+    if ready:
+        # Stay up until the app's first frame, not a fixed second
+        show_loading_screen(screen, message="Starting app...",
+                            duration=READY_TIMEOUT, until=ready.poll)
+        log_launch_latency(name, ready)
+    else:
+        show_loading_screen(screen, message="Starting app...", duration=1.0)
+    need_redraw = True
 
 def paginate_apps(apps):
     per_page = config.grid.cols * config.grid.rows
     return [apps[i:i + per_page] for i in range(0, len(apps), per_page)]
 
-def build_page_icons(app_list):
-    icons = []
+def build_app_icon(app, idx):
     pad = config.grid.padding + 10
-    for idx, app in enumerate(app_list):
-        row, col = divmod(idx, config.grid.cols)
-        x = config.grid.x_offset + pad + col * (config.cell.width + config.grid.margin)
-        y = config.grid.y_offset + config.topbar.height + pad + row * (config.cell.height + config.grid.margin)
-        rect = (x, y, config.cell.width, config.cell.height)
-        icons.append(AppIcon(
-            app.get('name', ''), app.get('icon', ''), rect,
-            lambda c=app.get('exec', ''): launch_app(c)
-        ))
-    return icons
+    row, col = divmod(idx, config.grid.cols)
+    x = config.grid.x_offset + pad + col * (config.cell.width + config.grid.margin)
+    y = config.grid.y_offset + config.topbar.height + pad + row * (config.cell.height + config.grid.margin)
+    rect = (x, y, config.cell.width, config.cell.height)
+    return AppIcon(
+        app.get('name', ''), app.get('icon', ''), rect,
+        lambda c=app.get('exec', ''), n=app.get('name', ''): open_app(c, n)
+    )
 
 all_apps = load_apps()
 pages = paginate_apps(all_apps)
-pages_icons = [build_page_icons(p) for p in pages]
+# Icons are built per page when first shown; neighbours are prefetched when idle
+page_cache = PageCache(build_app_icon, config.render_cache.icon_bytes, loop)
+page_cache.set_pages(pages)
 tab_names = [f"Page {i + 1}" for i in range(len(pages))]
 tab_manager = TabManager(tab_names)
 wifi_menu = WifiMenu(screen)
@@ -223,76 +207,122 @@ bt_menu.active = False
 current_page = 0
 sel_index = 0
 
-class ChangeDetectingPoller:
-    def __init__(self, func, interval=2):
-        self.func = func
-        self.interval = interval
-        self.last_val = None
-        self.on_change = None
-        self.value = None
-        self._stop_event = threading.Event()
-        self.thread = threading.Thread(target=self._run, daemon=True)
-
-    def start(self):
-        self.thread.start()
-
-    def stop(self):
-        self._stop_event.set()
-
-    def get(self):
-        return self.value
-
-    def _run(self):
-        while not self._stop_event.is_set():
-            val = self.func()
-            self.value = val
-            if val != self.last_val:
-                if self.on_change:
-                    self.on_change(val)
-                self.last_val = val
-            time.sleep(self.interval)
-
+# need_redraw repaints the whole screen; smaller changes go through `dirty`
 need_redraw = True
-
-def trigger_redraw(_=None):
-    global need_redraw
+topbar_dirty = False
+dirty = DirtyRegions(screen.get_size())
+
+def draw_scene(rect):
+    """Repaint the launcher page inside rect."""
+    screen.set_clip(rect)
+    screen.fill(config.colors.background, rect)
+    if rect.colliderect((0, 0, config.screen.width, config.topbar.height)):
+        topbar.draw(screen)
+    tab_manager.draw(screen)
+    for icon in current_icons:
+        if icon.hovered or rect.collidelist(icon.dirty_rects(screen)) != -1:
+            icon.draw(screen)
+    if volume_overlay["visible"]:
+        draw_volume_overlay(screen, volume_overlay["level"])
+    screen.set_clip(None)
+
+# One thread polls every status source; new values arrive as STATUS_CHANGED events
+status = StatusHub()
+status.add('wifi', get_wifi_strength, interval=5, initial=0)
+# Bluetooth is answered from memory; the session also pushes changes as they happen
+status.add('bluetooth', get_bt_status, interval=5, initial=0)
+bluetooth_status.on_change = lambda value: status.push('bluetooth', value)
+status.add('volume', volume.sample, interval=15)
+status.add('battery', get_battery_level, interval=60)
+# Sample background app memory and suspend/terminate over the budget (reads /proc)
+status.add('apps', app_manager.sample, interval=config.app_manager.sample_interval)
+status.start()
+
+topbar = TopBar(wifi_menu=wifi_menu, bt_menu=bt_menu, status=status)
+
+# Sections whose change invalidates the icon grid / the top bar / the tabs
+LAYOUT_SECTIONS = {'grid', 'cell', 'colors', 'radius', 'accent_color', 'font', 'topbar'}
+APP_SECTIONS = {'builtin_apps', 'apps_dir'}
+TOPBAR_SECTIONS = {'topbar', 'screen'}
+TAB_SECTIONS = {'tab', 'indicator', 'screen', 'colors'}
+
+def rebuild_pages(reuse=True):
+    """Re-paginate the apps, keeping built pages whose app list is unchanged."""
+    global all_apps, pages
+    all_apps = load_apps()
+    pages = paginate_apps(all_apps)
+    page_cache.set_pages(pages, reuse=reuse)
+
+def on_config_change(cfg, changed):
+    global topbar, tab_manager, current_icons, need_redraw
+    page_count = len(pages)
+    if changed & LAYOUT_SECTIONS:
+        rebuild_pages(reuse=False)
+    elif changed & APP_SECTIONS:
+        rebuild_pages(reuse=True)
+    if changed & TOPBAR_SECTIONS:
+        topbar = TopBar(wifi_menu=wifi_menu, bt_menu=bt_menu, status=status)
+    if changed & TAB_SECTIONS or len(pages) != page_count:
+        active = tab_manager.get_active_index()
+        tab_manager = TabManager([f"Page {i + 1}" for i in range(len(pages))])
+        tab_manager.active = max(0, min(active, len(pages) - 1))
+    current_icons = page_cache.get(tab_manager.get_active_index())
     need_redraw = True
 
-wifi_poller = ChangeDetectingPoller(get_wifi_strength, interval=5)
-wifi_poller.on_change = trigger_redraw
-bt_poller = ChangeDetectingPoller(get_bt_status, interval=5)
-bt_poller.on_change = trigger_redraw
-wifi_poller.start()
-bt_poller.start()
+def on_render_cache_change(cfg, changed):
+    # Shrinking a budget evicts right away
+    text_cache.set_budget(cfg.render_cache.text_bytes)
+    page_cache.set_budget(cfg.render_cache.icon_bytes)
 
-topbar = TopBar(wifi_menu=wifi_menu, bt_menu=bt_menu, wifi_poller=wifi_poller, bt_poller=bt_poller)
+config_watcher = ConfigWatcher()
+config_watcher.subscribe(on_config_change,
+                         LAYOUT_SECTIONS | APP_SECTIONS | TOPBAR_SECTIONS | TAB_SECTIONS)
+config_watcher.subscribe(on_render_cache_change, {'render_cache'})
+# Also wakes the loop once a second, which is when the clock text is checked
+loop.call_every(config_watcher.interval, config_watcher.poll)
+# Persist newly baked icons (no-op unless the atlas changed); atexit won't run on SIGTERM
+loop.call_every(30, icon_atlas.save)
+
+shown_page = None
+profiler = FrameProfiler('launcher')
 
 running = True
 while running:
-    for ev in pygame.event.get():
+    # Sleeps until input, a timer, a status change or an animation deadline
+    events = loop.wait()
+    profiler.begin_frame()
+    if loop.dirty and (wifi_menu.active or bt_menu.active):
+        # Menu refresh tick: scan results arrive from background threads
+        need_redraw = True
+
+    for ev in events:
         if ev.type == pygame.QUIT:
             running = False
             break
+        if profiler.handle_event(ev):
+            need_redraw = True
+            continue
+        if status.handle_event(ev):
+            continue
+        if ev.type == pygame.WINDOWFOCUSGAINED:
+            app_manager.launcher_focused()
+            need_redraw = True
         keys = pygame.key.get_pressed()
         # --- Volume key handling ---
         if ev.type == pygame.KEYDOWN:
             mods = pygame.key.get_mods()
             if ev.key == pygame.K_UP and mods & pygame.KMOD_ALT:
-                vol = get_alsa_volume()
-                vol = min(100, vol + 5)
-                set_alsa_volume(vol)
-                volume_overlay["level"] = vol
+                volume_overlay["level"] = volume.step(5)
                 volume_overlay["visible"] = True
                 volume_overlay["last_shown"] = time.time()
+                loop.animate(VOLUME_OVERLAY_DURATION)
                 need_redraw = True
                 continue
-            if ev.key == pygame.K_DOWN and ev.key == pygame.KMOD_ALT:
-                vol = get_alsa_volume()
-                vol = max(0, vol - 5)
-                set_alsa_volume(vol)
-                volume_overlay["level"] = vol
+            if ev.key == pygame.K_DOWN and mods & pygame.KMOD_ALT:
+                volume_overlay["level"] = volume.step(-5)
                 volume_overlay["visible"] = True
                 volume_overlay["last_shown"] = time.time()
+                loop.animate(VOLUME_OVERLAY_DURATION)
                 need_redraw = True
                 continue
 
@@ -334,13 +364,12 @@ while running:
             continue
 
         current_page = tab_manager.get_active_index()
-        current_icons = pages_icons[current_page] if pages_icons else []
+        current_icons = page_cache.get(current_page)
         sel_index = max(0, min(sel_index, len(current_icons) - 1))
 
         if ev.type == pygame.KEYDOWN:
             if ev.key == pygame.K_LEFT and sel_index % config.grid.cols > 0:
                 sel_index -= 1
-                need_redraw = True
             elif ev.key == pygame.K_q and (ev.mod & pygame.KMOD_CTRL):
                 running = False
                 pygame.quit()
@@ -348,14 +377,12 @@ while running:
             elif ev.key == pygame.K_RIGHT and sel_index % config.grid.cols < config.grid.cols - 1 \
                     and sel_index + 1 < len(current_icons):
                 sel_index += 1
-                need_redraw = True
             elif ev.key == pygame.K_UP:
                 if sel_index // config.grid.cols > 0:
                     sel_index -= config.grid.cols
                 else:
                     tab_manager.active = max(0, current_page - 1)
                     sel_index = 0
-                need_redraw = True
             elif ev.key == pygame.K_DOWN:
                 if sel_index // config.grid.cols < config.grid.rows - 1 \
                         and sel_index + config.grid.cols < len(current_icons):
@@ -363,41 +390,89 @@ while running:
                 else:
                     tab_manager.active = min(len(pages) - 1, current_page + 1)
                     sel_index = 0
-                need_redraw = True
             elif ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER) and current_icons:
                 idx = current_page * config.grid.cols * config.grid.rows + sel_index
-                show_loading_screen(screen, message="Starting app...", duration=1.0)
-                launch_app(all_apps[idx].get('exec', ''))
-                need_redraw = True
+                app = all_apps[idx]
+                open_app(app.get('exec', ''), app.get('name', ''))
 
         tab_manager.handle_event(ev)
-        for icon in current_icons:
-            icon.handle_event(ev)
+        # Hover follows the keyboard selection, so pointer motion changes nothing
+        if ev.type != pygame.MOUSEMOTION:
+            for icon in current_icons:
+                icon.handle_event(ev)
+
+    if not running:
+        break
+    for name in status.take_changes():
+        if name == 'volume':
+            volume_overlay["level"] = volume.observe(status.get('volume'))
+        elif name != 'apps':
+            topbar_dirty = True
+    volume.flush()
+    profiler.mark('event')
+
+    # --- Work out what changed since the last frame ---
+    current_page = tab_manager.get_active_index()
+    current_icons = page_cache.get(current_page)
+    sel_index = max(0, min(sel_index, len(current_icons) - 1))
+    if current_page != shown_page:
+        shown_page = current_page
+        page_cache.prefetch(current_page)
+        need_redraw = True
+    for idx, icon in enumerate(current_icons):
+        if icon.set_hovered(idx == sel_index):
+            for rect in icon.dirty_rects(screen):
+                dirty.invalidate(rect)
+    if topbar.stale():
+        # Clock minute rolled over (or a status value changed)
+        topbar_dirty = True
+    if topbar_dirty:
+        dirty.invalidate((0, 0, config.screen.width, config.topbar.height))
+        topbar_dirty = False
+    if (volume_overlay["visible"] and
+            (time.time() - volume_overlay["last_shown"]) >= VOLUME_OVERLAY_DURATION):
+        volume_overlay["visible"] = False
         need_redraw = True
-
     if need_redraw:
-        screen.fill(config.colors.background)
-        if wifi_menu.active:
-            wifi_menu.update()
-            wifi_menu.draw()
-        elif bt_menu.active:
-            bt_menu.update()
-            bt_menu.draw()
-        else:
-            topbar.draw(screen)
-            tab_manager.draw(screen)
-            for idx, icon in enumerate(current_icons):
-                icon.hovered = (idx == sel_index)
-                icon.draw(screen)
-        if (volume_overlay["visible"] and
-                (time.time() - volume_overlay["last_shown"]) < VOLUME_OVERLAY_DURATION):
-            draw_volume_overlay(screen, volume_overlay["level"])
-        else:
-            volume_overlay["visible"] = False
-        pygame.display.flip()
+        dirty.invalidate()
         need_redraw = False
-
-    clock.tick(30)
-
+    if wifi_menu.active or bt_menu.active:
+        # Keep the connecting animation moving; otherwise refresh occasionally
+        loop.animate(None if wifi_menu.connecting else 0.5)
+    if not dirty:
+        loop.frame_done()
+        continue
+    if profiler.overlay_visible and profiler.enabled:
+        dirty.invalidate(profiler.overlay_rect(screen))
+    profiler.mark('update')
+
+    # --- Repaint only the invalidated regions ---
+    if wifi_menu.active or bt_menu.active:
+        # Menus paint the whole screen; partial updates wait until they close
+        if dirty.full:
+            screen.fill(config.colors.background)
+            if wifi_menu.active:
+                wifi_menu.update()
+                wifi_menu.draw()
+            else:
+                bt_menu.update()
+                bt_menu.draw()
+            if volume_overlay["visible"]:
+                draw_volume_overlay(screen, volume_overlay["level"])
+        else:
+            dirty.clear()
+    else:
+        for rect in dirty.rects():
+            draw_scene(rect)
+    profiler.draw_overlay(screen)
+    profiler.mark('draw')
+    dirty.present()
+    profiler.mark('flip')
+    profiler.end_frame()
+    loop.frame_done()
+
+status.stop()
+volume.close()
+bluetooth_status.close()
 pygame.quit()
 
@@ -1,7 +1,11 @@
 import pygame
 import time
 
-def show_loading_screen(screen, message="Loading...", duration=1.0):
+def show_loading_screen(screen, message="Loading...", duration=1.0, until=None):
+    """
+    Show `message` for `duration` seconds, or, if `until` is given, until
+    until() returns True with `duration` as the time limit.
+    """
     # Fill the screen with a background color
     screen.fill((30, 30, 30))
 
@@ -19,4 +23,6 @@ def show_loading_screen(screen, message="Loading...", duration=1.0):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 exit()
+        if until is not None and until():
+            break
         time.sleep(0.01)
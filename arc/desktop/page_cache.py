@@ -0,0 +1,123 @@
+from collections import OrderedDict, deque
+
+
+def surface_bytes(surf):
+    w, h = surf.get_size()
+    return w * h * surf.get_bytesize()
+
+
+def icon_bytes(icon):
+    """
+    Pixel memory owned by an AppIcon: its retained state surfaces, plus the
+    scaled image unless that is a view into the shared icon atlas (which
+    keeps its pixels whether or not the page is cached).
+    """
+    total = 0 if icon.icon.get_parent() is not None else surface_bytes(icon.icon)
+    for surf in icon._surfaces or ():
+        total += surface_bytes(surf)
+    return total
+
+
+class PageCache:
+    """
+    Builds launcher pages of AppIcons on demand.
+
+    get(i) builds page i synchronously (only the visible page pays for
+    image loading before the first frame); prefetch(i) queues the
+    neighbouring pages, which are built one icon per idle RunLoop slice so
+    input is handled in between. Least recently used pages are dropped
+    once the estimated pixel memory goes over `max_bytes`; the active page
+    and its neighbours are never evicted.
+    """
+    def __init__(self, build_icon, max_bytes, loop=None):
+        self.build_icon = build_icon      # build_icon(app, slot) -> AppIcon
+        self.max_bytes = max_bytes
+        self.loop = loop
+        self.pages = []
+        self._built = OrderedDict()       # page index -> [AppIcon]
+        self._queue = deque()
+        self._scheduled = False
+        self._active = 0
+
+    def __len__(self):
+        return len(self.pages)
+
+    def set_pages(self, pages, reuse=True):
+        """Replace the page layout, keeping built pages whose app list is unchanged."""
+        kept = OrderedDict()
+        if reuse:
+            for i, icons in self._built.items():
+                if i < len(pages) and i < len(self.pages) and pages[i] == self.pages[i] \
+                        and len(icons) == len(pages[i]):
+                    kept[i] = icons
+        self.pages = pages
+        self._built = kept
+        self._queue.clear()
+        if pages:
+            # The old queue referred to the old layout; warm the active page's neighbours again
+            self.prefetch(min(self._active, len(pages) - 1))
+
+    def is_built(self, index):
+        icons = self._built.get(index)
+        return icons is not None and len(icons) == len(self.pages[index])
+
+    def get(self, index):
+        if not 0 <= index < len(self.pages):
+            return []
+        icons = self._built.setdefault(index, [])
+        self._built.move_to_end(index)
+        page = self.pages[index]
+        if self._active != index or len(icons) < len(page):
+            self._active = index
+            while len(icons) < len(page):
+                icons.append(self.build_icon(page[len(icons)], len(icons)))
+            self._evict()
+        return icons
+
+    def prefetch(self, index):
+        """Build the pages either side of `index` in the background."""
+        for i in (index + 1, index - 1):
+            if 0 <= i < len(self.pages) and not self.is_built(i) and i not in self._queue:
+                self._queue.append(i)
+        if self._queue and self.loop is not None and not self._scheduled:
+            self._scheduled = True
+            self.loop.call_later(0, self._step)
+
+    def _step(self):
+        self._scheduled = False
+        while self._queue and self.is_built(self._queue[0]):
+            self._queue.popleft()
+        if not self._queue:
+            return
+        index = self._queue[0]
+        icons = self._built.setdefault(index, [])
+        self._built.move_to_end(index, last=False)
+        page = self.pages[index]
+        icons.append(self.build_icon(page[len(icons)], len(icons)))
+        if len(icons) == len(page):
+            self._queue.popleft()
+            self._evict()
+        if self._queue:
+            self._scheduled = True
+            self.loop.call_later(0, self._step)
+
+    def bytes(self):
+        return sum(icon_bytes(icon) for icons in self._built.values() for icon in icons)
+
+    def _evict(self):
+        keep = {self._active - 1, self._active, self._active + 1}
+        total = self.bytes()
+        for index in list(self._built):
+            if total <= self.max_bytes:
+                break
+            if index in keep:
+                continue
+            total -= sum(icon_bytes(icon) for icon in self._built.pop(index))
+
+    def set_budget(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def stats(self):
+        return {'pages': len(self.pages), 'built': len(self._built), 'bytes': self.bytes(),
+                'max_bytes': self.max_bytes}
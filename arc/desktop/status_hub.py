@@ -0,0 +1,163 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+import pygame
+from arc.core import get_logger
+
+log = get_logger('status')
+
+# Posted to wake the UI loop after a source reported a new value
+STATUS_CHANGED = pygame.event.custom_type()
+
+
+class StatusSource:
+    def __init__(self, name, poll, interval, max_interval, initial=None):
+        self.name = name
+        self.poll = poll
+        self.interval = interval
+        self.max_interval = max_interval
+        self.value = initial
+        self.failures = 0
+        self.due = None
+
+
+class StatusHub:
+    """
+    One scheduler thread for every status source (Wi-Fi, Bluetooth,
+    volume, ...):
+
+        hub = StatusHub()
+        hub.add('wifi', get_wifi_strength, interval=5)
+        hub.start()
+        ...
+        for ev in events:
+            hub.handle_event(ev)         # swallow the wake-up events
+        for name in hub.take_changes():  # sources with a new value
+            ...redraw the top bar...
+        hub.get('wifi')
+
+    A source whose poll raises is retried after interval * 2**failures (up
+    to max_interval). Every delay gets +-`jitter` spread so sources that
+    fork don't end up running at the same moment. A new value is stored
+    here and a STATUS_CHANGED event wakes the UI loop. The event carries no
+    data, so a modal loop that eats it (a loading screen) loses nothing:
+    the change is still reported by the next take_changes().
+    """
+    def __init__(self, jitter=0.1):
+        self.jitter = jitter
+        self.values = {}
+        self._changed = set()
+        self._sources = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def add(self, name, poll, interval, max_interval=None, initial=None):
+        """Poll `poll()` every `interval` seconds; the first poll runs right after start()."""
+        source = StatusSource(name, poll, interval, max_interval or interval * 12, initial)
+        with self._cond:
+            self._sources[name] = source
+            self.values[name] = initial
+            # Stagger the first polls too
+            self._schedule(source, random.uniform(0, interval * self.jitter))
+        return source
+
+    def start(self):
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name='arc-status', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def poll_now(self, name):
+        """Thread-safe: poll a source as soon as possible (e.g. after connecting)."""
+        with self._cond:
+            self._schedule(self._sources[name], 0)
+
+    def push(self, name, value):
+        """Thread-safe: report a value that arrived without polling (a notification)."""
+        with self._cond:
+            source = self._sources[name]
+        self._deliver(source, value)
+
+    def get(self, name, default=None):
+        with self._cond:
+            value = self.values.get(name)
+        return default if value is None else value
+
+    def take_changes(self):
+        """Names of the sources whose value changed since the last call."""
+        with self._cond:
+            changed, self._changed = self._changed, set()
+        return changed
+
+    def handle_event(self, event):
+        """True if `event` is a STATUS_CHANGED wake-up (nothing else to do with it)."""
+        return event.type == STATUS_CHANGED
+
+    def stats(self):
+        now = time.monotonic()
+        return {
+            name: {'value': s.value, 'failures': s.failures,
+                   'next_in': None if s.due is None else max(0.0, s.due - now)}
+            for name, s in self._sources.items()
+        }
+
+    def _schedule(self, source, delay):
+        source.due = time.monotonic() + delay
+        heapq.heappush(self._heap, (source.due, next(self._seq), source))
+        self._cond.notify()
+
+    def _next_delay(self, source):
+        if source.failures:
+            delay = min(source.interval * 2 ** source.failures, source.max_interval)
+        else:
+            delay = source.interval
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _deliver(self, source, value):
+        with self._cond:
+            if value == source.value:
+                return
+            source.value = value
+            self.values[source.name] = value
+            self._changed.add(source.name)
+        try:
+            pygame.event.post(pygame.event.Event(STATUS_CHANGED))
+        except pygame.error:
+            pass  # no event queue (display not initialised): nothing to wake
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running:
+                    now = time.monotonic()
+                    # Drop entries superseded by a later _schedule() of the same source
+                    while self._heap and self._heap[0][0] != self._heap[0][2].due:
+                        heapq.heappop(self._heap)
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    self._cond.wait(self._heap[0][0] - now if self._heap else None)
+                if not self._running:
+                    return
+                _, _, source = heapq.heappop(self._heap)
+                source.due = None
+            try:
+                value = source.poll()
+            except Exception as e:
+                source.failures += 1
+                log.warning("Status source %s failed (%d in a row): %s", source.name, source.failures, e)
+            else:
+                source.failures = 0
+                self._deliver(source, value)
+            with self._cond:
+                if source.due is None:
+                    self._schedule(source, self._next_delay(source))
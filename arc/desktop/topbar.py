@@ -1,47 +1,32 @@
 import pygame
-from arc.core import config
+from arc.core import config, get_font, load_icon
+import time
 from datetime import datetime
 
 class TopBar:
-    def __init__(self, wifi_menu=None, bt_menu=None, wifi_poller=None, bt_poller=None):
+    def __init__(self, wifi_menu=None, bt_menu=None, status=None):
         self.h = config.topbar.height
         self.bg = tuple(config.topbar.bg)
         self.fg = tuple(config.topbar.fg)
-        self.font = pygame.font.SysFont('Arial', 18)
+        self.font = get_font('Arial', 18)
+        self.small_font = get_font('Arial', 14)
+
+        # StatusHub with 'wifi', 'bluetooth' and 'battery' sources
+        self.status = status
 
-        self.wifi_poller = wifi_poller
-        self.bt_poller = bt_poller
         # Load left-side icons
-        self.left_icons = []
-        for path in config.topbar.icons:
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                self.left_icons.append(pygame.transform.smoothscale(img, (20, 20)))
-            except:
-                self.left_icons.append(pygame.Surface((20, 20), pygame.SRCALPHA))
+        self.left_icons = [self._load_icon(path) for path in config.topbar.icons]
 
         # WiFi icons (strength)
-        self.wifi_icons = []
-        for path in config.topbar.wifi_icons:
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                self.wifi_icons.append(pygame.transform.smoothscale(img, (20, 20)))
-            except:
-                self.wifi_icons.append(pygame.Surface((20, 20), pygame.SRCALPHA))
+        self.wifi_icons = [self._load_icon(path) for path in config.topbar.wifi_icons]
         self.wifi_rect = None
 
         # Bluetooth icons (off, on, connected)
-        self.bt_icons = []
-        for path in [
+        self.bt_icons = [self._load_icon(path) for path in [
             config.topbar.icon_bt_off,
             config.topbar.icon_bt_on,
             config.topbar.icon_bt_connected
-        ]:
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                self.bt_icons.append(pygame.transform.smoothscale(img, (20, 20)))
-            except:
-                self.bt_icons.append(pygame.Surface((20, 20), pygame.SRCALPHA))
+        ]]
         self.bt_rect = None
 
         # Store menu refs
@@ -51,16 +36,26 @@ class TopBar:
         # Other right-side icons
         self.right_icons = []
         if config.topbar.show_mobile:
-            self.right_icons.append(self._load_icon(config.topbar.icon_mobile))
+            self.right_icons.append(('mobile', self._load_icon(config.topbar.icon_mobile)))
         if config.topbar.show_battery:
-            self.right_icons.append(self._load_icon(config.topbar.icon_battery))
+            self.right_icons.append(('battery', self._load_icon(config.topbar.icon_battery)))
+        self.battery_pos = None
+
+        self._layout()
+        fmt = config.topbar.clock_format
+        self._clock_period = 1 if any(d in fmt for d in ('%S', '%T', '%X', '%r', '%c', '%s')) else 60
+        self._clock = None
+        self._clock_expires = 0.0
+        self._surface = pygame.Surface((config.screen.width, self.h))
+        if pygame.display.get_surface() is not None:
+            self._surface = self._surface.convert()
+        self._drawn = None
 
     def _load_icon(self, path):
-        try:
-            img = pygame.image.load(path).convert_alpha()
-            return pygame.transform.smoothscale(img, (20, 20))
-        except:
+        img = load_icon(path, (20, 20))
+        if img is None:
             return pygame.Surface((20, 20), pygame.SRCALPHA)
+        return img
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -75,56 +70,97 @@ class TopBar:
                 elif self.bt_menu:
                     self.bt_menu.open()
 
-    def draw(self, surface):
-        w = config.screen.width
-        h = self.h
-        pygame.draw.rect(surface, self.bg, (0, 0, w, h))
-
-        # Left icons
+    def _layout(self):
+        """Place every icon once; only the images change afterwards."""
+        w, h = config.screen.width, self.h
+        self.left_pos = []
         x = config.topbar.padding_left
         for ico in self.left_icons:
-            y = (h - ico.get_height()) // 2
-            surface.blit(ico, (x, y))
+            self.left_pos.append((x, (h - ico.get_height()) // 2))
             x += ico.get_width() + config.topbar.icon_spacing
 
-        # Clock
-        clock_surf = None
-        if config.topbar.show_clock:
-            now = datetime.now().strftime(config.topbar.clock_format)
-            clock_surf = self.font.render(now, True, self.fg)
-            cx = (w - clock_surf.get_width()) // 2
-            cy = (h - clock_surf.get_height()) // 2
-            surface.blit(clock_surf, (cx, cy))
-
-        # Notifications
-        if config.topbar.show_notifications and clock_surf:
-            dot_x = cx + clock_surf.get_width() + config.topbar.notification_spacing * 2
-            dot_y = h // 2
-            pygame.draw.circle(surface, tuple(config.topbar.notification_dot), (dot_x, dot_y), 4)
-
         # Right-side icons: WiFi, Bluetooth, then others
         rx = w - config.topbar.padding_right
-        icons = []
+        self.right_slots = []
+        if config.topbar.show_wifi and self.wifi_icons:
+            self.right_slots.append(('wifi', self.wifi_icons[0]))
+        if config.topbar.show_bt and self.bt_icons:
+            self.right_slots.append(('bt', self.bt_icons[0]))
+        self.right_slots += self.right_icons
+        self.right_pos = []
+        for name, ico in self.right_slots:
+            rx -= config.topbar.icon_spacing + ico.get_width()
+            rect = pygame.Rect(rx, (h - ico.get_height()) // 2, ico.get_width(), ico.get_height())
+            self.right_pos.append(rect.topleft)
+            if name == 'wifi':
+                self.wifi_rect = rect
+            elif name == 'bt':
+                self.bt_rect = rect
+            elif name == 'battery':
+                # Room for the charge percentage to the left of the icon
+                self.battery_pos = (rx - 2, h // 2)
+                rx -= self.small_font.size('100%')[0] + 2
+
+    def _clock_text(self):
+        """Clock text, recomputed only when its minute (or second) is over."""
+        if not config.topbar.show_clock:
+            return None
+        now = time.time()
+        if now >= self._clock_expires:
+            self._clock = datetime.now().strftime(config.topbar.clock_format)
+            self._clock_expires = (now // self._clock_period + 1) * self._clock_period
+        return self._clock
+
+    def _state(self):
+        wifi = bt = 0
+        battery = None
         if config.topbar.show_wifi and self.wifi_icons:
-            strength = self.wifi_poller.get() if self.wifi_poller else 0
-            if strength is None:
-                strength = 0
-            idx = min(len(self.wifi_icons) - 1, strength * len(self.wifi_icons) // 101)
-            icons.append(('wifi', self.wifi_icons[idx]))
+            strength = self.status.get('wifi', 0) if self.status else 0
+            wifi = min(len(self.wifi_icons) - 1, strength * len(self.wifi_icons) // 101)
         if config.topbar.show_bt and self.bt_icons:
-            bt_status = self.bt_poller.get() if self.bt_poller else 0
-            bt_status = bt_status or 0  # Make sure it's always 0, 1, or 2
-            bt_icon = self.bt_icons[min(bt_status, 2)]
-            icons.append(('bt', bt_icon))
-        for ico in self.right_icons:
-            icons.append(('other', ico))
-
-        for name, ico in icons:
-            rx -= config.topbar.icon_spacing
-            rx -= ico.get_width()
-            y = (h - ico.get_height()) // 2
-            surface.blit(ico, (rx, y))
+            bt = min(self.status.get('bluetooth', 0) if self.status else 0, 2)
+        if self.battery_pos and self.status:
+            battery = self.status.get('battery')
+        return self._clock_text(), wifi, bt, battery
+
+    def stale(self):
+        """True when the next draw() will look different from the last one."""
+        return self._state() != self._drawn
+
+    def _render(self, state):
+        clock, wifi, bt, battery = state
+        w, h = self._surface.get_size()
+        self._surface.fill(self.bg)
+
+        for ico, pos in zip(self.left_icons, self.left_pos):
+            self._surface.blit(ico, pos)
+
+        if clock is not None:
+            clock_surf = self.font.render(clock, True, self.fg)
+            cx = (w - clock_surf.get_width()) // 2
+            cy = (h - clock_surf.get_height()) // 2
+            self._surface.blit(clock_surf, (cx, cy))
+
+            if config.topbar.show_notifications:
+                dot_x = cx + clock_surf.get_width() + config.topbar.notification_spacing * 2
+                pygame.draw.circle(self._surface, tuple(config.topbar.notification_dot), (dot_x, h // 2), 4)
+
+        for (name, ico), pos in zip(self.right_slots, self.right_pos):
             if name == 'wifi':
-                self.wifi_rect = pygame.Rect(rx, y, ico.get_width(), ico.get_height())
-            if name == 'bt':
-                self.bt_rect = pygame.Rect(rx, y, ico.get_width(), ico.get_height())
+                ico = self.wifi_icons[wifi]
+            elif name == 'bt':
+                ico = self.bt_icons[bt]
+            self._surface.blit(ico, pos)
+
+        if battery is not None:
+            text = self.small_font.render(f"{battery}%", True, self.fg)
+            x, y = self.battery_pos
+            self._surface.blit(text, (x - text.get_width(), y - text.get_height() // 2))
+        self._drawn = state
+
+    def draw(self, surface):
+        # The bar is composed off-screen and only re-rendered when its state changed
+        state = self._state()
+        if state != self._drawn:
+            self._render(state)
+        surface.blit(self._surface, (0, 0))
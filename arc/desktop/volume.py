@@ -0,0 +1,206 @@
+import os
+import re
+import shutil
+import platform
+import threading
+import subprocess
+
+# Direct ALSA mixer bindings (pyalsaaudio) when installed
+try:
+    import alsaaudio
+except ImportError:
+    alsaaudio = None
+
+_PERCENT_RE = re.compile(r'\[(\d+)%\]')
+
+
+class FakeMixer:
+    """In-memory mixer for tests and machines without sound hardware."""
+    name = 'fake'
+
+    def __init__(self, level=50):
+        self.level = level
+        self.reads = 0
+        self.writes = []
+
+    def read(self):
+        self.reads += 1
+        return self.level
+
+    def write(self, level):
+        self.level = level
+        self.writes.append(level)
+
+    def close(self):
+        pass
+
+
+class AlsaMixer:
+    """ALSA mixer control through pyalsaaudio; no processes involved."""
+    name = 'alsa'
+
+    def __init__(self, control='Master'):
+        self.mixer = alsaaudio.Mixer(control)
+
+    def read(self):
+        levels = self.mixer.getvolume()
+        return int(sum(levels) / len(levels)) if levels else 0
+
+    def write(self, level):
+        self.mixer.setvolume(level)
+
+    def close(self):
+        self.mixer.close()
+
+
+class AmixerSession:
+    """
+    One long-lived `amixer -s` process: writes are lines on its stdin. The
+    level is read with a single `amixer get` at start-up (and on refresh()).
+    """
+    name = 'amixer'
+
+    def __init__(self, control='Master'):
+        self.control = control
+        self.proc = None
+
+    def _session(self):
+        if self.proc is None or self.proc.poll() is not None:
+            self.proc = subprocess.Popen(
+                ['amixer', '-q', '-s'], stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, text=True
+            )
+        return self.proc
+
+    def read(self):
+        output = subprocess.check_output(
+            ['amixer', 'get', self.control], stderr=subprocess.DEVNULL
+        ).decode()
+        m = _PERCENT_RE.search(output)
+        return int(m.group(1)) if m else 50
+
+    def write(self, level):
+        proc = self._session()
+        try:
+            proc.stdin.write(f'sset {self.control} {level}%\n')
+            proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            # amixer went away; start a new session next time
+            self.proc = None
+
+    def close(self):
+        if self.proc is not None:
+            try:
+                self.proc.stdin.close()
+                self.proc.wait(timeout=1)
+            except Exception:
+                self.proc.kill()
+            self.proc = None
+
+
+class OsascriptMixer:
+    """macOS output volume via osascript (one process per write)."""
+    name = 'osascript'
+
+    def read(self):
+        output = subprocess.check_output(
+            ["osascript", "-e", "output volume of (get volume settings)"],
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+        return int(float(output))
+
+    def write(self, level):
+        subprocess.call(["osascript", "-e", f"set volume output volume {level}"],
+                        stderr=subprocess.DEVNULL)
+
+    def close(self):
+        pass
+
+
+def default_backend():
+    """
+    Best mixer for this machine; ARC_VOLUME_BACKEND=fake|alsa|amixer|osascript
+    forces one.
+    """
+    forced = os.environ.get('ARC_VOLUME_BACKEND')
+    if forced == 'fake':
+        return FakeMixer()
+    if platform.system() == 'Darwin' or forced == 'osascript':
+        return OsascriptMixer()
+    if alsaaudio is not None and forced in (None, 'alsa'):
+        try:
+            return AlsaMixer()
+        except alsaaudio.ALSAAudioError:
+            pass
+    if shutil.which('amixer') or forced == 'amixer':
+        return AmixerSession()
+    return FakeMixer()
+
+
+class VolumeService:
+    """
+    Cached output volume. set()/step() only update the cached level; the
+    launcher calls flush() once per frame, so a burst of slider motion
+    becomes at most one mixer write per frame.
+
+    Another thread may read the hardware with sample() and hand the result
+    back through observe(); a sample taken before the last set() is stale
+    and ignored.
+    """
+    def __init__(self, backend=None):
+        self.backend = backend or default_backend()
+        self.level = 50
+        self._pending = False
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the hardware level (e.g. after another program changed it)."""
+        try:
+            with self._lock:
+                self.level = max(0, min(100, int(self.backend.read())))
+        except Exception:
+            pass
+        return self.level
+
+    def sample(self):
+        """Read the hardware level from any thread; pass the result to observe()."""
+        generation = self._generation
+        with self._lock:
+            return generation, self.backend.read()
+
+    def observe(self, sample):
+        """Adopt a sample() result unless the level was set since it was taken."""
+        generation, level = sample
+        if generation == self._generation and not self._pending and level is not None:
+            self.level = max(0, min(100, int(level)))
+        return self.level
+
+    def set(self, level):
+        level = max(0, min(100, int(level)))
+        if level != self.level:
+            self.level = level
+            self._pending = True
+            self._generation += 1
+        return self.level
+
+    def step(self, delta):
+        return self.set(self.level + delta)
+
+    def flush(self):
+        """Write the latest level if it changed since the last flush."""
+        if not self._pending:
+            return False
+        self._pending = False
+        try:
+            with self._lock:
+                self.backend.write(self.level)
+        except Exception:
+            pass
+        return True
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self.backend.close()
@@ -1,8 +1,8 @@
 import pygame
 import subprocess
 import threading
-import time
-from arc.core import config, ScrollableList, MessageBox, SearchBox
+from arc.core import config, ScrollableList, MessageBox, SearchBox, get_font, icon_atlas
+from arc.core.wifi_scan import wifi_scan_cache
 
 SCREEN_WIDTH  = config.screen.width
 SCREEN_HEIGHT = config.screen.height
@@ -13,7 +13,7 @@ FONT_NAME     = config.font.name
 FONT_SIZE     = config.font.size
 LINE_HEIGHT   = FONT_SIZE + 10
 FPS           = config.screen.fps
-SCAN_INTERVAL = 10
+SCAN_INTERVAL = 10  # seconds between scan-cache checks while the menu is open
 # Use cross-platform paths
 import os as _os
 _project_root = _os.path.dirname(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
@@ -22,11 +22,7 @@ OPEN_ICON_PATH = _os.path.join(_project_root, "arc", "assets", "icons", "wifi_un
 
 
 def load_icon(path, size):
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        return pygame.transform.smoothscale(img, size)
-    except Exception:
-        return None
+    return icon_atlas.get(path, size)
 
 class WifiMenu:
     def __init__(self, screen):
@@ -40,7 +36,7 @@ class WifiMenu:
         self.open_icon = load_icon(OPEN_ICON_PATH, ICON_SIZE)
 
         # font and timing
-        self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE)
+        self.font = get_font(FONT_NAME, FONT_SIZE)
         self.clock = pygame.time.Clock()
 
         # Wi-Fi state
@@ -76,53 +72,68 @@ class WifiMenu:
             icon_padding=10
         )
 
-        # start scanning thread
-        threading.Thread(target=self._scan_loop,
-                         daemon=True).start()
+        # Scanning only runs while the menu is open
+        self._scan_stop = None
 
     def open(self):
         self.active = True
+        # Last known networks right away; a fresh scan streams in behind them
+        cached = wifi_scan_cache.networks()
+        if cached:
+            self._show(cached)
+        if self._scan_stop is None:
+            self._scan_stop = threading.Event()
+            threading.Thread(target=self._scan_loop, args=(self._scan_stop,),
+                             daemon=True).start()
 
     def close(self):
         self.active = False
         self.password_box = None
         self.wifi_list.set_enabled(True)
+        if self._scan_stop is not None:
+            self._scan_stop.set()
+            self._scan_stop = None
 
-    def _scan_loop(self):
-        while True:
-            try:
-                subprocess.run(['nmcli','device','wifi','rescan'],
-                               check=True, stderr=subprocess.DEVNULL)
-                output = subprocess.check_output([
-                    'nmcli','-t','-f','SSID,SIGNAL,SECURITY',
-                    'device','wifi','list'
-                ], stderr=subprocess.DEVNULL).decode('utf-8', errors='ignore')
-                found, icon_list = [], []
-                for line in output.splitlines():
-                    if not line:
-                        continue
-                    ssid, signal, sec = line.split(':',2)
-                    label = f"{ssid or '<hidden>'} [{signal}%] {sec}"
-                    found.append(label)
-                    icon_list.append(
-                        self.open_icon if sec.strip().upper() in ('--','NONE','')
-                        else self.lock_icon
-                    )
-                self.networks[:] = found or ['<no networks>']
-                self.icons[:]    = icon_list or [None]
-            except Exception:
-                self.networks[:] = ['<scan failed>']
-                self.icons[:]    = [None]
-
-            # update list widget
-            self.wifi_list.items = list(self.networks)
-            self.wifi_list.icons = list(self.icons)
-            self.wifi_list.max_offset = max(
-                0,
-                len(self.wifi_list.items)*LINE_HEIGHT - self.wifi_list.rect.height
+    def _show(self, networks):
+        found, icon_list = [], []
+        for net in networks:
+            sec = net.get('security') or '--'
+            found.append(f"{net['ssid'] or '<hidden>'} [{net.get('signal') or 0}%] {sec}")
+            icon_list.append(
+                self.open_icon if sec.strip().upper() in ('--','NONE','')
+                else self.lock_icon
             )
+        self.networks[:] = found or ['<no networks>']
+        self.icons[:]    = icon_list or [None]
+
+        # update list widget
+        self.wifi_list.items = list(self.networks)
+        self.wifi_list.icons = list(self.icons)
+        self.wifi_list.max_offset = max(
+            0,
+            len(self.wifi_list.items)*LINE_HEIGHT - self.wifi_list.rect.height
+        )
+
+    def _scan_loop(self, stop):
+        def show(networks):
+            if not stop.is_set():
+                self._show(networks)
+
+        # Rescans once the shared cache is older than its TTL, until close()
+        while not stop.is_set():
+            if not wifi_scan_cache.fresh():
+                self.scan_done[0] = False
+                try:
+                    wifi_scan_cache.scan(on_result=show)
+                except Exception:
+                    self.networks[:] = ['<scan failed>']
+                    self.icons[:]    = [None]
+                    self.wifi_list.items = list(self.networks)
+                    self.wifi_list.icons = list(self.icons)
+            elif self.networks == ['<scanning...>']:
+                self._show(wifi_scan_cache.networks())
             self.scan_done[0] = True
-            time.sleep(SCAN_INTERVAL)
+            stop.wait(SCAN_INTERVAL)
 
     def _begin_connect(self, ssid, password):
         """Kick off background nmcli connect."""
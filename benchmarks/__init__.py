@@ -0,0 +1,3 @@
+"""
+Benchmarks for ARC. Run individual modules with `python -m benchmarks.<name>`.
+"""
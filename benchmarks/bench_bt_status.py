@@ -0,0 +1,144 @@
+"""
+Bluetooth status benchmark: one bluetoothctl process per query (show, devices,
+info <addr> for every device) vs answering from a long-lived session.
+
+Both run against benchmarks.fake_bluetoothctl, so only process start-up and
+parsing are measured. Also checks that the session follows a scripted
+"[CHG] ... Connected: no" notification, and feeds BluetoothStatus scripted
+[CHG]/[NEW]/[DEL] lines directly (see FEED_CASES).
+
+Usage: python -m benchmarks.bench_bt_status [--devices N] [--polls N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FAKE = [sys.executable, '-m', 'benchmarks.fake_bluetoothctl']
+
+CTRL = 'AA:BB:CC:DD:EE:FF'
+DEV = '00:00:00:00:00:01'
+PROMPT = '\x1b[0;94m[bluetooth]\x1b[0m# '
+# (label, lines fed in order, expected status afterwards, expected commands sent)
+FEED_CASES = [
+    ("powered controller", [f'Controller {CTRL} (public)', '\tPowered: yes'], 1, []),
+    ("unpowered controller", [f'Controller {CTRL} (public)', '\tPowered: no'], 0, []),
+    ("device connects", [f'Controller {CTRL} (public)', '\tPowered: yes',
+                         f'[NEW] Device {DEV} Headphones',
+                         f'[CHG] Device {DEV} Connected: yes'], 2, [f'info {DEV}']),
+    ("device disconnects", [f'Controller {CTRL} (public)', '\tPowered: yes',
+                            f'[CHG] Device {DEV} Connected: yes',
+                            f'[CHG] Device {DEV} Connected: no'], 1, []),
+    ("connected device removed", [f'Controller {CTRL} (public)', '\tPowered: yes',
+                                  f'[CHG] Device {DEV} Connected: yes',
+                                  f'[DEL] Device {DEV} Headphones'], 1, []),
+    ("controller powered off", [f'Controller {CTRL} (public)', '\tPowered: yes',
+                                f'[CHG] Device {DEV} Connected: yes',
+                                f'[CHG] Controller {CTRL} Powered: no'], 0, []),
+    ("controller removed", [f'Controller {CTRL} (public)', '\tPowered: yes',
+                            f'[DEL] Controller {CTRL} hci0'], 0, []),
+    ("new controller", [f'[NEW] Controller {CTRL} hci0'], 0, ['show']),
+    ("prompt and colour codes", [f'Controller {CTRL} (public)', '\tPowered: yes',
+                                 PROMPT + f'[CHG] Device {DEV} Connected: yes'], 2, []),
+    ("malformed address", [f'Controller {CTRL} (public)', '\tPowered: yes',
+                           '[CHG] Device not-an-address Connected: yes'], 1, []),
+]
+
+
+class FakeSession:
+    """Stands in for the bluetoothctl process: alive, and records what is sent to it."""
+    def __init__(self):
+        self.stdin = self
+        self.sent = []
+
+    def poll(self):
+        return None
+
+    def write(self, text):
+        self.sent.extend(text.split())  # commands are single words or `info <addr>`
+
+    def flush(self):
+        pass
+
+
+def check_feed(BluetoothStatus):
+    failures = []
+    for label, lines, expected, commands in FEED_CASES:
+        session = BluetoothStatus(['unused'])
+        session.proc = FakeSession()
+        for line in lines:
+            session.feed(line + '\n')
+        sent = ' '.join(session.proc.sent)
+        if session.status() != expected:
+            failures.append(f"{label}: expected status {expected}, got {session.status()}")
+        if sent != ' '.join(commands):
+            failures.append(f"{label}: expected {commands!r} sent, got {sent!r}")
+    return failures
+
+
+def per_query(options):
+    """The previous get_bt_status: returns (status, processes started)."""
+    run = lambda *cmd: subprocess.check_output(FAKE + options + list(cmd), cwd=PROJECT_ROOT, text=True)
+    spawned = 1
+    if 'Powered: yes' not in run('show'):
+        return 0, spawned
+    spawned += 1
+    for line in run('devices').splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            spawned += 1
+            if 'Connected: yes' in run('info', parts[1]):
+                return 2, spawned
+    return 1, spawned
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=15)
+    parser.add_argument("--polls", type=int, default=5)
+    args = parser.parse_args()
+    sys.path.insert(0, PROJECT_ROOT)
+    from arc.desktop.bluetooth import BluetoothStatus
+
+    failures = check_feed(BluetoothStatus)
+
+    # Nothing connected, so the per-query path walks every device
+    options = ['--devices', str(args.devices), '--connected', '0']
+
+    t = time.perf_counter()
+    for _ in range(args.polls):
+        legacy, spawned = per_query(options)
+    legacy_ms = (time.perf_counter() - t) / args.polls * 1000
+
+    events = ['--event', '0.5 [CHG] Device 00:00:00:00:00:01 Connected: no']
+    session = BluetoothStatus(FAKE + ['--devices', str(args.devices), '--connected', '1'] + events)
+    t = time.perf_counter()
+    session.start()
+    start_ms = (time.perf_counter() - t) * 1000
+    t = time.perf_counter()
+    for _ in range(args.polls):
+        status = session.status()
+    session_ms = (time.perf_counter() - t) / args.polls * 1000
+    deadline = time.monotonic() + 5
+    while session.status() != 1 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    followed = session.status() == 1
+    session.close()
+
+    print(json.dumps({
+        "devices": args.devices,
+        "per_query": {"status": legacy, "processes_per_poll": spawned, "ms_per_poll": round(legacy_ms, 2)},
+        "session": {"status": status, "processes_per_poll": 0, "ms_per_poll": round(session_ms, 4),
+                    "start_ms": round(start_ms, 1), "followed_disconnect": followed},
+        "feed_ok": not failures,
+        "failures": failures,
+    }, indent=2))
+    return 1 if failures or not followed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
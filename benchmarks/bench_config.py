@@ -0,0 +1,96 @@
+"""
+Micro-benchmark: config attribute access cost per rendered launcher frame.
+
+Compares the legacy ConfigDict (which builds new dicts on every nested access;
+kept here, arc.core no longer has it) with the frozen ConfigNode tree returned
+by load_config().
+
+Usage: python -m benchmarks.bench_config [--frames N]
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+
+from arc.core.config import load_config, thaw
+
+
+class ConfigDict(dict):
+    """The pre-ConfigNode config wrapper, as it was in arc.core.config."""
+    def __getattr__(self, name):
+        value = self.get(name)
+        if isinstance(value, dict):
+            return ConfigDict(value)
+        elif isinstance(value, list):
+            return [ConfigDict(item) if isinstance(item, dict) else item for item in value]
+        return value
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+# Config lookups done for one launcher frame: the main loop, TopBar.draw,
+# TabManager.draw and one AppIcon/Button per grid cell.
+FRAME_PATHS = (
+    [("colors", "background"), ("grid", "cols"), ("grid", "rows")]
+    + [("screen", "width"), ("topbar", "padding_left"), ("topbar", "show_clock"),
+       ("topbar", "clock_format"), ("topbar", "show_notifications"),
+       ("topbar", "notification_spacing"), ("topbar", "notification_dot"),
+       ("topbar", "padding_right"), ("topbar", "show_wifi"), ("topbar", "show_bt")]
+    + [("topbar", "icon_spacing")] * 4
+    + [("screen", "height"), ("screen", "width"), ("tab", "margin"),
+       ("indicator", "radius"), ("indicator", "spacing"),
+       ("colors", "indicator"), ("colors", "indicator_active")]
+    + [("colors", "button"), ("radius", "button"), ("colors", "text_light")] * 8
+)
+
+
+def render_frame(cfg, keep=None):
+    for i, (section, key) in enumerate(FRAME_PATHS):
+        node = getattr(cfg, section)
+        getattr(node, key)
+        if keep is not None:
+            keep[i] = node
+
+
+def count_allocations(cfg):
+    """Objects allocated by one frame's lookups (intermediates kept alive)."""
+    keep = [None] * len(FRAME_PATHS)
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    render_frame(cfg, keep)
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = end.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    stats = stats.compare_to(start, "filename")
+    return sum(s.count_diff for s in stats if s.count_diff > 0)
+
+
+def measure(cfg, frames):
+    seconds = timeit.timeit(lambda: render_frame(cfg), number=frames)
+    return {
+        "us_per_frame": seconds / frames * 1e6,
+        "ns_per_access": seconds / (frames * len(FRAME_PATHS)) * 1e9,
+        "allocs_per_frame": count_allocations(cfg),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    frozen = load_config()
+    legacy = ConfigDict(thaw(frozen))
+    result = {
+        "accesses_per_frame": len(FRAME_PATHS),
+        "before": measure(legacy, args.frames),
+        "after": measure(frozen, args.frames),
+    }
+    result["speedup"] = result["before"]["us_per_frame"] / result["after"]["us_per_frame"]
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
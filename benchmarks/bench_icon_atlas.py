@@ -0,0 +1,73 @@
+"""
+Icon loading benchmark: PNG decode + smoothscale vs the on-disk icon atlas.
+
+Loads every icon under ARC_DE/icons at the launcher cell size in a fresh
+interpreter: once decoding and resampling each PNG, once from a cold
+IconAtlas (bake + save), and once from the saved atlas.
+
+Usage: python -m benchmarks.bench_icon_atlas [--procs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = r"""
+import glob, os, sys, time
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+import pygame
+pygame.init()
+pygame.display.set_mode((480, 320))
+from arc.core.icon_atlas import IconAtlas
+paths = sorted(glob.glob('ARC_DE/icons/*.png'))
+size = (55, 55)
+t = time.perf_counter()
+if sys.argv[1] == 'decode':
+    for p in paths:
+        pygame.transform.smoothscale(pygame.image.load(p).convert_alpha(), size)
+else:
+    atlas = IconAtlas(sys.argv[2])
+    for p in paths:
+        atlas.get(p, size)
+    atlas.save()
+print(time.perf_counter() - t)
+"""
+
+
+def run(mode, atlas_path, procs):
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+    samples = []
+    for _ in range(procs):
+        if mode == 'cold' and os.path.exists(atlas_path):
+            os.unlink(atlas_path)
+        out = subprocess.check_output(
+            [sys.executable, '-c', SNIPPET, 'decode' if mode == 'decode' else 'atlas', atlas_path],
+            cwd=PROJECT_ROOT, env=env, text=True)
+        samples.append(float(out.strip().splitlines()[-1]))
+    return {"median_ms": statistics.median(samples) * 1000, "min_ms": min(samples) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--procs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        atlas_path = os.path.join(tmp, 'icons.atlas')
+        result = {
+            "decode_and_scale": run('decode', atlas_path, args.procs),
+            "atlas_cold": run('cold', atlas_path, args.procs),
+            "atlas_warm": run('warm', atlas_path, args.procs),
+        }
+    result["speedup"] = result["decode_and_scale"]["median_ms"] / result["atlas_warm"]["median_ms"]
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
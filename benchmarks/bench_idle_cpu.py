@@ -0,0 +1,99 @@
+"""
+Idle CPU benchmark: a fixed 30 fps redraw loop vs the event-driven RunLoop.
+
+Runs headless under SDL's dummy video driver with no input, drawing a full
+launcher page each frame in the ticking loop and only on invalidation in the
+RunLoop (which still wakes once a second, as the launcher does for its
+config watcher and clock). Reports CPU seconds used per wall-clock second,
+frames drawn and loop wake-ups.
+
+SDL's dummy driver has no native event wait, so SDL polls inside
+pygame.event.wait() about once a millisecond; on it the RunLoop's idle CPU
+is that polling floor, and frames/wakeups are the driver-independent
+numbers. Run under a real display to see the CPU difference.
+
+Usage: python -m benchmarks.bench_idle_cpu [--seconds N]
+"""
+
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.bench_launcher_page import build_page
+
+
+def draw_page(screen, config, icons):
+    screen.fill(config.colors.background)
+    for icon in icons:
+        icon.draw(screen)
+
+
+def measure(body, seconds):
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    frames, wakeups = body(time.perf_counter() + seconds)
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    return {"cpu_per_sec": cpu / wall, "frames": frames, "wakeups": wakeups, "wall_s": wall}
+
+
+def ticking(screen, config, icons):
+    def body(until):
+        clock = pygame.time.Clock()
+        frames = 0
+        while time.perf_counter() < until:
+            pygame.event.get()
+            draw_page(screen, config, icons)
+            pygame.display.flip()
+            clock.tick(30)
+            frames += 1
+        return frames, frames
+    return body
+
+
+def event_driven(screen, config, icons):
+    from arc.core import RunLoop
+
+    def body(until):
+        loop = RunLoop(fps=30)
+        loop.call_every(1.0, lambda: None)
+        frames = wakeups = 0
+        while time.perf_counter() < until:
+            events = loop.wait()
+            wakeups += 1
+            if events or loop.dirty:
+                draw_page(screen, config, icons)
+                pygame.display.flip()
+                frames += 1
+            loop.frame_done()
+        return frames, wakeups
+    return body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    pygame.init()
+    from arc.core import config, AppIcon
+    screen = pygame.display.set_mode((config.screen.width, config.screen.height))
+    icons = build_page(config, AppIcon)
+    for idx, icon in enumerate(icons):
+        icon.set_hovered(idx == 0)
+
+    result = {
+        "fixed_30fps": measure(ticking(screen, config, icons), args.seconds),
+        "runloop": measure(event_driven(screen, config, icons), args.seconds),
+    }
+    pygame.quit()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Launch-latency benchmark: fresh `python -m` process vs a fork from the zygote.
+
+The launched module imports pygame and arc.core, initialises pygame and opens
+a (dummy) window, as an app's start-up does, then writes a line to its
+stdout pipe. Latency is measured from the launch call to that line.
+
+Usage: python -m benchmarks.bench_launch [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROBE = "benchmarks.launch_probe"
+
+
+def wait_line(fd):
+    with os.fdopen(fd, 'rb') as f:
+        f.readline()
+
+
+def fresh(env):
+    t = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, '-m', PROBE], cwd=PROJECT_ROOT, env=env,
+                            stdout=subprocess.PIPE)
+    proc.stdout.readline()
+    elapsed = time.perf_counter() - t
+    proc.wait()
+    return elapsed
+
+
+def forked(env, socket_path):
+    from arc.core import zygote
+    r, w = os.pipe()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    t = time.perf_counter()
+    pid = zygote.spawn(PROBE, cwd=PROJECT_ROOT, env=env, stdio=(devnull, w, devnull),
+                       path=socket_path)
+    os.close(w)
+    os.close(devnull)
+    if pid is None:
+        os.close(r)
+        raise RuntimeError("zygote did not accept the launch")
+    wait_line(r)
+    return time.perf_counter() - t
+
+
+def summary(samples):
+    return {"median_ms": statistics.median(samples) * 1000, "min_ms": min(samples) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    env.pop('ARC_NO_ZYGOTE', None)
+    from arc.core import zygote
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, 'zygote.sock')
+        server = subprocess.Popen([sys.executable, '-m', 'arc.core.zygote'], cwd=PROJECT_ROOT,
+                                  env=dict(env, ARC_ZYGOTE_SOCKET=socket_path))
+        try:
+            deadline = time.monotonic() + 30
+            while not zygote.is_running(socket_path):
+                if time.monotonic() > deadline or server.poll() is not None:
+                    raise RuntimeError("zygote failed to start")
+                time.sleep(0.05)
+            result = {
+                "fresh_process": summary([fresh(env) for _ in range(args.runs)]),
+                "zygote_fork": summary([forked(env, socket_path) for _ in range(args.runs)]),
+            }
+        finally:
+            server.terminate()
+            server.wait()
+    result["speedup"] = result["fresh_process"]["median_ms"] / result["zygote_fork"]["median_ms"]
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
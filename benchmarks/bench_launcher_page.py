@@ -0,0 +1,79 @@
+"""
+Frame-time benchmark for a full launcher page, immediate vs retained AppIcons.
+
+Runs headless under SDL's dummy video driver and redraws a page of
+grid.cols x grid.rows icons (moving the selection every frame).
+
+Usage: python -m benchmarks.bench_launcher_page [--frames N]
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_page(config, AppIcon):
+    icon_paths = sorted(glob.glob(os.path.join(PROJECT_ROOT, "ARC_DE", "icons", "*.png")))
+    icons = []
+    pad = config.grid.padding + 10
+    for idx in range(config.grid.cols * config.grid.rows):
+        row, col = divmod(idx, config.grid.cols)
+        x = config.grid.x_offset + pad + col * (config.cell.width + config.grid.margin)
+        y = config.grid.y_offset + config.topbar.height + pad + row * (config.cell.height + config.grid.margin)
+        path = icon_paths[idx % len(icon_paths)] if icon_paths else ""
+        icons.append(AppIcon(f"App {idx}", path, (x, y, config.cell.width, config.cell.height),
+                             lambda: None))
+    return icons
+
+
+def run(screen, config, icons, frames):
+    samples = []
+    for frame in range(frames):
+        t = time.perf_counter()
+        screen.fill(config.colors.background)
+        for idx, icon in enumerate(icons):
+            icon.hovered = idx == frame % len(icons)
+            icon.draw(screen)
+        samples.append(time.perf_counter() - t)
+    samples.sort()
+    return {
+        "fps": len(samples) / sum(samples),
+        "p50_ms": statistics.median(samples) * 1000,
+        "p99_ms": samples[int(len(samples) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    pygame.init()
+    from arc.core import config, AppIcon
+    screen = pygame.display.set_mode((config.screen.width, config.screen.height))
+    icons = build_page(config, AppIcon)
+
+    AppIcon.RETAINED = False
+    immediate = run(screen, config, icons, args.frames)
+    AppIcon.RETAINED = True
+    retained = run(screen, config, icons, args.frames)
+    print(json.dumps({
+        "icons": len(icons),
+        "immediate": immediate,
+        "retained": retained,
+        "speedup_p50": immediate["p50_ms"] / retained["p50_ms"],
+    }, indent=2))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Startup benchmark: time to a loaded config, with and without the parsed-config cache.
+
+Measures load_config() in-process and `import arc.core.config` in a fresh
+interpreter (which also pays for importing yaml on a cache miss).
+
+Usage: python -m benchmarks.bench_startup [--runs N] [--procs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from arc.core.config import load_config
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Import the config module without going through arc.core (which pulls in pygame)
+IMPORT_SNIPPET = (
+    "import importlib.util, sys, time; t = time.perf_counter(); "
+    "spec = importlib.util.spec_from_file_location('arc_config', 'arc/core/config.py'); "
+    "mod = importlib.util.module_from_spec(spec); spec.loader.exec_module(mod); "
+    "print(time.perf_counter() - t)"
+)
+
+
+def time_load(runs, use_cache):
+    samples = []
+    for _ in range(runs):
+        t = time.perf_counter()
+        load_config(use_cache=use_cache)
+        samples.append(time.perf_counter() - t)
+    return samples
+
+
+def time_import(procs, use_cache):
+    env = dict(os.environ)
+    env.pop('ARC_NO_CONFIG_CACHE', None)
+    if not use_cache:
+        env['ARC_NO_CONFIG_CACHE'] = '1'
+    samples = []
+    for _ in range(procs):
+        out = subprocess.check_output([sys.executable, '-c', IMPORT_SNIPPET],
+                                      cwd=PROJECT_ROOT, env=env, text=True)
+        samples.append(float(out.strip().splitlines()[-1]))
+    return samples
+
+
+def summary(samples):
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--procs", type=int, default=10)
+    args = parser.parse_args()
+
+    load_config()  # make sure the snapshot exists
+    result = {
+        "load_config": {
+            "yaml": summary(time_load(args.runs, use_cache=False)),
+            "cached": summary(time_load(args.runs, use_cache=True)),
+        },
+        "fresh_process_import": {
+            "yaml": summary(time_import(args.procs, use_cache=False)),
+            "cached": summary(time_import(args.procs, use_cache=True)),
+        },
+    }
+    for section in result.values():
+        section["speedup"] = section["yaml"]["median_ms"] / section["cached"]["median_ms"]
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
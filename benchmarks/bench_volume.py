@@ -0,0 +1,127 @@
+"""
+Volume benchmark: one `amixer sset` process per change vs writing to a
+long-lived `amixer -s` session, both against a scripted amixer on PATH.
+
+Also checks the lines AmixerSession writes and reads back, that
+VolumeService turns a burst of set() calls into one write per flush(), and
+that observe() ignores a sample() taken before the last set().
+
+Usage: python -m benchmarks.bench_volume [--changes N]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Appends every write it receives to $FAKE_AMIXER_LOG, one line each
+FAKE_AMIXER = """#!/bin/sh
+case "$1" in
+get) echo "Simple mixer control 'Master',0"
+     echo "  Front Left: Playback 27 [42%] [on]" ;;
+sset) echo "$*" >> "$FAKE_AMIXER_LOG" ;;
+*) cat >> "$FAKE_AMIXER_LOG" ;;
+esac
+"""
+
+
+def read_log(path):
+    try:
+        with open(path) as f:
+            return f.read().splitlines()
+    except FileNotFoundError:
+        return []
+
+
+def check_amixer(volume, log):
+    failures = []
+    session = volume.AmixerSession()
+    if session.read() != 42:
+        failures.append(f"read: expected 42, got {session.read()}")
+    for level in (10, 55, 100):
+        session.write(level)
+    session.close()
+    lines = read_log(log)
+    expected = ['sset Master 10%', 'sset Master 55%', 'sset Master 100%']
+    if lines != expected:
+        failures.append(f"session writes: expected {expected}, got {lines}")
+    return failures
+
+
+def check_service(volume):
+    failures = []
+    mixer = volume.FakeMixer(level=50)
+    service = volume.VolumeService(mixer)
+    for level in range(51, 71):
+        service.set(level)
+    service.flush()
+    service.flush()
+    if mixer.writes != [70]:
+        failures.append(f"coalescing: expected one write of 70, got {mixer.writes}")
+
+    stale = service.sample()
+    service.set(20)
+    service.flush()
+    if service.observe(stale) != 20:
+        failures.append(f"stale sample adopted: level {service.level}, expected 20")
+    mixer.level = 35  # changed by another program
+    if service.observe(service.sample()) != 35:
+        failures.append(f"fresh sample ignored: level {service.level}, expected 35")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--changes", type=int, default=50)
+    args = parser.parse_args()
+    sys.path.insert(0, PROJECT_ROOT)
+    from arc.desktop import volume
+
+    root = tempfile.mkdtemp()
+    saved_path = os.environ.get("PATH", "")
+    try:
+        amixer = os.path.join(root, "amixer")
+        with open(amixer, "w") as f:
+            f.write(FAKE_AMIXER)
+        os.chmod(amixer, 0o755)
+        os.environ["PATH"] = root + os.pathsep + saved_path
+        os.environ["FAKE_AMIXER_LOG"] = log = os.path.join(root, "writes.log")
+
+        failures = check_amixer(volume, log) + check_service(volume)
+
+        os.remove(log)
+        t = time.perf_counter()
+        for i in range(args.changes):
+            subprocess.call(["amixer", "sset", "Master", f"{i % 101}%"], stdout=subprocess.DEVNULL)
+        per_process_ms = (time.perf_counter() - t) / args.changes * 1000
+
+        session = volume.AmixerSession()
+        t = time.perf_counter()
+        for i in range(args.changes):
+            session.write(i % 101)
+        session_ms = (time.perf_counter() - t) / args.changes * 1000
+        session.close()
+        if len(read_log(log)) != 2 * args.changes:
+            failures.append(f"expected {2 * args.changes} logged writes, got {len(read_log(log))}")
+    finally:
+        os.environ["PATH"] = saved_path
+        os.environ.pop("FAKE_AMIXER_LOG", None)
+        shutil.rmtree(root)
+
+    print(json.dumps({
+        "checks_ok": not failures,
+        "failures": failures,
+        "per_process_ms_per_change": round(per_process_ms, 3),
+        "session_ms_per_change": round(session_ms, 4),
+    }, indent=2))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Wi-Fi signal benchmark: parsing /proc/net/wireless vs running nmcli.
+
+Checks parse_proc_wireless against the fixtures in
+benchmarks/fixtures/proc_net_wireless and a fake /sys/class/net tree, checks
+that get_wifi_strength() falls back proc -> sysfs -> nmcli (with a scripted
+nmcli on PATH), then times reading + parsing a fixture file against one
+`nmcli device wifi list` (skipped when nmcli is not installed). Runs on any
+Linux box.
+
+Usage: python -m benchmarks.bench_wifi_status [--runs N]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(PROJECT_ROOT, "benchmarks", "fixtures", "proc_net_wireless")
+
+# fixture -> expected get_wifi_strength() value (None: try the next provider)
+EXPECTED = {
+    "connected.txt": 80,
+    "disconnected.txt": 0,
+    "no_interfaces.txt": None,
+    "unsigned_level.txt": 48,
+    "two_interfaces.txt": 100,
+}
+
+
+def fake_sysfs(root, interfaces):
+    for name, (wireless, state) in interfaces.items():
+        os.makedirs(os.path.join(root, name, "wireless" if wireless else ""), exist_ok=True)
+        with open(os.path.join(root, name, "operstate"), "w") as f:
+            f.write(state + "\n")
+
+
+FAKE_NMCLI = """#!/bin/sh
+printf 'no:40\\nyes:63\\n'
+"""
+# label -> (proc fixture, sysfs interfaces, expected strength, providers that ran)
+FALLBACK_CASES = {
+    "proc answers": ("connected.txt", {"wlan0": (True, "up")}, 80,
+                     ["proc_wifi_strength"]),
+    "sysfs: nothing up": ("no_interfaces.txt", {"wlan0": (True, "down")}, 0,
+                          ["proc_wifi_strength", "sysfs_wifi_strength"]),
+    "nmcli last": ("missing.txt", {"wlan0": (True, "up")}, 63,
+                   ["proc_wifi_strength", "sysfs_wifi_strength", "nmcli_wifi_strength"]),
+}
+
+
+def check_fallback(status):
+    failures = []
+    saved_providers, saved_path = status.WIFI_PROVIDERS, os.environ.get("PATH", "")
+    root = tempfile.mkdtemp()
+    try:
+        nmcli = os.path.join(root, "bin", "nmcli")
+        os.makedirs(os.path.dirname(nmcli))
+        with open(nmcli, "w") as f:
+            f.write(FAKE_NMCLI)
+        os.chmod(nmcli, 0o755)
+        os.environ["PATH"] = os.path.dirname(nmcli) + os.pathsep + saved_path
+        for label, (fixture, interfaces, expected, order) in FALLBACK_CASES.items():
+            sysfs = os.path.join(root, label.replace(" ", "_").replace(":", ""))
+            fake_sysfs(sysfs, interfaces)
+            args = {"proc_wifi_strength": (os.path.join(FIXTURES, fixture),),
+                    "sysfs_wifi_strength": (sysfs,), "nmcli_wifi_strength": ()}
+            calls = []
+
+            def recorded(provider):
+                def run():
+                    calls.append(provider.__name__)
+                    return provider(*args[provider.__name__])
+                return run
+            status.WIFI_PROVIDERS = tuple(recorded(p) for p in saved_providers)
+            got = status.get_wifi_strength()
+            if got != expected or calls != order:
+                failures.append(f"fallback {label}: expected {expected} via {order}, "
+                                f"got {got} via {calls}")
+    finally:
+        status.WIFI_PROVIDERS = saved_providers
+        os.environ["PATH"] = saved_path
+        shutil.rmtree(root)
+    return failures
+
+
+def check(status):
+    failures = []
+    for name, expected in EXPECTED.items():
+        got = status.proc_wifi_strength(os.path.join(FIXTURES, name))
+        if got != expected:
+            failures.append(f"{name}: expected {expected}, got {got}")
+    if status.proc_wifi_strength(os.path.join(FIXTURES, "missing.txt")) is not None:
+        failures.append("missing file should give None")
+
+    cases = {
+        "no wireless": ({"eth0": (False, "up")}, 0),
+        "wireless down": ({"eth0": (False, "up"), "wlan0": (True, "down")}, 0),
+        "wireless up": ({"wlan0": (True, "up")}, None),
+    }
+    for label, (interfaces, expected) in cases.items():
+        root = tempfile.mkdtemp()
+        try:
+            fake_sysfs(root, interfaces)
+            got = status.sysfs_wifi_strength(root)
+        finally:
+            shutil.rmtree(root)
+        if got != expected:
+            failures.append(f"sysfs {label}: expected {expected}, got {got}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+    sys.path.insert(0, PROJECT_ROOT)
+    from arc.desktop import arc_status
+
+    failures = check(arc_status) + check_fallback(arc_status)
+    path = os.path.join(FIXTURES, "connected.txt")
+    t = time.perf_counter()
+    for _ in range(args.runs):
+        arc_status.proc_wifi_strength(path)
+    proc_us = (time.perf_counter() - t) / args.runs * 1e6
+
+    nmcli_ms = None
+    if shutil.which("nmcli"):
+        runs = 5
+        t = time.perf_counter()
+        for _ in range(runs):
+            arc_status.nmcli_wifi_strength()
+        nmcli_ms = (time.perf_counter() - t) / runs * 1000
+
+    print(json.dumps({
+        "fixtures_ok": not failures,
+        "failures": failures,
+        "proc_us_per_read": round(proc_us, 2),
+        "nmcli_ms_per_call": None if nmcli_ms is None else round(nmcli_ms, 1),
+    }, indent=2))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Scripted stand-in for `bluetoothctl`, for exercising arc.desktop.bluetooth
+without a Bluetooth stack:
+
+    ARC_BLUETOOTHCTL="python -m benchmarks.fake_bluetoothctl --devices 15 --connected 1"
+
+Answers `show`, `devices`, `info <addr>` and `quit` the way bluetoothctl does
+(prompts and colour codes included). Each `--event "DELAY LINE"` prints LINE,
+e.g. "[CHG] Device 00:00:00:00:00:01 Connected: no", DELAY seconds after
+start. One-shot mode (`python -m benchmarks.fake_bluetoothctl info <addr>`)
+answers a single command and exits.
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+CONTROLLER = "00:1A:7D:DA:71:13"
+PROMPT = "\x1b[0;94m[bluetooth]\x1b[0m# "
+_lock = threading.Lock()
+
+
+def address(i):
+    return "00:00:00:00:00:%02X" % (i + 1)
+
+
+def out(text):
+    with _lock:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def answer(command, args):
+    words = command.split()
+    if not words:
+        return ""
+    if words[0] == "show":
+        return (f"Controller {CONTROLLER} (public)\n\tName: fake\n"
+                f"\tPowered: {'yes' if args.powered else 'no'}\n\tDiscoverable: no\n")
+    if words[0] == "devices":
+        return "".join(f"Device {address(i)} Device {i}\n" for i in range(args.devices))
+    if words[0] == "info" and len(words) > 1:
+        index = int(words[1].rsplit(":", 1)[1], 16) - 1
+        connected = "yes" if args.powered and index < args.connected else "no"
+        return (f"Device {words[1]} (public)\n\tName: Device {index}\n\tPaired: yes\n"
+                f"\tConnected: {connected}\n\tUUID: Audio Sink (0000110b-0000-1000-8000-00805f9b34fb)\n")
+    return f"Invalid command {words[0]}\n"
+
+
+def replay(events):
+    start = time.monotonic()
+    for delay, line in sorted(events):
+        time.sleep(max(0.0, start + delay - time.monotonic()))
+        out(f"\r{line}\n{PROMPT}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake bluetoothctl")
+    parser.add_argument("--devices", type=int, default=3)
+    parser.add_argument("--connected", type=int, default=0)
+    parser.add_argument("--off", dest="powered", action="store_false")
+    parser.add_argument("--event", action="append", default=[],
+                        help='"DELAY LINE" printed DELAY seconds after start')
+    parser.add_argument("command", nargs="*")
+    args = parser.parse_args()
+
+    if args.command:
+        out(answer(" ".join(args.command), args))
+        return
+
+    events = [(float(e.split(None, 1)[0]), e.split(None, 1)[1]) for e in args.event]
+    threading.Thread(target=replay, args=(events,), daemon=True).start()
+    out(f"Agent registered\n{PROMPT}")
+    for line in sys.stdin:
+        if line.strip() == "quit":
+            break
+        out(answer(line, args) + PROMPT)
+
+
+if __name__ == "__main__":
+    main()
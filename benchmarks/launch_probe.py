@@ -0,0 +1,21 @@
+"""
+Minimal app used by bench_launch: start up like an ARC app, then report on stdout.
+"""
+
+import sys
+
+import pygame
+from arc.core import config
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((config.screen.width, config.screen.height))
+    pygame.display.flip()
+    sys.stdout.write("ready\n")
+    sys.stdout.flush()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+Headless UI rendering benchmarks.
+
+Every scenario builds a widget or screen, feeds it scripted events and draws
+it for N frames under SDL's dummy video driver, so rendering cost can be
+measured (and compared between boards or commits) without a display.
+
+Usage: python -m benchmarks.ui [--frames N] [--only NAME ...] [--output FILE]
+"""
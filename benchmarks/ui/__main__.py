@@ -0,0 +1,69 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from benchmarks.ui import __doc__ as package_doc
+from benchmarks.ui.runner import run_frames, count_allocations
+from benchmarks.ui.scenarios import SCENARIOS
+
+
+def run_scenario(cls, screen, frames, alloc_frames):
+    scenario = cls()
+    try:
+        scenario.setup(screen)
+    except ImportError as e:
+        return {"skipped": f"missing dependency: {e}"}
+    # Warm up caches so the timed run measures steady-state frames
+    run_frames(scenario, screen, min(frames, 10))
+    result = run_frames(scenario, screen, frames)
+    result.update(count_allocations(scenario, screen, alloc_frames))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=package_doc.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--alloc-frames", type=int, default=30)
+    parser.add_argument("--only", nargs="*", metavar="NAME",
+                        help="scenario names: " + ", ".join(s.name for s in SCENARIOS))
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    pygame.init()
+    from arc.core import config
+    screen = pygame.display.set_mode((config.screen.width, config.screen.height))
+
+    report = {
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "video_driver": pygame.display.get_driver(),
+        "scenarios": {},
+    }
+    for cls in SCENARIOS:
+        if args.only and cls.name not in args.only:
+            continue
+        # Widgets print debug output; keep stdout clean for the JSON report
+        with contextlib.redirect_stdout(sys.stderr):
+            report["scenarios"][cls.name] = run_scenario(cls, screen, args.frames,
+                                                         args.alloc_frames)
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
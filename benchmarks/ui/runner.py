@@ -0,0 +1,66 @@
+"""
+Frame loop, timing and allocation accounting for the UI scenarios.
+"""
+
+import statistics
+import time
+import tracemalloc
+
+import pygame
+
+
+def percentile(sorted_samples, pct):
+    idx = max(0, min(len(sorted_samples) - 1, int(round(pct / 100 * len(sorted_samples))) - 1))
+    return sorted_samples[idx]
+
+
+def run_frames(scenario, screen, frames):
+    """Time `frames` frames: scripted events, update, draw and flip."""
+    samples = []
+    for frame in range(frames):
+        t = time.perf_counter()
+        for ev in scenario.events(frame):
+            scenario.handle_event(ev)
+        scenario.update()
+        scenario.draw(screen)
+        pygame.display.flip()
+        samples.append(time.perf_counter() - t)
+    samples.sort()
+    return {
+        "frames": frames,
+        "fps": frames / sum(samples),
+        "p50_ms": statistics.median(samples) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": samples[-1] * 1000,
+    }
+
+
+def count_allocations(scenario, screen, frames):
+    """
+    Per-frame allocation figures under tracemalloc (run separately from the
+    timed loop, since tracing slows everything down):
+      new_blocks_per_frame -- memory blocks still alive after the frame
+      peak_kb_per_frame    -- transient memory high-water mark within a frame
+    """
+    tracemalloc.start()
+    new_blocks = 0
+    peak = 0
+    start = tracemalloc.take_snapshot()
+    for frame in range(frames):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for ev in scenario.events(frame):
+            scenario.handle_event(ev)
+        scenario.update()
+        scenario.draw(screen)
+        pygame.display.flip()
+        peak += tracemalloc.get_traced_memory()[1] - current
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = end.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    for stat in stats.compare_to(start, "filename"):
+        new_blocks += max(0, stat.count_diff)
+    return {
+        "new_blocks_per_frame": new_blocks / frames,
+        "peak_kb_per_frame": peak / frames / 1024,
+    }
@@ -0,0 +1,293 @@
+"""
+Scripted UI scenarios. Each one builds its widget(s) in setup() and returns
+the events to inject for a given frame number from events().
+"""
+
+import os
+
+import pygame
+
+from benchmarks.bench_launcher_page import build_page
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def key(k, unicode=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=k, mod=0, unicode=unicode)
+
+
+def motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+def button(pos, btn=1, up=False):
+    kind = pygame.MOUSEBUTTONUP if up else pygame.MOUSEBUTTONDOWN
+    return pygame.event.Event(kind, pos=pos, button=btn)
+
+
+class Scenario:
+    name = None
+    # Fill the screen before drawing, as the app loops do
+    clear = True
+
+    def setup(self, screen):
+        pass
+
+    def events(self, frame):
+        return ()
+
+    def handle_event(self, ev):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, screen):
+        if self.clear:
+            from arc.core import config
+            screen.fill(config.colors.background)
+        self.render(screen)
+
+    def render(self, screen):
+        raise NotImplementedError
+
+
+class WidgetScenario(Scenario):
+    """Drives a single arc.core.ui_elements widget."""
+    def setup(self, screen):
+        self.widget = self.build()
+
+    def handle_event(self, ev):
+        self.widget.handle_event(ev)
+
+    def update(self):
+        if hasattr(self.widget, "update"):
+            self.widget.update()
+
+    def render(self, screen):
+        self.widget.draw(screen)
+
+
+class ButtonScenario(WidgetScenario):
+    name = "button"
+
+    def build(self):
+        from arc.core import Button
+        return Button("Connect", (180, 140, 120, 40), lambda: None)
+
+    def events(self, frame):
+        return (motion((200, 150) if frame % 2 else (10, 10)),)
+
+
+class WarningMessageScenario(WidgetScenario):
+    name = "warning_message"
+
+    def build(self):
+        from arc.core import WarningMessage
+        widget = WarningMessage("Connection failed")
+        widget.show()
+        return widget
+
+    def update(self):
+        # Keep it on screen for the whole run
+        self.widget.visible = True
+
+
+class TabManagerScenario(WidgetScenario):
+    name = "tab_manager"
+
+    def build(self):
+        from arc.core import TabManager
+        return TabManager([f"Page {i + 1}" for i in range(6)])
+
+    def events(self, frame):
+        return (button((50, 50), btn=4 if frame % 2 else 5),)
+
+
+class MessageBoxScenario(WidgetScenario):
+    name = "message_box"
+
+    def build(self):
+        from arc.core import MessageBox
+        widget = MessageBox("Forget this network?", lambda: None, lambda: None)
+        widget.show()
+        return widget
+
+    def events(self, frame):
+        btn = self.widget.btn_yes if frame % 2 else self.widget.btn_no
+        return (motion(btn.rect.center),)
+
+
+class SearchBoxScenario(WidgetScenario):
+    name = "search_box"
+
+    def build(self):
+        from arc.core import SearchBox
+        widget = SearchBox((40, 140, 400, 40), placeholder="Enter Wi-Fi password")
+        widget.active = True
+        return widget
+
+    def events(self, frame):
+        if frame % 20 == 19:
+            return (key(pygame.K_BACKSPACE),) * 10
+        return (key(pygame.K_a, "abcdefghij"[frame % 10]),)
+
+
+class AppIconScenario(WidgetScenario):
+    name = "app_icon"
+
+    def build(self):
+        from arc.core import AppIcon
+        return AppIcon("Music", os.path.join(PROJECT_ROOT, "ARC_DE", "icons", "music.png"),
+                       (195, 115, 90, 90), lambda: None)
+
+    def update(self):
+        pass
+
+    def events(self, frame):
+        return (motion((240, 160) if frame % 2 else (10, 10)),)
+
+
+class SliderScenario(WidgetScenario):
+    name = "slider"
+
+    def build(self):
+        from arc.core import Slider
+        return Slider((90, 156, 300, 8), 0, 100, 50)
+
+    def events(self, frame):
+        if frame == 0:
+            return (button(self.widget.knob_rect.center),)
+        return (motion((90 + (frame * 7) % 300, 160)),)
+
+
+class ScrollableListScenario(WidgetScenario):
+    name = "scrollable_list"
+
+    def build(self):
+        from arc.core import ScrollableList, get_font
+        icon = pygame.Surface((64, 64), pygame.SRCALPHA)
+        icon.fill((100, 100, 100))
+        items = [f"Network {i} [{i % 100}%] WPA2" for i in range(300)]
+        return ScrollableList(items, (10, 30, 460, 280), get_font(), 30,
+                              (5, 5, 5), (250, 250, 250), (204, 99, 36),
+                              icons=[icon] * len(items))
+
+    def events(self, frame):
+        return (key(pygame.K_UP if (frame // 150) % 2 else pygame.K_DOWN),)
+
+
+class LauncherPageScenario(Scenario):
+    name = "launcher_page"
+
+    def setup(self, screen):
+        from arc.core import config, AppIcon, TabManager
+        self.icons = build_page(config, AppIcon)
+        self.tabs = TabManager(["Page 1", "Page 2", "Page 3"])
+        self.sel = 0
+
+    def events(self, frame):
+        return (key(pygame.K_RIGHT),)
+
+    def handle_event(self, ev):
+        self.sel = (self.sel + 1) % len(self.icons)
+
+    def render(self, screen):
+        self.tabs.draw(screen)
+        for idx, icon in enumerate(self.icons):
+            icon.hovered = idx == self.sel
+            icon.draw(screen)
+
+
+class _FakeStatus:
+    """Stands in for StatusHub: cycles each source through fixed values."""
+    def __init__(self, **values):
+        self.values = values
+        self.frame = 0
+
+    def get(self, name, default=None):
+        values = self.values.get(name)
+        return values[self.frame % len(values)] if values else default
+
+
+class TopBarScenario(Scenario):
+    name = "topbar"
+
+    def setup(self, screen):
+        from arc.desktop.topbar import TopBar
+        self.status = _FakeStatus(wifi=[0, 30, 60, 90], bluetooth=[0, 1, 2], battery=[100, 99, 98])
+        self.bar = TopBar(status=self.status)
+
+    def events(self, frame):
+        # Status changes every 30 frames (about once a second at 30 fps)
+        self.status.frame = frame // 30
+        return ()
+
+    def render(self, screen):
+        self.bar.draw(screen)
+
+
+def _tracks(count):
+    return [{
+        "title": f"Track {i} - a title long enough to need horizontal scrolling",
+        "file": os.path.join(PROJECT_ROOT, "missing", f"track{i}.mp3"),
+        "length": 180 + i,
+        "album": f"Album {i % 10}",
+        "artist": f"Artist {i % 7}",
+    } for i in range(count)]
+
+
+def _music_theme():
+    font_dir = os.path.join(PROJECT_ROOT, "assets", "fonts", "Inter")
+    fonts = (
+        pygame.font.Font(os.path.join(font_dir, "Inter_28pt-SemiBold.ttf"), 28),
+        pygame.font.Font(os.path.join(font_dir, "Inter_24pt-Regular.ttf"), 22),
+        pygame.font.Font(os.path.join(font_dir, "Inter_18pt-Regular.ttf"), 16),
+    )
+    colors = ((250, 250, 250), (240, 240, 240), (5, 5, 5), (204, 99, 36),
+              (200, 200, 200), (200, 200, 200))
+    return fonts, colors
+
+
+class SongSelectorScenario(Scenario):
+    name = "song_selector"
+
+    def setup(self, screen):
+        from arc.apps.music_player.song_selector import SongSelector
+        fonts, colors = _music_theme()
+        self.songs = SongSelector(None, fonts, colors, screen, tracks=_tracks(400))
+
+    def events(self, frame):
+        return (key(pygame.K_UP if (frame // 200) % 2 else pygame.K_DOWN),)
+
+    def handle_event(self, ev):
+        self.songs.handle_event(ev)
+
+    def update(self):
+        self.songs.update()
+
+    def render(self, screen):
+        self.songs.draw()
+
+
+class PlayerScreenScenario(Scenario):
+    name = "player_screen"
+    clear = False  # PlayerScreen.draw fills the screen itself
+
+    def setup(self, screen):
+        from arc.apps.music_player.player import PlayerScreen
+        fonts, colors = _music_theme()
+        self.player = PlayerScreen(_tracks(3), 0, fonts, colors, screen)
+
+    def update(self):
+        self.player.update()
+
+    def render(self, screen):
+        self.player.draw()
+
+
+SCENARIOS = [
+    ButtonScenario, WarningMessageScenario, TabManagerScenario, MessageBoxScenario,
+    SearchBoxScenario, AppIconScenario, SliderScenario, ScrollableListScenario,
+    LauncherPageScenario, TopBarScenario, SongSelectorScenario, PlayerScreenScenario,
+]